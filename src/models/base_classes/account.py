@@ -1,3 +1,4 @@
+import sys
 from abc import ABC, abstractmethod
 from datetime import date
 from typing import TYPE_CHECKING
@@ -22,12 +23,18 @@ class Account(CopyableMixin, NameMixin, UUIDMixin, BalanceMixin, ABC):
     __slots__ = ()
 
     def __init__(self, name: str, parent: AccountGroup | None = None) -> None:
+        self._path: str | None = None
         super().__init__(name=name, allow_slash=False)
         self.parent = parent
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.path})"
 
+    @NameMixin.name.setter
+    def name(self, name: str) -> None:
+        NameMixin.name.fset(self, name)
+        self._invalidate_path()
+
     @property
     def parent(self) -> AccountGroup | None:
         return self._parent
@@ -50,12 +57,20 @@ class Account(CopyableMixin, NameMixin, UUIDMixin, BalanceMixin, ABC):
             parent._add_child(self)  # noqa: SLF001
 
         self._parent = parent
+        self._invalidate_path()
 
     @property
     def path(self) -> str:
-        if self._parent is None:
-            return self._name
-        return self._parent.path + "/" + self._name
+        if self._path is None:
+            self._path = sys.intern(
+                self._name
+                if self._parent is None
+                else self._parent.path + "/" + self._name
+            )
+        return self._path
+
+    def _invalidate_path(self) -> None:
+        self._path = None
 
     @property
     @abstractmethod
@@ -67,6 +82,15 @@ class Account(CopyableMixin, NameMixin, UUIDMixin, BalanceMixin, ABC):
     def transactions(self) -> tuple["Transaction", ...]:
         raise NotImplementedError
 
+    def is_datetime_taken(self, transaction: "Transaction") -> bool:  # noqa: ARG002
+        """Returns True if another Transaction of this Account has the same
+        datetime as the given one."""
+        return False
+
+    def move_transaction(self, transaction: "Transaction") -> None:
+        """Moves the entry of the given Transaction to its current datetime,
+        if this Account already holds one."""
+
     @abstractmethod
     def get_balance(self, currency: Currency, date_: date | None = None) -> CashAmount:
         """Returns latest balance, or the latest balance for the specified date."""
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Collection
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from src.models.custom_exceptions import NotFoundError
@@ -89,6 +89,23 @@ class Transaction(CopyableMixin, DatetimeCreatedMixin, UUIDMixin, ABC):
         self._datetime = datetime_
         self._timestamp = datetime_.timestamp()
 
+    def settle_datetime(self) -> None:
+        """Moves the datetime forward by whole seconds until no related Account
+        holds another Transaction with the same datetime. Accounts which already
+        hold this Transaction then move its entry to the new datetime."""
+
+        accounts = self.accounts
+        moved = False
+        while any(account.is_datetime_taken(self) for account in accounts):
+            self.set_attributes(
+                datetime_=self._datetime + timedelta(seconds=1),
+                block_account_update=True,
+            )
+            moved = True
+        if moved:
+            for account in accounts:
+                account.move_transaction(self)
+
     def add_tags(self, tags: Collection[Attribute]) -> None:
         self._validate_tags(tags)
         self._tags = self._tags.union(tags)
@@ -122,6 +139,11 @@ class Transaction(CopyableMixin, DatetimeCreatedMixin, UUIDMixin, ABC):
                 "Parameter 'tags' must contain only Attributes with type_=TAG."
             )
 
+    @property
+    @abstractmethod
+    def accounts(self) -> frozenset["Account"]:
+        raise NotImplementedError
+
     @abstractmethod
     def is_account_related(self, account: "Account") -> bool:
         raise NotImplementedError
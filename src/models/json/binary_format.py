@@ -0,0 +1,723 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from datetime import UTC, date, datetime, timedelta, timezone
+from decimal import Decimal
+from itertools import pairwise
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+from uuid import UUID
+
+from src.models.json.custom_json_decoder import CustomJSONDecoder
+from src.models.json.custom_json_encoder import CustomJSONEncoder
+
+# Binary equivalent of the JSON data file. The file starts with a header and a table
+# of sections, each section is aligned to 8 bytes so it can be read directly from
+# a memory map:
+#   header:   magic (8 bytes), format version (u32), number of sections (u32)
+#   table:    per section: name (16 bytes), offset (u64), length (u64)
+#   sections: "header" - UTF-8 JSON of the data without the table sections
+#             "strings" - string count (u32), offsets (u32 * count+1), UTF-8 blob
+#             table sections - list of dicts encoded as typed columns
+# Table sections hold the bulk of the data. Their items are grouped by key sets
+# (e.g. Transaction types), each key of a group is one column. Columns use the most
+# compact encoding which reproduces the values exactly, e.g. timestamps, UUIDs,
+# scaled integer amounts, packed price histories or indices into the string table.
+# Price and rate histories are decoded lazily from the memory map.
+
+BINARY_FILE_SUFFIX = ".kpb"
+
+_MAGIC = b"KAPYTAL\x00"
+_FORMAT_VERSION = 1
+_FILE_HEADER = struct.Struct("<8sII")
+_SECTION_ENTRY = struct.Struct("<16sQQ")
+_ALIGNMENT = 8
+_TABLE_SECTIONS = ("exchange_rates", "securities", "transactions")
+_BIG_ENDIAN = sys.byteorder == "big"
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_JSON_DECODER = CustomJSONDecoder()
+
+
+class BinaryFormatError(ValueError):
+    """Raised when a file is not a valid binary data file."""
+
+
+class PackedPairs(Sequence[list[str]]):
+    """Date-value pairs of a price or rate history, decoded from the memory map
+    only when accessed."""
+
+    __slots__ = ("_column", "_row")
+
+    def __init__(self, column: "_PairsColumn", row: int) -> None:
+        self._column = column
+        self._row = row
+
+    def __len__(self) -> int:
+        return self._column.row_length(self._row)
+
+    def __getitem__(self, index: int) -> list[str]:  # type: ignore[override]
+        return self._column.decode_row(self._row)[index]
+
+    def __iter__(self) -> Iterator[list[str]]:
+        return iter(self._column.decode_row(self._row))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PackedPairs):
+            other = list(other)
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return self._column.decode_row(self._row) == [list(pair) for pair in other]
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class BinaryFile:
+    """Reads a binary data file through a memory map.
+
+    The returned data may contain PackedPairs, which read the memory map until the
+    file is closed. Use read(lazy=False) to get plain lists instead."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def __enter__(self) -> Self:
+        with self._path.open(mode="rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._sections = _read_section_table(self._mmap)
+        except Exception:
+            self._mmap.close()
+            raise
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._mmap.close()
+
+    def read(self, *, lazy: bool = True) -> dict[str, Any]:
+        data: dict[str, Any] = json.loads(
+            self._get_section("header").decode("utf-8"), cls=CustomJSONDecoder
+        )
+        strings = _decode_strings(self._get_section("strings"))
+        for name in _TABLE_SECTIONS:
+            if name in self._sections:
+                offset, length = self._sections[name]
+                data["data"][name] = _decode_table(
+                    self._mmap, offset, length, strings, lazy=lazy
+                )
+        return data
+
+    def _get_section(self, name: str) -> bytes:
+        if name not in self._sections:
+            raise BinaryFormatError(f"Missing section '{name}'.")
+        offset, length = self._sections[name]
+        return self._mmap[offset : offset + length]
+
+
+def write_binary(path: Path, data: dict[str, Any]) -> None:
+    """Writes data of a JSON data file ({"version", "datetime_saved", "data"})
+    to path in the binary format."""
+
+    strings = _StringTable()
+    header = {key: value for key, value in data.items() if key != "data"}
+    # table sections stay in the header as placeholders to keep the key order
+    header["data"] = {
+        key: (None if key in _TABLE_SECTIONS else value)
+        for key, value in data["data"].items()
+    }
+    sections: list[tuple[str, bytes]] = [
+        (
+            "header",
+            json.dumps(header, cls=CustomJSONEncoder, ensure_ascii=False).encode(
+                "utf-8"
+            ),
+        )
+    ]
+    sections.extend(
+        (name, _encode_table(data["data"][name], strings))
+        for name in _TABLE_SECTIONS
+        if name in data["data"]
+    )
+    sections.append(("strings", strings.encode()))
+
+    table_length = _FILE_HEADER.size + _SECTION_ENTRY.size * len(sections)
+    offset = _align(table_length)
+    entries = []
+    for name, section in sections:
+        entries.append(_SECTION_ENTRY.pack(name.encode("ascii"), offset, len(section)))
+        offset = _align(offset + len(section))
+
+    with path.open(mode="wb") as file:
+        file.write(_FILE_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(sections)))
+        file.write(b"".join(entries))
+        for _, section in sections:
+            file.write(bytes(_align(file.tell()) - file.tell()))
+            file.write(section)
+
+
+def read_binary(path: Path) -> dict[str, Any]:
+    with BinaryFile(path) as file:
+        return file.read(lazy=False)
+
+
+def convert_json_to_binary(json_path: Path, binary_path: Path) -> None:
+    with json_path.open(encoding="UTF-8") as file:
+        data = json.load(file, cls=CustomJSONDecoder)
+    write_binary(binary_path, data)
+
+
+def convert_binary_to_json(binary_path: Path, json_path: Path) -> None:
+    data = read_binary(binary_path)
+    with json_path.open(mode="w", encoding="UTF-8") as file:
+        json.dump(data, file, cls=CustomJSONEncoder, ensure_ascii=False)
+
+
+class _StringTable:
+    __slots__ = ("_indices", "strings")
+
+    def __init__(self) -> None:
+        self._indices: dict[str, int] = {}
+        self.strings: list[str] = []
+
+    def add(self, string: str) -> int:
+        index = self._indices.get(string)
+        if index is None:
+            index = len(self.strings)
+            self._indices[string] = index
+            self.strings.append(string)
+        return index
+
+    def encode(self) -> bytes:
+        blobs = [string.encode("utf-8") for string in self.strings]
+        offsets = array("I", [0])
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+        return (
+            struct.pack("<I", len(blobs)) + _array_to_bytes(offsets) + b"".join(blobs)
+        )
+
+
+def _decode_strings(section: bytes) -> list[str]:
+    (count,) = struct.unpack_from("<I", section)
+    offsets = _array_from_bytes("I", section[4 : 4 + 4 * (count + 1)])
+    blob = section[4 + 4 * (count + 1) :]
+    return [blob[start:end].decode("utf-8") for start, end in pairwise(offsets)]
+
+
+def _read_section_table(buffer: mmap.mmap) -> dict[str, tuple[int, int]]:
+    if len(buffer) < _FILE_HEADER.size:
+        raise BinaryFormatError("File is too short.")
+    magic, version, count = _FILE_HEADER.unpack_from(buffer)
+    if magic != _MAGIC:
+        raise BinaryFormatError("File is not a Kapytal binary data file.")
+    if version > _FORMAT_VERSION:
+        raise BinaryFormatError(f"Unsupported binary format version: {version}")
+    sections: dict[str, tuple[int, int]] = {}
+    for index in range(count):
+        name, offset, length = _SECTION_ENTRY.unpack_from(
+            buffer, _FILE_HEADER.size + index * _SECTION_ENTRY.size
+        )
+        if offset + length > len(buffer):
+            raise BinaryFormatError("File is truncated.")
+        sections[name.rstrip(b"\x00").decode("ascii")] = (offset, length)
+    return sections
+
+
+# Table sections
+
+
+def _encode_table(items: list[dict[str, Any]], strings: _StringTable) -> bytes:
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    group_ids = array("H")
+    group_indices: dict[tuple[str, ...], int] = {}
+    for item in items:
+        keys = tuple(item)
+        if keys not in group_indices:
+            group_indices[keys] = len(group_indices)
+            groups[keys] = []
+        groups[keys].append(item)
+        group_ids.append(group_indices[keys])
+
+    buffers: list[bytes] = []
+    buffer_offset = 0
+
+    def add_buffer(buffer: bytes) -> tuple[int, int]:
+        nonlocal buffer_offset
+        span = (buffer_offset, len(buffer))
+        buffers.append(buffer + bytes(_align(len(buffer)) - len(buffer)))
+        buffer_offset += _align(len(buffer))
+        return span
+
+    meta: dict[str, Any] = {
+        "rows": len(items),
+        "group_ids": add_buffer(_array_to_bytes(group_ids)),
+        "groups": [],
+    }
+    for keys, group_items in groups.items():
+        columns = []
+        for key in keys:
+            values = [item[key] for item in group_items]
+            encoding, column_buffers = _encode_column(values, strings)
+            columns.append(
+                {
+                    "encoding": encoding,
+                    "buffers": [add_buffer(buffer) for buffer in column_buffers],
+                }
+            )
+        meta["groups"].append(
+            {"keys": list(keys), "rows": len(group_items), "columns": columns}
+        )
+
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    prefix = struct.pack("<I", len(meta_bytes)) + meta_bytes
+    prefix += bytes(_align(len(prefix)) - len(prefix))
+    return prefix + b"".join(buffers)
+
+
+def _decode_table(
+    buffer: mmap.mmap,
+    section_offset: int,
+    section_length: int,
+    strings: list[str],
+    *,
+    lazy: bool,
+) -> list[dict[str, Any]]:
+    (meta_length,) = struct.unpack_from("<I", buffer, section_offset)
+    meta = json.loads(
+        buffer[section_offset + 4 : section_offset + 4 + meta_length].decode("utf-8")
+    )
+    base = section_offset + _align(4 + meta_length)
+    if base > section_offset + section_length:
+        raise BinaryFormatError("Table section is truncated.")
+
+    group_rows: list[Iterator[dict[str, Any]]] = []
+    for group in meta["groups"]:
+        rows: int = group["rows"]
+        columns = []
+        for column in group["columns"]:
+            decode = _COLUMN_DECODERS.get(column["encoding"])
+            if decode is None:
+                raise BinaryFormatError(
+                    f"Unknown column encoding: {column['encoding']}"
+                )
+            spans = [(base + offset, length) for offset, length in column["buffers"]]
+            columns.append(
+                decode(rows, _ColumnBuffers(buffer, spans), strings, lazy=lazy)
+            )
+        keys = group["keys"]
+        group_rows.append(
+            iter(
+                [
+                    dict(zip(keys, row, strict=True))
+                    for row in zip(*columns, strict=True)
+                ]
+            )
+            if columns
+            else iter([{} for _ in range(rows)])
+        )
+
+    offset, length = meta["group_ids"]
+    group_ids = _array_from_bytes("H", buffer[base + offset : base + offset + length])
+    items = [next(group_rows[group_id]) for group_id in group_ids]
+    if len(items) != meta["rows"]:
+        raise BinaryFormatError("Table section is corrupted.")
+    return items
+
+
+# Columns
+
+
+def _encode_column(values: list[Any], strings: _StringTable) -> tuple[str, list[bytes]]:
+    """Returns the most compact encoding which reproduces the values exactly."""
+
+    all_strings = all(isinstance(value, str) for value in values)
+    if all_strings:
+        candidates: tuple[str, ...] = ("datetime", "uuid", "amount", "decimal")
+    elif all(isinstance(value, list | tuple) for value in values):
+        candidates = ("pairs", "string_list")
+    else:
+        candidates = ()
+
+    for encoding in candidates:
+        try:
+            buffers = _COLUMN_ENCODERS[encoding](values, strings)
+            decoded = _COLUMN_DECODERS[encoding](
+                len(values),
+                _ColumnBuffers.from_bytes(buffers),
+                strings.strings,
+                lazy=False,
+            )
+        except (ArithmeticError, AttributeError, TypeError, ValueError):
+            continue
+        if decoded == _to_json_equivalent(values):
+            return encoding, buffers
+
+    if all_strings:
+        return "string", [_array_to_bytes(array("I", map(strings.add, values)))]
+    return "json", [
+        _array_to_bytes(
+            array(
+                "I",
+                (
+                    strings.add(
+                        json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+                    )
+                    for value in values
+                ),
+            )
+        )
+    ]
+
+
+def _to_json_equivalent(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, list | tuple):
+        return [_to_json_equivalent(item) for item in value]
+    return value
+
+
+def _encode_datetimes(values: list[str], _: _StringTable) -> list[bytes]:
+    timestamps = array("q")
+    utc_offsets = array("i")
+    for value in values:
+        datetime_ = datetime.fromisoformat(value)
+        timestamps.append(int(datetime_.timestamp()))
+        utc_offsets.append(int(datetime_.utcoffset().total_seconds()))
+    return [_array_to_bytes(timestamps), _array_to_bytes(utc_offsets)]
+
+
+def _decode_datetimes(
+    rows: int, buffers: "_ColumnBuffers", _: list[str], *, lazy: bool  # noqa: ARG001
+) -> list[str]:
+    timestamps = _array_from_bytes("q", buffers.read(0))
+    utc_offsets = _array_from_bytes("i", buffers.read(1))
+    # formatting each datetime via datetime.isoformat() is slow, the date, time
+    # and UTC offset parts repeat a lot and are cached
+    dates: dict[int, str] = {}
+    times: dict[int, str] = {}
+    offsets: dict[int, str] = {}
+    values = []
+    for timestamp, utc_offset in zip(timestamps, utc_offsets, strict=True):
+        days, seconds = divmod(timestamp + utc_offset, 86400)
+        date_ = dates.get(days)
+        if date_ is None:
+            date_ = date.fromordinal(days + _EPOCH_ORDINAL).isoformat() + "T"
+            dates[days] = date_
+        time_ = times.get(seconds)
+        if time_ is None:
+            time_ = str(timedelta(seconds=seconds)).zfill(8)
+            times[seconds] = time_
+        offset = offsets.get(utc_offset)
+        if offset is None:
+            time_zone = timezone(timedelta(seconds=utc_offset))
+            offset = _EPOCH.astimezone(time_zone).isoformat()[19:]
+            offsets[utc_offset] = offset
+        values.append(date_ + time_ + offset)
+    _check_rows(rows, values)
+    return values
+
+
+def _encode_uuids(values: list[str], _: _StringTable) -> list[bytes]:
+    return [b"".join(UUID(value).bytes for value in values)]
+
+
+def _decode_uuids(
+    rows: int, buffers: "_ColumnBuffers", _: list[str], *, lazy: bool  # noqa: ARG001
+) -> list[str]:
+    hex_ = buffers.read(0).hex()
+    values = [
+        f"{hex_[i : i + 8]}-{hex_[i + 8 : i + 12]}-{hex_[i + 12 : i + 16]}-"
+        f"{hex_[i + 16 : i + 20]}-{hex_[i + 20 : i + 32]}"
+        for i in range(0, len(hex_), 32)
+    ]
+    _check_rows(rows, values)
+    return values
+
+
+def _encode_amounts(values: list[str], strings: _StringTable) -> list[bytes]:
+    """Encodes CashAmount strings ('<value> <currency code>') as scaled integers."""
+
+    mantissas = array("q")
+    exponents = array("b")
+    currency_codes = array("I")
+    for value in values:
+        number, currency_code = value.split(" ")
+        mantissa, exponent = _split_decimal(number)
+        mantissas.append(mantissa)
+        exponents.append(exponent)
+        currency_codes.append(strings.add(currency_code))
+    return [
+        _array_to_bytes(mantissas),
+        _array_to_bytes(exponents),
+        _array_to_bytes(currency_codes),
+    ]
+
+
+def _decode_amounts(
+    rows: int,
+    buffers: "_ColumnBuffers",
+    strings: list[str],
+    *,
+    lazy: bool,  # noqa: ARG001
+) -> list[str]:
+    mantissas = _array_from_bytes("q", buffers.read(0))
+    exponents = _array_from_bytes("b", buffers.read(1))
+    currency_codes = _array_from_bytes("I", buffers.read(2))
+    cache: dict[tuple[int, int, int], str] = {}
+    values = []
+    for key in zip(mantissas, exponents, currency_codes, strict=True):
+        value = cache.get(key)
+        if value is None:
+            mantissa, exponent, code = key
+            value = f"{_format_decimal(mantissa, exponent)} {strings[code]}"
+            cache[key] = value
+        values.append(value)
+    _check_rows(rows, values)
+    return values
+
+
+def _encode_decimals(values: list[str], _: _StringTable) -> list[bytes]:
+    mantissas = array("q")
+    exponents = array("b")
+    for value in values:
+        mantissa, exponent = _split_decimal(value)
+        mantissas.append(mantissa)
+        exponents.append(exponent)
+    return [_array_to_bytes(mantissas), _array_to_bytes(exponents)]
+
+
+def _decode_decimals(
+    rows: int, buffers: "_ColumnBuffers", _: list[str], *, lazy: bool  # noqa: ARG001
+) -> list[str]:
+    mantissas = _array_from_bytes("q", buffers.read(0))
+    exponents = _array_from_bytes("b", buffers.read(1))
+    cache: dict[tuple[int, int], str] = {}
+    values = []
+    for key in zip(mantissas, exponents, strict=True):
+        value = cache.get(key)
+        if value is None:
+            value = _format_decimal(*key)
+            cache[key] = value
+        values.append(value)
+    _check_rows(rows, values)
+    return values
+
+
+def _encode_pairs(values: list[Sequence[str]], _: _StringTable) -> list[bytes]:
+    """Encodes date-value pair lists (price and rate histories) as packed arrays
+    of day ordinals and scaled integers."""
+
+    row_offsets = array("I", [0])
+    ordinals = array("i")
+    mantissas = array("q")
+    exponents = array("b")
+    for value in values:
+        for date_, number in value:
+            ordinals.append(date.fromisoformat(date_).toordinal())
+            mantissa, exponent = _split_decimal(number)
+            mantissas.append(mantissa)
+            exponents.append(exponent)
+        row_offsets.append(len(ordinals))
+    return [
+        _array_to_bytes(row_offsets),
+        _array_to_bytes(ordinals),
+        _array_to_bytes(mantissas),
+        _array_to_bytes(exponents),
+    ]
+
+
+def _decode_pairs(
+    rows: int, buffers: "_ColumnBuffers", _: list[str], *, lazy: bool
+) -> list[Any]:
+    column = _PairsColumn(buffers)
+    if len(column.row_offsets) != rows + 1:
+        raise BinaryFormatError("Column length does not match the table.")
+    if lazy:
+        return [PackedPairs(column, row) for row in range(rows)]
+    return [column.decode_row(row) for row in range(rows)]
+
+
+def _encode_string_lists(
+    values: list[Sequence[str]], strings: _StringTable
+) -> list[bytes]:
+    """Encodes lists of strings (e.g. Category and tag amount pairs) as indices
+    into the string table."""
+
+    row_offsets = array("I", [0])
+    indices = array("I")
+    for value in values:
+        for string in value:
+            if not isinstance(string, str):
+                raise TypeError("Expected a list of strings.")
+            indices.append(strings.add(string))
+        row_offsets.append(len(indices))
+    return [_array_to_bytes(row_offsets), _array_to_bytes(indices)]
+
+
+def _decode_string_lists(
+    rows: int,
+    buffers: "_ColumnBuffers",
+    strings: list[str],
+    *,
+    lazy: bool,  # noqa: ARG001
+) -> list[list[str]]:
+    row_offsets = _array_from_bytes("I", buffers.read(0))
+    all_strings = [strings[index] for index in _array_from_bytes("I", buffers.read(1))]
+    values = [all_strings[start:end] for start, end in pairwise(row_offsets)]
+    _check_rows(rows, values)
+    return values
+
+
+def _decode_json_values(
+    rows: int,
+    buffers: "_ColumnBuffers",
+    strings: list[str],
+    *,
+    lazy: bool,  # noqa: ARG001
+) -> list[Any]:
+    values = [
+        _JSON_DECODER.decode(strings[index])
+        for index in _array_from_bytes("I", buffers.read(0))
+    ]
+    _check_rows(rows, values)
+    return values
+
+
+def _decode_string_values(
+    rows: int,
+    buffers: "_ColumnBuffers",
+    strings: list[str],
+    *,
+    lazy: bool,  # noqa: ARG001
+) -> list[str]:
+    values = [strings[index] for index in _array_from_bytes("I", buffers.read(0))]
+    _check_rows(rows, values)
+    return values
+
+
+class _ColumnBuffers:
+    """Buffers of a column, read from the memory map or from bytes being encoded.
+    Each read copies the requested bytes, so the memory map can be closed."""
+
+    __slots__ = ("_source", "_spans")
+
+    def __init__(self, source: bytes | mmap.mmap, spans: list[tuple[int, int]]) -> None:
+        self._source = source
+        self._spans = spans
+
+    @staticmethod
+    def from_bytes(buffers: list[bytes]) -> "_ColumnBuffers":
+        spans = []
+        offset = 0
+        for buffer in buffers:
+            spans.append((offset, len(buffer)))
+            offset += len(buffer)
+        return _ColumnBuffers(b"".join(buffers), spans)
+
+    def read(self, index: int, start: int = 0, end: int | None = None) -> bytes:
+        offset, length = self._spans[index]
+        end = length if end is None else end
+        return self._source[offset + start : offset + end]
+
+
+class _PairsColumn:
+    __slots__ = ("_buffers", "row_offsets")
+
+    def __init__(self, buffers: _ColumnBuffers) -> None:
+        self._buffers = buffers
+        self.row_offsets = _array_from_bytes("I", buffers.read(0))
+
+    def row_length(self, row: int) -> int:
+        return self.row_offsets[row + 1] - self.row_offsets[row]
+
+    def decode_row(self, row: int) -> list[list[str]]:
+        start = self.row_offsets[row]
+        end = self.row_offsets[row + 1]
+        ordinals = _array_from_bytes("i", self._buffers.read(1, 4 * start, 4 * end))
+        mantissas = _array_from_bytes("q", self._buffers.read(2, 8 * start, 8 * end))
+        exponents = _array_from_bytes("b", self._buffers.read(3, start, end))
+        return [
+            [date.fromordinal(ordinal).isoformat(), _format_decimal(mantissa, exp)]
+            for ordinal, mantissa, exp in zip(
+                ordinals, mantissas, exponents, strict=True
+            )
+        ]
+
+
+_COLUMN_ENCODERS: dict[str, Callable[[list[Any], _StringTable], list[bytes]]] = {
+    "amount": _encode_amounts,
+    "datetime": _encode_datetimes,
+    "decimal": _encode_decimals,
+    "pairs": _encode_pairs,
+    "string_list": _encode_string_lists,
+    "uuid": _encode_uuids,
+}
+_COLUMN_DECODERS: dict[str, Callable[..., list[Any]]] = {
+    "amount": _decode_amounts,
+    "datetime": _decode_datetimes,
+    "decimal": _decode_decimals,
+    "json": _decode_json_values,
+    "pairs": _decode_pairs,
+    "string": _decode_string_values,
+    "string_list": _decode_string_lists,
+    "uuid": _decode_uuids,
+}
+
+
+# Helpers
+
+
+def _split_decimal(number: str) -> tuple[int, int]:
+    sign, digits, exponent = Decimal(number).as_tuple()
+    if not isinstance(exponent, int) or not -128 <= exponent <= 127:  # noqa: PLR2004
+        raise ValueError("Decimal exponent out of range.")
+    mantissa = int("".join(map(str, digits)))
+    return (-mantissa if sign else mantissa), exponent
+
+
+def _format_decimal(mantissa: int, exponent: int) -> str:
+    """Returns str() of the Decimal with the given scaled integer representation."""
+
+    digits = str(abs(mantissa))
+    # str(Decimal) uses plain notation for these, formatting it directly is faster
+    if exponent <= 0 and len(digits) - 1 + exponent >= -6:  # noqa: PLR2004
+        if exponent == 0:
+            string = digits
+        elif len(digits) > -exponent:
+            string = digits[:exponent] + "." + digits[exponent:]
+        else:
+            string = "0." + "0" * (-exponent - len(digits)) + digits
+        return "-" + string if mantissa < 0 else string
+    return str(Decimal(f"{mantissa}E{exponent}"))
+
+
+def _check_rows(rows: int, values: list[Any]) -> None:
+    if len(values) != rows:
+        raise BinaryFormatError("Column length does not match the table.")
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _array_to_bytes(values: array) -> bytes:
+    if _BIG_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _array_from_bytes(typecode: str, buffer: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(buffer)
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values
@@ -0,0 +1,113 @@
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+from src.models.record_keeper import RecordKeeper
+
+# A journaled data file consists of a base snapshot (the regular data file) and
+# a journal file next to it. Each save appends one entry to the journal, holding
+# the records which turn the previously saved state into the current one. The
+# records are state-based (the new value of an item or of a whole section), so
+# replaying them is idempotent. Once the journal would grow past COMPACTION_RATIO
+# of the base snapshot size, a new base snapshot is saved instead.
+JOURNAL_SUFFIX = ".journal"
+COMPACTION_RATIO = 0.25
+
+# sections whose items are journaled individually, with their key functions
+_KEYED_SECTIONS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "exchange_rates": lambda item: (
+        item["primary_currency_code"] + "/" + item["secondary_currency_code"]
+    ),
+    "securities": itemgetter("uuid"),
+    "transactions": itemgetter("uuid"),
+}
+
+
+@dataclass(frozen=True)
+class SavedState:
+    """State of record_keeper as last saved to or loaded from path, where
+    datetime_saved identifies the base snapshot the journal belongs to. Changes
+    since then are those made since record_keeper reached version. Only the
+    serialized sections which are not journaled per item are kept in data."""
+
+    path: Path
+    datetime_saved: str
+    record_keeper: RecordKeeper
+    version: int
+    data: dict[str, Any]
+
+
+def get_journal_path(path: Path) -> Path:
+    return path.with_name(path.name + JOURNAL_SUFFIX)
+
+
+def get_unkeyed_sections(data: dict[str, Any]) -> dict[str, Any]:
+    """Returns the serialized sections which are not journaled per item."""
+
+    return {
+        section: value
+        for section, value in data.items()
+        if section not in _KEYED_SECTIONS
+    }
+
+
+def create_records(
+    saved_data: dict[str, Any], changes: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """Returns the records of changes returned by RecordKeeper.serialize_changes()
+    since saved_data was saved."""
+
+    records: list[dict[str, Any]] = []
+    for section, value in changes.items():
+        if section not in _KEYED_SECTIONS:
+            if section not in saved_data or saved_data[section] != value:
+                records.append(_create_record("replace", section, value=value))
+        elif isinstance(value, list):
+            records.append(_create_record("replace", section, value=value))
+        else:
+            # a removed item may have been added again under the same key
+            records.extend(
+                _create_record("delete", section, key=key) for key in value["delete"]
+            )
+            records.extend(
+                _create_record("put", section, value=item) for item in value["put"]
+            )
+    return records
+
+
+def apply_records(data: dict[str, Any], records: Iterable[dict[str, Any]]) -> None:
+    """Applies the records to serialized data in place."""
+
+    sections: dict[str, dict[str, dict[str, Any]]] = {}
+    for record in records:
+        section: str = record["section"]
+        operation: str = record["operation"]
+        if operation == "replace":
+            sections.pop(section, None)
+            data[section] = record["value"]
+            continue
+
+        get_key = _KEYED_SECTIONS[section]
+        if section not in sections:
+            sections[section] = {get_key(item): item for item in data[section]}
+        items = sections[section]
+        if operation == "put":
+            items[get_key(record["value"])] = record["value"]
+        elif operation == "delete":
+            items.pop(record["key"], None)
+        else:
+            raise ValueError(f"Unexpected journal record operation: {operation}")
+
+    for section, items in sections.items():
+        data[section] = list(items.values())
+
+
+def _create_record(operation: str, section: str, **kwargs: object) -> dict[str, Any]:
+    return {
+        "datatype": "JournalRecord",
+        "operation": operation,
+        "section": section,
+        **kwargs,
+    }
@@ -1,3 +1,6 @@
+import sys
+from collections.abc import Collection, Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, TypeVar
 from uuid import UUID
 
@@ -9,7 +12,24 @@ if TYPE_CHECKING:
 from src.models.mixins.balance_mixin import BalanceMixin
 from src.models.mixins.name_mixin import NameMixin
 from src.models.mixins.uuid_mixin import UUIDMixin
-from src.models.model_objects.currency_objects import CashAmount, Currency
+from src.models.model_objects.currency_objects import (
+    CashAccumulator,
+    CashAmount,
+    Currency,
+    MultiCurrencyAccumulator,
+)
+
+
+class _BalanceBatch:
+    """AccountGroups whose balances are recalculated once the outermost
+    batch_balance_updates scope sharing this batch exits."""
+
+    __slots__ = ("depth", "dirty_groups", "groups")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.groups: list[AccountGroup] = []
+        self.dirty_groups: dict[AccountGroup, None] = {}
 
 
 class AccountGroup(NameMixin, BalanceMixin, UUIDMixin):
@@ -17,20 +37,29 @@ class AccountGroup(NameMixin, BalanceMixin, UUIDMixin):
         "_allow_colon",
         "_allow_slash",
         "_balances",
+        "_batch",
         "_children_dict",
         "_children_tuple",
         "_name",
         "_parent",
+        "_path",
         "_uuid",
         "event_balance_updated",
     )
 
     def __init__(self, name: str, parent: "AccountGroup | None" = None) -> None:
+        self._path: str | None = None
+        self._batch: _BalanceBatch | None = None
         super().__init__(name=name, allow_slash=False)
         self.parent = parent
         self._children_dict: dict[int, AccountGroup | Account] = {}
         self._children_tuple: tuple[AccountGroup | Account, ...] = ()
 
+    @NameMixin.name.setter
+    def name(self, name: str) -> None:
+        NameMixin.name.fset(self, name)
+        self._invalidate_path()
+
     @property
     def parent(self) -> "AccountGroup | None":
         return self._parent
@@ -50,6 +79,7 @@ class AccountGroup(NameMixin, BalanceMixin, UUIDMixin):
             parent._add_child(self)  # noqa: SLF001
 
         self._parent = parent
+        self._invalidate_path()
 
     @property
     def children(self) -> tuple["Account | AccountGroup", ...]:
@@ -57,9 +87,13 @@ class AccountGroup(NameMixin, BalanceMixin, UUIDMixin):
 
     @property
     def path(self) -> str:
-        if self._parent is None:
-            return self._name
-        return self._parent.path + "/" + self._name
+        if self._path is None:
+            self._path = sys.intern(
+                self._name
+                if self._parent is None
+                else self._parent.path + "/" + self._name
+            )
+        return self._path
 
     @property
     def is_single_currency(self) -> bool:
@@ -79,6 +113,14 @@ class AccountGroup(NameMixin, BalanceMixin, UUIDMixin):
     def __repr__(self) -> str:
         return f"AccountGroup({self.path})"
 
+    def _invalidate_path(self) -> None:
+        # a cached descendant path implies a cached path of this AccountGroup
+        if self._path is None:
+            return
+        self._path = None
+        for child in self._children_tuple:
+            child._invalidate_path()  # noqa: SLF001
+
     def _get_children_currencies(self) -> frozenset[Currency]:
         currencies = set()
         for child in self._children_tuple:
@@ -146,20 +188,84 @@ class AccountGroup(NameMixin, BalanceMixin, UUIDMixin):
         ]
 
     def get_balance(self, currency: Currency) -> CashAmount:
-        total = currency.zero_amount
+        total = CashAccumulator(currency.zero_amount)
         for balance in self._balances:
-            total += balance.convert(currency)
-        return total
+            total.add(balance.convert(currency))
+        return total.to_cash_amount()
+
+    @staticmethod
+    @contextmanager
+    def batch_balance_updates(groups: Collection["AccountGroup"]) -> Iterator[None]:
+        """Within this scope, child balance changes only mark given AccountGroups
+        as outdated. When the outermost scope exits, each affected AccountGroup
+        recalculates its balances once, deepest AccountGroups first. The batch
+        lives on the given AccountGroups only, so unrelated AccountGroups (e.g.
+        of another RecordKeeper) are never deferred."""
+
+        # nested scopes share the batch of the outermost one
+        batch = _BalanceBatch()
+        for group in groups:
+            if group._batch is not None:  # noqa: SLF001
+                batch = group._batch  # noqa: SLF001
+                break
+        for group in groups:
+            if group._batch is None:  # noqa: SLF001
+                group._batch = batch  # noqa: SLF001
+                batch.groups.append(group)
+
+        batch.depth += 1
+        try:
+            yield
+        finally:
+            batch.depth -= 1
+            if batch.depth == 0:
+                try:
+                    AccountGroup._flush_balance_updates(batch)
+                finally:
+                    for group in batch.groups:
+                        group._batch = None  # noqa: SLF001
+
+    @staticmethod
+    def _flush_balance_updates(batch: _BalanceBatch) -> None:
+        dirty_groups = batch.dirty_groups
+        batch.dirty_groups = {}
+        for group in tuple(dirty_groups):
+            parent = group.parent
+            while parent is not None and parent not in dirty_groups:
+                dirty_groups[parent] = None
+                parent = parent.parent
+
+        # parents are already queued, so the events they receive can be ignored
+        batch.depth += 1
+        try:
+            for group in sorted(
+                dirty_groups, key=AccountGroup._get_depth, reverse=True
+            ):
+                group._recalculate_balances()  # noqa: SLF001
+        finally:
+            batch.depth -= 1
+            batch.dirty_groups = {}
+
+    def _get_depth(self) -> int:
+        depth = 0
+        parent = self._parent
+        while parent is not None:
+            depth += 1
+            parent = parent.parent
+        return depth
 
     def _update_balances(self) -> None:
-        balances: dict[Currency, CashAmount] = {}
+        if self._batch is not None and self._batch.depth > 0:
+            self._batch.dirty_groups[self] = None
+            return
+        self._recalculate_balances()
+
+    def _recalculate_balances(self) -> None:
+        balances = MultiCurrencyAccumulator()
         for child in self._children_tuple:
             for balance in child.balances:
-                if balance.currency in balances:
-                    balances[balance.currency] += balance
-                else:
-                    balances[balance.currency] = balance
-        self._balances = tuple(balances.values())
+                balances.add(balance)
+        self._balances = balances.to_cash_amounts()
         self.event_balance_updated()
 
     def serialize(self) -> dict[str, Any]:
@@ -1,3 +1,4 @@
+import sys
 from enum import Enum, auto
 from typing import Any
 
@@ -60,6 +61,36 @@ class Attribute(NameMixin):
         return self._name
 
 
+class _TreeNumbering:
+    """Pre-order numbering of the Categories of a single tree, shared by their
+    _TreePositions. Invalidated by any change of the structure of the tree."""
+
+    __slots__ = ("order", "valid")
+
+    def __init__(self) -> None:
+        self.order: list[Category] = []
+        self.valid = True
+
+
+class _TreePosition:
+    """Position of a Category in the pre-order numbering of its tree. The subtree
+    of the Category occupies the slice numbering.order[start:end]."""
+
+    __slots__ = ("ancestors", "descendants", "end", "numbering", "start")
+
+    def __init__(
+        self,
+        numbering: _TreeNumbering,
+        start: int,
+        ancestors: frozenset["Category"],
+    ) -> None:
+        self.numbering = numbering
+        self.start = start
+        self.end = start + 1
+        self.ancestors = ancestors
+        self.descendants: frozenset[Category] | None = None
+
+
 class Category(NameMixin, UUIDMixin):
     __slots__ = (
         "_allow_colon",
@@ -68,6 +99,8 @@ class Category(NameMixin, UUIDMixin):
         "_children_tuple",
         "_name",
         "_parent",
+        "_path",
+        "_tree_position",
         "_type",
         "_uuid",
     )
@@ -75,6 +108,8 @@ class Category(NameMixin, UUIDMixin):
     def __init__(
         self, name: str, type_: CategoryType, parent: "Category | None" = None
     ) -> None:
+        self._path: str | None = None
+        self._tree_position: _TreePosition | None = None
         super().__init__(name, allow_slash=False)
         if name.lower() == "total":
             raise ValueError("The word 'Total' is reserved for Reports.")
@@ -87,6 +122,11 @@ class Category(NameMixin, UUIDMixin):
         self._children_dict: dict[int, Category] = {}
         self._children_tuple: tuple[Category, ...] = ()
 
+    @NameMixin.name.setter
+    def name(self, name: str) -> None:
+        NameMixin.name.fset(self, name)
+        self._invalidate_path()
+
     @property
     def parent(self) -> "Category | None":
         return self._parent
@@ -112,6 +152,7 @@ class Category(NameMixin, UUIDMixin):
             parent._add_child(self)  # noqa: SLF001
 
         self._parent = parent
+        self._invalidate_path()
 
     @property
     def children(self) -> tuple["Category", ...]:
@@ -123,58 +164,91 @@ class Category(NameMixin, UUIDMixin):
 
     @property
     def path(self) -> str:
-        if self._parent is None:
-            return self._name
-        return self._parent.path + "/" + self._name
+        if self._path is None:
+            self._path = sys.intern(
+                self._name
+                if self._parent is None
+                else self._parent.path + "/" + self._name
+            )
+        return self._path
 
     @property
     def ancestors(self) -> frozenset["Category"]:
-        ancestors = set()
-        node = self._parent
-        while node is not None:
-            ancestors.add(node)
-            node = node._parent  # noqa: SLF001
-        return frozenset(ancestors)
+        return self._get_tree_position().ancestors
 
     @property
     def descendants(self) -> frozenset["Category"]:
-        if not self._children_tuple:
-            return frozenset()
-        descendants = set(self._children_tuple)
-        for child in self._children_tuple:
-            descendants |= child.descendants
-        return frozenset(descendants)
+        position = self._get_tree_position()
+        if position.descendants is None:
+            position.descendants = frozenset(
+                position.numbering.order[position.start + 1 : position.end]
+            )
+        return position.descendants
 
     def __repr__(self) -> str:
         return f"Category('{self.path}', {self._type.name})"
 
     def is_ancestor_of(self, category: "Category") -> bool:
-        """Check if this Category is an ancestor of the parameter Category.
-        Seems to be slower than checking if category is in self.descendants."""
-
-        if category in self._children_tuple or category.parent in self._children_tuple:
-            return True
-        if len(self._children_tuple) == 0 or self == category:
-            return False
-        for child in self._children_tuple:  # noqa: SIM110
-            if child.is_ancestor_of(category):
-                return True
-        return False
+        """Check if this Category is an ancestor of the parameter Category."""
+        return category.is_descendant_of(self)
 
     def is_descendant_of(self, category: "Category") -> bool:
         """Check if this Category is a descendant of the parameter Category."""
-        if self._parent == category:
-            return True
-        if self._parent is None:
-            return False
-        return self._parent.is_descendant_of(category)
+        position = self._get_tree_position()
+        other_position = category._get_tree_position()  # noqa: SLF001
+        return (
+            position.numbering is other_position.numbering
+            and other_position.start < position.start < other_position.end
+        )
+
+    def _get_tree_position(self) -> _TreePosition:
+        if self._tree_position is None or not self._tree_position.numbering.valid:
+            self._number_tree()
+        return self._tree_position
+
+    def _invalidate_tree_numbering(self) -> None:
+        if self._tree_position is not None:
+            self._tree_position.numbering.valid = False
+
+    def _number_tree(self) -> None:
+        """Numbers all Categories of this Category's tree in pre-order."""
+
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        numbering = _TreeNumbering()
+        order = numbering.order
+        positions: dict[Category, _TreePosition] = {}
+        stack: list[tuple[Category, frozenset[Category]]] = [(root, frozenset())]
+        while stack:
+            node, ancestors = stack.pop()
+            positions[node] = _TreePosition(numbering, len(order), ancestors)
+            order.append(node)
+            child_ancestors = ancestors | {node}
+            stack.extend((child, child_ancestors) for child in reversed(node.children))
+        # the subtree of a Category ends where the subtree of its last child ends
+        for node in reversed(order):
+            if node.children:
+                positions[node].end = positions[node.children[-1]].end
+            node._tree_position = positions[node]  # noqa: SLF001
+
+    def _invalidate_path(self) -> None:
+        # a cached descendant path implies a cached path of this Category
+        if self._path is None:
+            return
+        self._path = None
+        for child in self._children_tuple:
+            child._invalidate_path()  # noqa: SLF001
 
     def _update_children_tuple(self) -> None:
         self._children_tuple = tuple(
             self._children_dict[key] for key in sorted(self._children_dict.keys())
         )
+        self._invalidate_tree_numbering()
 
     def _add_child(self, child: "Category") -> None:
+        # the former root of the tree of child is no longer a root
+        child._invalidate_tree_numbering()  # noqa: SLF001
         max_index = max(sorted(self._children_dict.keys()), default=-1)
         self._children_dict[max_index + 1] = child
         self._update_children_tuple()
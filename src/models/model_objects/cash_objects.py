@@ -2,7 +2,7 @@ import logging
 import operator
 import re
 from abc import ABC, abstractmethod
-from bisect import bisect_right
+from bisect import bisect_left, bisect_right
 from collections.abc import Collection
 from datetime import date, datetime, timedelta
 from decimal import Decimal
@@ -30,6 +30,7 @@ from src.models.model_objects.attributes import (
     InvalidCategoryTypeError,
 )
 from src.models.model_objects.currency_objects import (
+    CashAccumulator,
     CashAmount,
     Currency,
     CurrencyError,
@@ -92,15 +93,19 @@ class CashAccount(Account):
         "_allow_colon",
         "_allow_slash",
         "_balance_history",
+        "_balance_indexes",
+        "_balance_timestamps",
         "_balances",
         "_currency",
         "_iban",
         "_initial_balance",
         "_name",
         "_parent",
+        "_path",
         "_transactions",
         "_uuid",
         "allow_update_balance",
+        "balance_outdated",
         "event_balance_updated",
     )
 
@@ -117,19 +122,25 @@ class CashAccount(Account):
         self._currency = currency
 
         # allow_update_balance attribute is used to block updating the balance
-        # when a transaction is added or removed during deserialization
+        # when a transaction is added or removed during deserialization,
+        # balance_outdated marks that an update was blocked since the last rebuild
         self.allow_update_balance = False
 
         # balance update via initial_balance set is suppressed due to line above
         self.initial_balance = initial_balance
+        initial_datetime = datetime.now(user_settings.settings.time_zone)
         self._balance_history: list[
             tuple[datetime, CashAmount, CashRelatedTransaction | None]
-        ] = [(datetime.now(user_settings.settings.time_zone), initial_balance, None)]
+        ] = [(initial_datetime, initial_balance, None)]
+        # timestamps of _balance_history entries and entry index of each transaction
+        self._balance_timestamps: list[float] = [initial_datetime.timestamp()]
+        self._balance_indexes: dict[CashRelatedTransaction, int] = {}
         self._transactions: set[CashRelatedTransaction] = set()
 
         self.iban = iban  # IBAN validation done within the setter
 
         # parent is set last because it triggers chain of balance updates
+        self.balance_outdated = False
         self.allow_update_balance = True
         super().__init__(name=name, parent=parent)
 
@@ -169,7 +180,11 @@ class CashAccount(Account):
             raise ValueError("CashAccount.initial_balance must not be negative.")
         self._initial_balance = amount
         if self.allow_update_balance:
-            self.update_balance()
+            logging.debug(f"Updating balance of {self}")
+            self._accumulate_balance_history(0)
+            self.event_balance_updated()
+        else:
+            self.balance_outdated = True
 
     @property
     def balance_history(
@@ -204,12 +219,10 @@ class CashAccount(Account):
         self, currency: Currency, transaction: CashRelatedTransaction
     ) -> CashAmount:
         self._validate_transaction(transaction)
-        for _, balance, _transaction in self._balance_history:
-            if _transaction == transaction:
-                return balance.convert(currency)
-        raise ValueError(  # pragma: no cover
-            "Provided CashRelatedTransaction not found."
-        )
+        index = self._balance_indexes.get(transaction)
+        if index is None:  # pragma: no cover
+            raise ValueError("Provided CashRelatedTransaction not found.")
+        return self._balance_history[index][1].convert(currency)
 
     def add_transaction(self, transaction: CashRelatedTransaction) -> None:
         self._validate_transaction(transaction)
@@ -219,14 +232,12 @@ class CashAccount(Account):
                 "CashAccount.transactions."
             )
         self._transactions.add(transaction)
-        if self.allow_update_balance:
-            self.update_balance()
+        self.update_balance(transaction)
 
     def remove_transaction(self, transaction: CashRelatedTransaction) -> None:
         self._validate_transaction(transaction)
         self._transactions.remove(transaction)
-        if self.allow_update_balance:
-            self.update_balance()
+        self.update_balance(transaction)
 
     def serialize(self) -> dict[str, Any]:
         index = self.parent.children.index(self) if self.parent is not None else None
@@ -268,9 +279,70 @@ class CashAccount(Account):
             obj.event_balance_updated()
         return obj
 
-    def update_balance(self) -> None:
+    def update_balance(self, transaction: CashRelatedTransaction | None = None) -> None:
+        """Updates the balance history. If a transaction is given, only its entry
+        is moved, added or removed (according to whether it belongs to this
+        CashAccount) and the balances after it are recalculated. Otherwise the
+        whole balance history is rebuilt. While allow_update_balance is False,
+        the update is skipped and the CashAccount is marked as balance_outdated."""
+
+        if not self.allow_update_balance:
+            self.balance_outdated = True
+            return
+
+        logging.debug(f"Updating balance of {self}")
+
+        if transaction is not None:
+            expected_count = (
+                len(self._balance_indexes)
+                + (transaction in self._transactions)
+                - (transaction in self._balance_indexes)
+            )
+        if transaction is None or expected_count != len(self._transactions):
+            # the history is not in sync with the transactions (e.g. transactions
+            # were added while allow_update_balance was False), rebuild it
+            self._rebuild_balance_history()
+            self.event_balance_updated()
+            return
+
+        start = len(self._balance_history)
+        index = self._balance_indexes.pop(transaction, None)
+        if index is not None:
+            del self._balance_history[index]
+            del self._balance_timestamps[index]
+            start = index
+        if transaction in self._transactions:
+            start = min(start, self._insert_balance_entry(transaction))
+        self._accumulate_balance_history(start)
+        self.event_balance_updated()
+
+    def replay_transactions(
+        self, transactions: Collection[CashRelatedTransaction]
+    ) -> None:
+        """Moves, adds or removes the entries of given transactions, which were
+        edited while allow_update_balance was False, and recalculates the balances
+        after the earliest of them once. Other transactions must not have been
+        changed in the meantime."""
+
         logging.debug(f"Updating balance of {self}")
+        self.balance_outdated = False
+        indexes = [
+            index
+            for transaction in transactions
+            if (index := self._balance_indexes.pop(transaction, None)) is not None
+        ]
+        start = len(self._balance_history)
+        for index in sorted(indexes, reverse=True):
+            del self._balance_history[index]
+            del self._balance_timestamps[index]
+            start = index
+        for transaction in transactions:
+            if transaction in self._transactions:
+                start = min(start, self._insert_balance_entry(transaction))
+        self._accumulate_balance_history(start)
+        self.event_balance_updated()
 
+    def _rebuild_balance_history(self) -> None:
         transactions = sorted(self._transactions, key=lambda x: x.timestamp)
         for index, transaction in enumerate(transactions):
             if index > 0 and transaction.datetime_ == transactions[index - 1].datetime_:
@@ -279,23 +351,67 @@ class CashAccount(Account):
                     datetime_=new_datetime, block_account_update=True
                 )
 
-        if len(self._transactions) > 0:
-            oldest_datetime = transactions[0].datetime_
-        else:
-            oldest_datetime = self._balance_history[0][0] + timedelta(days=1)
-        datetime_balance_history: list[
-            tuple[datetime, CashAmount, CashRelatedTransaction | None]
-        ] = [(oldest_datetime - timedelta(days=1), self._initial_balance, None)]
-
+        self._balance_history = self._balance_history[:1]
+        self._balance_timestamps = self._balance_timestamps[:1]
+        self._balance_indexes = {}
         for transaction in transactions:
-            last_balance = datetime_balance_history[-1][1]
-            next_balance = last_balance + transaction.get_amount(self)
-            datetime_balance_history.append(
-                (transaction.datetime_, next_balance, transaction)
-            )
+            self._balance_history.append((transaction.datetime_, None, transaction))
+            self._balance_timestamps.append(transaction.timestamp)
+        self._accumulate_balance_history(0)
+        self.balance_outdated = False
+
+    def _insert_balance_entry(self, transaction: CashRelatedTransaction) -> int:
+        """Inserts an entry for the transaction at its sorted position and returns
+        the position. Its balance is set by _accumulate_balance_history."""
+
+        if self.is_datetime_taken(transaction):
+            # transactions must not share the same datetime in any of their Accounts
+            transaction.settle_datetime()
+        timestamps = self._balance_timestamps
+        index = bisect_left(timestamps, transaction.timestamp, lo=1)
+        self._balance_history.insert(index, (transaction.datetime_, None, transaction))
+        timestamps.insert(index, transaction.timestamp)
+        return index
+
+    def is_datetime_taken(self, transaction: CashRelatedTransaction) -> bool:
+        timestamps = self._balance_timestamps
+        index = bisect_left(timestamps, transaction.timestamp, lo=1)
+        while index < len(timestamps) and timestamps[index] == transaction.timestamp:
+            if self._balance_history[index][2] is not transaction:
+                return True
+            index += 1
+        return False
 
-        self._balance_history = datetime_balance_history
-        self.event_balance_updated()
+    def move_transaction(self, transaction: CashRelatedTransaction) -> None:
+        if self.allow_update_balance and transaction in self._balance_indexes:
+            self.update_balance(transaction)
+
+    def _accumulate_balance_history(self, start: int) -> None:
+        """Recalculates the running balances and indexes from given position on.
+        The first entry holds the initial balance one day before the oldest
+        transaction."""
+
+        history = self._balance_history
+        if start <= 1:
+            if len(history) > 1:
+                initial_datetime = history[1][0] - timedelta(days=1)
+            else:
+                initial_datetime = history[0][0]
+            history[0] = (initial_datetime, self._initial_balance, None)
+            self._balance_timestamps[0] = initial_datetime.timestamp()
+            start = 1
+
+        accumulator = CashAccumulator(history[start - 1][1])
+        indexes = self._balance_indexes
+        for index in range(start, len(history)):
+            transaction = history[index][2]
+            accumulator.add(transaction.get_amount(self))
+            history[index] = (
+                transaction.datetime_,
+                accumulator.to_cash_amount(),
+                transaction,
+            )
+            indexes[transaction] = index
 
     def _validate_transaction(
         self,
@@ -594,6 +710,10 @@ class CashTransaction(CashRelatedTransaction):
             self.currency.zero_amount,
         )
 
+    @property
+    def accounts(self) -> frozenset[Account]:
+        return frozenset((self._account,))
+
     def is_account_related(self, account: Account) -> bool:
         return self._account == account
 
@@ -683,8 +803,9 @@ class CashTransaction(CashRelatedTransaction):
         *,
         type_: CashTransactionType | None = None,
         account: CashAccount | None = None,
-        category_amount_pairs: Collection[tuple[Category, CashAmount | None]]
-        | None = None,
+        category_amount_pairs: (
+            Collection[tuple[Category, CashAmount | None]] | None
+        ) = None,
         tag_amount_pairs: Collection[tuple[Attribute, CashAmount]] | None = None,
         payee: Attribute | None = None,
         description: str | None = None,
@@ -744,8 +865,9 @@ class CashTransaction(CashRelatedTransaction):
         datetime_: datetime | None = None,
         type_: CashTransactionType | None = None,
         account: CashAccount | None = None,
-        category_amount_pairs: Collection[tuple[Category, CashAmount | None]]
-        | None = None,
+        category_amount_pairs: (
+            Collection[tuple[Category, CashAmount | None]] | None
+        ) = None,
         tag_amount_pairs: Collection[tuple[Attribute, CashAmount | None]] | None = None,
         payee: Attribute | None = None,
     ) -> tuple[tuple[tuple[Category, CashAmount]], tuple[tuple[Attribute, CashAmount]]]:
@@ -830,7 +952,7 @@ class CashTransaction(CashRelatedTransaction):
         if hasattr(self, "_account"):
             if self._account == account:
                 if balance_changed:
-                    self._account.update_balance()
+                    self._account.update_balance(self)
                 return
             self._account.remove_transaction(self)
         self._account = account
@@ -1292,12 +1414,12 @@ class CashTransfer(CashRelatedTransaction):
         if add_sender:
             self._sender.add_transaction(self)
         elif update_sender:
-            self._sender.update_balance()
+            self._sender.update_balance(self)
 
         if add_recipient:
             self._recipient.add_transaction(self)
         elif update_recipient:
-            self._recipient.update_balance()
+            self._recipient.update_balance(self)
 
     def _validate_accounts(self, sender: CashAccount, recipient: CashAccount) -> None:
         if not isinstance(sender, CashAccount):
@@ -1435,6 +1557,10 @@ class RefundTransaction(CashRelatedTransaction):
             f"{self.datetime_.strftime('%Y-%m-%d')})"
         )
 
+    @property
+    def accounts(self) -> frozenset[Account]:
+        return frozenset((self._account,))
+
     def is_account_related(self, account: "Account") -> bool:
         return self._account == account
 
@@ -1687,7 +1813,7 @@ class RefundTransaction(CashRelatedTransaction):
         if hasattr(self, "_account"):
             if self._account == account:
                 if update_account:
-                    self._account.update_balance()
+                    self._account.update_balance(self)
                 return
             self._account.remove_transaction(self)
         self._account = account
@@ -1,7 +1,8 @@
 import logging
 import operator
-from bisect import bisect_right
-from collections.abc import Collection
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Collection, Iterable, Sequence
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 from functools import total_ordering
@@ -11,12 +12,10 @@ from src.models.mixins.copyable_mixin import CopyableMixin
 from src.models.mixins.json_serializable_mixin import JSONSerializableMixin
 from src.models.user_settings import user_settings
 from src.presenters.utilities.event import Event
+from src.utilities.decimal_history import DecimalHistory
 from src.utilities.formatting import quantizers
 from src.utilities.number_utils import get_decimal_exponent
 
-# IDEA: add CurrencyManager class to take care of Currency cache resets
-# and offload RecordKeeper methods to CurrencyManager
-
 
 class CurrencyError(ValueError):
     """Raised when invalid Currency is supplied."""
@@ -27,15 +26,28 @@ class ConversionFactorNotFoundError(ValueError):
     for the given Currency pair."""
 
 
+@dataclass(frozen=True)
+class FactorCacheInfo:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
 class Currency(CopyableMixin, JSONSerializableMixin):
     __slots__ = (
         "_code",
         "_decimals",
         "_exchange_rates",
         "_factor_cache",
+        "_factor_cache_generation",
+        "_factor_cache_hits",
+        "_factor_cache_misses",
+        "_routes",
         "_zero_amount",
     )
     CODE_LENGTH = 3
+    FACTOR_CACHE_MAX_SIZE = 4096
 
     def __init__(self, code: str, decimals: int) -> None:
         super().__init__()
@@ -53,7 +65,13 @@ class Currency(CopyableMixin, JSONSerializableMixin):
         self._decimals = decimals
 
         self._exchange_rates: dict[Currency, ExchangeRate] = {}
-        self._factor_cache: dict[str, Decimal] = {}
+        self._factor_cache: OrderedDict[tuple[str, date | None], Decimal] = (
+            OrderedDict()
+        )
+        self._factor_cache_generation = 0
+        self._factor_cache_hits = 0
+        self._factor_cache_misses = 0
+        self._routes: dict[Currency, tuple[ExchangeRate, ...]] | None = None
         self._zero_amount: CashAmount = CashAmount(0, self)
 
     @property
@@ -76,6 +94,21 @@ class Currency(CopyableMixin, JSONSerializableMixin):
     def exchange_rates(self) -> dict["Currency", "ExchangeRate"]:
         return self._exchange_rates
 
+    @property
+    def factor_cache_generation(self) -> int:
+        """Incremented whenever the cached conversion factors are invalidated.
+        Values derived from conversion factors are stale once it changes."""
+        return self._factor_cache_generation
+
+    @property
+    def factor_cache_info(self) -> FactorCacheInfo:
+        return FactorCacheInfo(
+            hits=self._factor_cache_hits,
+            misses=self._factor_cache_misses,
+            size=len(self._factor_cache),
+            max_size=Currency.FACTOR_CACHE_MAX_SIZE,
+        )
+
     def __repr__(self) -> str:
         return f"Currency({self._code})"
 
@@ -91,7 +124,7 @@ class Currency(CopyableMixin, JSONSerializableMixin):
         return self._code == __o._code
 
     def add_exchange_rate(self, exchange_rate: "ExchangeRate") -> None:
-        """The class managing Currencies must reset all Currency caches
+        """The class managing Currencies must rebuild its CurrencyGraph
         after this method is called."""
 
         if not isinstance(exchange_rate, ExchangeRate):
@@ -103,36 +136,52 @@ class Currency(CopyableMixin, JSONSerializableMixin):
             )
         other_currency = exchange_rate.currencies - {self}
         self._exchange_rates[other_currency.pop()] = exchange_rate
+        # the new ExchangeRate links both components, so both are reached
+        self._invalidate_routes()
 
     def remove_exchange_rate(self, exchange_rate: "ExchangeRate") -> None:
-        """The class managing Currencies must reset all Currency caches
+        """The class managing Currencies must rebuild its CurrencyGraph
         after this method is called."""
 
         if not isinstance(exchange_rate, ExchangeRate):
             raise TypeError("Parameter 'exchange_rate' must be an ExchangeRate.")
         other_currency = exchange_rate.currencies - {self}
+        # the component is walked while the ExchangeRate still links it together
+        self._invalidate_routes()
         del self._exchange_rates[other_currency.pop()]
 
     def reset_cache(self) -> None:
-        self._factor_cache = {}
+        """Invalidates all cached conversion factors. Hit and miss counts
+        are kept."""
+        self._factor_cache.clear()
+        self._factor_cache_generation += 1
+
+    def reset_connected_caches(self) -> None:
+        """Invalidates the cached conversion factors of every Currency connected
+        to this one, as any of them may convert through a changed ExchangeRate."""
+        for currency in self._get_connected_currencies():
+            currency.reset_cache()
 
     def get_conversion_factor(
         self, target_currency: Self, date_: date | None = None
     ) -> Decimal:
-        cache_key = f"{self._code}/{target_currency.code}"
-        # try to get conversion factor from cache
-        if date_ is None:
-            factor = self._factor_cache.get(cache_key)
-            if factor is not None:
-                return factor
-            reversed_cache_key = f"{target_currency.code}/{self._code}"
-            factor = target_currency._factor_cache.get(  # noqa: SLF001
-                reversed_cache_key
-            )
-            if factor is not None:
-                return 1 / factor
-
-        exchange_rates = Currency._get_exchange_rates(self, target_currency)
+        # try to get conversion factor from cache (latest factor is keyed by None)
+        cache_key = (target_currency.code, date_)
+        factor = self._factor_cache.get(cache_key)
+        if factor is not None:
+            self._factor_cache.move_to_end(cache_key)
+            self._factor_cache_hits += 1
+            return factor
+        reversed_key = (self._code, date_)
+        reversed_cache = target_currency._factor_cache  # noqa: SLF001
+        reversed_factor = reversed_cache.get(reversed_key)
+        if reversed_factor is not None:
+            reversed_cache.move_to_end(reversed_key)
+            self._factor_cache_hits += 1
+            return 1 / reversed_factor
+        self._factor_cache_misses += 1
+
+        exchange_rates = self._get_route(target_currency)
         if exchange_rates is None:
             logging.warning(
                 f"No path from {self._code} to {target_currency.code} found."
@@ -155,42 +204,39 @@ class Currency(CopyableMixin, JSONSerializableMixin):
             else:
                 rate = exchange_rate.get_rate(date_)
             factor = operation(factor, rate)
-        if date_ is None:
-            self._factor_cache[cache_key] = factor
+        self._factor_cache[cache_key] = factor
+        if len(self._factor_cache) > Currency.FACTOR_CACHE_MAX_SIZE:
+            self._factor_cache.popitem(last=False)
         return factor
 
-    @staticmethod
-    def _get_exchange_rates(
-        current_currency: "Currency",
-        target_currency: "Currency",
-        ignore_currencies: set["Currency"] | None = None,
-    ) -> list["ExchangeRate"] | None:
-        if ignore_currencies is None:
-            ignore_currencies = {current_currency}
-
-        if target_currency in current_currency.convertible_to:
-            # Direct ExchangeRate found!
-            return [current_currency.exchange_rates[target_currency]]
-
-        # Direct ExchangeRate not found...get unexplored currencies to iterate over
-        iterable_currencies = [
-            currency
-            for currency in current_currency.convertible_to
-            if currency not in ignore_currencies
-        ]
-        # Ignore these currencies in future deeper searches (no need to go back)
-        ignore_currencies = ignore_currencies | current_currency.convertible_to
-        for loop_currency in iterable_currencies:
-            exchange_rates = Currency._get_exchange_rates(
-                loop_currency, target_currency, ignore_currencies
-            )
-            if exchange_rates is None:
-                continue  # Reached a dead end.
-            # ExchangeRate to target_currency found!
-            # Append ExchangeRate needed to get there from the current_currency
-            exchange_rates.insert(0, current_currency.exchange_rates[loop_currency])
-            return exchange_rates
-        return None  # Reached a dead-end.
+    def _invalidate_routes(self) -> None:
+        """Drops the cached routes of every Currency connected to this one, as
+        any of them may route through the changed ExchangeRate."""
+
+        for currency in self._get_connected_currencies():
+            currency._routes = None  # noqa: SLF001
+
+    def _get_connected_currencies(self) -> list["Currency"]:
+        """Returns this Currency and all Currencies reachable from it."""
+
+        connected = [self]
+        visited = {self}
+        queue = deque((self,))
+        while queue:
+            currency = queue.popleft()
+            for other_currency in currency._exchange_rates:  # noqa: SLF001
+                if other_currency not in visited:
+                    visited.add(other_currency)
+                    connected.append(other_currency)
+                    queue.append(other_currency)
+        return connected
+
+    def _get_route(
+        self, target_currency: "Currency"
+    ) -> tuple["ExchangeRate", ...] | None:
+        if self._routes is None:
+            self._routes = CurrencyGraph.find_routes(self)
+        return self._routes.get(target_currency)
 
     def serialize(self) -> dict:
         return {
@@ -211,10 +257,10 @@ class ExchangeRate(CopyableMixin):
         "_latest_rate",
         "_primary_currency",
         "_rate_decimals",
+        "_rate_exponent_counts",
         "_rate_history",
-        "_rate_history_pairs",
-        "_recalculate_rate_history_pairs",
         "_secondary_currency",
+        "event_rates_changed",
         "event_reset_currency_caches",
     )
 
@@ -233,11 +279,11 @@ class ExchangeRate(CopyableMixin):
         self._primary_currency.add_exchange_rate(self)
         self._secondary_currency.add_exchange_rate(self)
 
-        self._rate_history: dict[date, Decimal] = {}
-        self._rate_history_pairs: tuple[tuple[date, Decimal], ...] = ()
+        self._rate_history = DecimalHistory()
+        self._rate_exponent_counts: defaultdict[int, int] = defaultdict(int)
         self._rate_decimals = 0
-        self._recalculate_rate_history_pairs = False
 
+        self.event_rates_changed = Event()
         self.event_reset_currency_caches = Event()
 
     @property
@@ -253,17 +299,12 @@ class ExchangeRate(CopyableMixin):
         return {self._primary_currency, self._secondary_currency}
 
     @property
-    def rate_history(self) -> dict[date, Decimal]:
+    def rate_history(self) -> DecimalHistory:
         return self._rate_history
 
     @property
     def rate_history_pairs(self) -> tuple[tuple[date, Decimal], ...]:
-        if self._recalculate_rate_history_pairs:
-            pairs: list[tuple[date, Decimal]] = list(self._rate_history.items())
-            pairs.sort(key=lambda x: x[0])
-            self._rate_history_pairs = tuple(pairs)
-            self._recalculate_rate_history_pairs = False
-        return self._rate_history_pairs
+        return tuple(self._rate_history.iter_pairs())
 
     @property
     def rate_decimals(self) -> int:
@@ -302,26 +343,40 @@ class ExchangeRate(CopyableMixin):
         try:
             return self._rate_history[date_]
         except KeyError:
-            index = bisect_right(self.rate_history_pairs, date_, key=lambda x: x[0])
-            if index:
-                _, rate = self._rate_history_pairs[index - 1]
-                return rate
-            if len(self._rate_history_pairs) >= 1:
-                _date, rate = self._rate_history_pairs[0]
+            return self.get_rates((date_,))[0]
+
+    def get_rates(self, dates: Sequence[date]) -> list[Decimal]:
+        """Returns the rates valid on given dates. Dates without a rate get
+        the latest earlier rate."""
+
+        if len(self._rate_history) == 0:
+            logging.warning(f"{self!s}: no rate found, returning 'NaN'")
+            return [Decimal("NaN")] * len(dates)
+        history = self._rate_history
+        # each rate is materialized once, however many dates share it
+        rates_by_index: dict[int, Decimal] = {}
+        rates: list[Decimal] = []
+        for date_, index in zip(dates, history.latest_indexes(dates), strict=True):
+            if index < 0:
                 logging.warning(
-                    f"{self!s}: no earlier rate found for {date_}, "
-                    f"returning {rate} for {_date}"
+                    f"{self!s}: no earlier rate found for {date_}, returning "
+                    f"{history.value_at(0)} for {history.date_at(0)}"
                 )
-                return rate
-            logging.warning(f"{self!s}: no rate found, returning 'NaN'")
-            return Decimal("NaN")
+            _index = max(index, 0)
+            rate = rates_by_index.get(_index)
+            if rate is None:
+                rate = rates_by_index[_index] = history.value_at(_index)
+            rates.append(rate)
+        return rates
 
     def set_rate(
         self, date_: date, rate: Decimal | int | str, *, update: bool = True
     ) -> None:
         self._validate_date(date_)
         _rate = self._validate_rate(rate)
-        self._rate_history[date_] = _rate.normalize()
+        self._set_rate(date_, _rate.normalize())
+        self._primary_currency.reset_connected_caches()
+        self.event_rates_changed()
         if update:
             self.update_values()
 
@@ -334,12 +389,17 @@ class ExchangeRate(CopyableMixin):
         for date_, rate in date_rate_tuples:
             self._validate_date(date_)
             _rate = self._validate_rate(rate)
-            self._rate_history[date_] = _rate.normalize()
+            self._set_rate(date_, _rate.normalize())
+        self._primary_currency.reset_connected_caches()
+        self.event_rates_changed()
         if update:
             self.update_values()
 
     def delete_rate(self, date_: date, *, update: bool = True) -> None:
-        del self._rate_history[date_]
+        rate = self._rate_history.pop(date_)
+        self._discount_rate_exponent(rate)
+        self._primary_currency.reset_connected_caches()
+        self.event_rates_changed()
         if update:
             self.update_values()
 
@@ -366,7 +426,7 @@ class ExchangeRate(CopyableMixin):
     def serialize(self) -> dict:
         date_rate_pairs = [
             [date_.strftime("%Y-%m-%d"), str(rate.normalize())]
-            for date_, rate in self.rate_history_pairs
+            for date_, rate in self._rate_history.iter_pairs()
         ]
         return {
             "datatype": "ExchangeRate",
@@ -387,18 +447,34 @@ class ExchangeRate(CopyableMixin):
         secondary = currencies[secondary_code]
 
         obj = ExchangeRate(primary, secondary)
-        for date_, rate in date_rate_pairs:
-            obj.set_rate(
-                datetime.strptime(date_, "%Y-%m-%d")
-                .replace(tzinfo=user_settings.settings.time_zone)
-                .date(),
-                rate,
-                update=False,
-            )
+        obj.set_rates(
+            [
+                (
+                    datetime.strptime(date_, "%Y-%m-%d")
+                    .replace(tzinfo=user_settings.settings.time_zone)
+                    .date(),
+                    rate,
+                )
+                for date_, rate in date_rate_pairs
+            ],
+            update=False,
+        )
         obj.update_values()
 
         return obj
 
+    def _set_rate(self, date_: date, rate: Decimal) -> None:
+        previous_rate = self._rate_history.set(date_, rate)
+        if previous_rate is not None:
+            self._discount_rate_exponent(previous_rate)
+        self._rate_exponent_counts[get_decimal_exponent(rate)] += 1
+
+    def _discount_rate_exponent(self, rate: Decimal) -> None:
+        exponent = get_decimal_exponent(rate)
+        self._rate_exponent_counts[exponent] -= 1
+        if self._rate_exponent_counts[exponent] == 0:
+            del self._rate_exponent_counts[exponent]
+
     def _validate_date(self, date_: date) -> None:
         if not isinstance(date_, date):
             raise TypeError("Parameter 'date_' must be a date.")
@@ -420,20 +496,63 @@ class ExchangeRate(CopyableMixin):
             self._earliest_date = None
             self._latest_rate = Decimal("NaN")
         else:
-            self._latest_date = max(date_ for date_ in self._rate_history)
-            self._earliest_date = min(date_ for date_ in self._rate_history)
-            self._latest_rate = self._rate_history[self._latest_date]
+            self._earliest_date = self._rate_history.date_at(0)
+            self._latest_date = self._rate_history.date_at(-1)
+            self._latest_rate = self._rate_history.value_at(-1)
 
         self._rate_decimals = min(
-            max(
-                (get_decimal_exponent(rate) for rate in self._rate_history.values()),
-                default=0,
-            ),
+            max(self._rate_exponent_counts, default=0),
             18,  # hard limit to 18 decimals
         )
 
         self.event_reset_currency_caches()
-        self._recalculate_rate_history_pairs = True
+
+
+class CurrencyGraph:
+    """Holds the shortest conversion routes between all pairs of Currencies."""
+
+    __slots__ = ("_currencies",)
+
+    def __init__(self) -> None:
+        self._currencies: tuple[Currency, ...] = ()
+
+    def rebuild(self, currencies: Collection[Currency]) -> None:
+        """Recalculates the routes of all Currencies. Must be called whenever
+        an ExchangeRate is added or removed."""
+
+        self._currencies = tuple(currencies)
+        for currency in self._currencies:
+            currency._routes = CurrencyGraph.find_routes(currency)  # noqa: SLF001
+            currency.reset_cache()
+
+    def reset_caches(self) -> None:
+        for currency in self._currencies:
+            currency.reset_cache()
+
+    def get_route(
+        self, source_currency: Currency, target_currency: Currency
+    ) -> tuple[ExchangeRate, ...] | None:
+        return source_currency._get_route(target_currency)  # noqa: SLF001
+
+    @staticmethod
+    def find_routes(
+        source_currency: Currency,
+    ) -> dict[Currency, tuple[ExchangeRate, ...]]:
+        """Returns the shortest ExchangeRate route from source Currency
+        to every reachable Currency (breadth-first search)."""
+
+        routes: dict[Currency, tuple[ExchangeRate, ...]] = {source_currency: ()}
+        queue = deque((source_currency,))
+        while queue:
+            current_currency = queue.popleft()
+            current_route = routes[current_currency]
+            for currency, exchange_rate in current_currency.exchange_rates.items():
+                if currency in routes:
+                    continue
+                routes[currency] = (*current_route, exchange_rate)
+                queue.append(currency)
+        del routes[source_currency]
+        return routes
 
 
 @total_ordering
@@ -444,6 +563,7 @@ class CashAmount(CopyableMixin):
 
     __slots__ = (
         "_currency",
+        "_minor_units",
         "_raw_value",
         "_str_normalized",
         "_str_rounded",
@@ -505,6 +625,24 @@ class CashAmount(CopyableMixin):
                 )
         return self._value_normalized
 
+    @property
+    def minor_units(self) -> int | None:
+        """Integer value in the smallest units of the Currency (e.g. cents).
+        None unless the value is stored with exactly Currency.decimals places."""
+        if not hasattr(self, "_minor_units"):
+            decimals = self._currency.decimals
+            raw_value = self._raw_value
+            if (
+                raw_value.is_finite()
+                and raw_value.as_tuple().exponent == -decimals
+                and not (raw_value.is_zero() and raw_value.is_signed())
+            ):
+                numerator, denominator = raw_value.as_integer_ratio()
+                self._minor_units: int | None = numerator * 10**decimals // denominator
+            else:
+                self._minor_units = None
+        return self._minor_units
+
     @property
     def currency(self) -> Currency:
         return self._currency
@@ -676,6 +814,21 @@ class CashAmount(CopyableMixin):
     def serialize(self) -> str:
         return f"{self.value_normalized} {self._currency.code}"
 
+    @staticmethod
+    def from_minor_units(units: int, currency: Currency) -> "CashAmount":
+        """Creates a CashAmount from an integer value in the smallest units of the
+        Currency. The value has exactly Currency.decimals decimal places."""
+        if not isinstance(units, int) or isinstance(units, bool):
+            raise TypeError("Parameter 'units' must be an integer.")
+        if not isinstance(currency, Currency):
+            raise TypeError("CashAmount.currency must be a Currency.")
+        sign, digits, _ = Decimal(units).as_tuple()
+        obj = object.__new__(CashAmount)
+        obj._raw_value = Decimal((sign, digits, -currency.decimals))
+        obj._currency = currency
+        obj._minor_units = units
+        return obj
+
     @staticmethod
     def deserialize(
         cash_amount_string: str, currencies: dict[str, Currency]
@@ -683,3 +836,109 @@ class CashAmount(CopyableMixin):
         value, _, currency_code = cash_amount_string.partition(" ")
         currency = currencies[currency_code]
         return CashAmount(value, currency)
+
+
+class CashAccumulator:
+    """A mutable running total of CashAmounts of a single Currency.
+    The result CashAmount is created only when requested."""
+
+    __slots__ = ("_amount", "_currency", "_value")
+
+    def __init__(self, initial_amount: CashAmount) -> None:
+        if not isinstance(initial_amount, CashAmount):
+            raise TypeError("Parameter 'initial_amount' must be a CashAmount.")
+        self._currency = initial_amount._currency  # noqa: SLF001
+        self._value = initial_amount._raw_value  # noqa: SLF001
+        self._amount: CashAmount | None = initial_amount
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    def __repr__(self) -> str:
+        return f"CashAccumulator({self.to_cash_amount().to_str_normalized()})"
+
+    def add(self, amount: CashAmount) -> None:
+        currency = amount._currency  # noqa: SLF001
+        if currency is not self._currency and currency != self._currency:
+            raise CurrencyError("CashAmount.currency of operands must match.")
+        self._value += amount._raw_value  # noqa: SLF001
+        self._amount = None
+
+    def subtract(self, amount: CashAmount) -> None:
+        currency = amount._currency  # noqa: SLF001
+        if currency is not self._currency and currency != self._currency:
+            raise CurrencyError("CashAmount.currency of operands must match.")
+        self._value -= amount._raw_value  # noqa: SLF001
+        self._amount = None
+
+    def add_value(self, value: Decimal) -> None:
+        """Adds a raw value which is already in the accumulator Currency."""
+        self._value += value
+        self._amount = None
+
+    def to_cash_amount(self) -> CashAmount:
+        if self._amount is None:
+            obj = object.__new__(CashAmount)
+            obj._raw_value = self._value
+            obj._currency = self._currency
+            self._amount = obj
+        return self._amount
+
+
+class MultiCurrencyAccumulator:
+    """A mutable running total of CashAmounts, kept separately per Currency."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self) -> None:
+        self._values: dict[Currency, Decimal] = {}
+
+    def __repr__(self) -> str:
+        return f"MultiCurrencyAccumulator({len(self._values)} currencies)"
+
+    def add(self, amount: CashAmount) -> None:
+        currency = amount._currency  # noqa: SLF001
+        value = self._values.get(currency)
+        if value is None:
+            self._values[currency] = amount._raw_value  # noqa: SLF001
+        else:
+            self._values[currency] = value + amount._raw_value  # noqa: SLF001
+
+    def to_cash_amounts(self) -> tuple[CashAmount, ...]:
+        """Returns one CashAmount per Currency, in order of first addition."""
+        amounts: list[CashAmount] = []
+        for currency, value in self._values.items():
+            obj = object.__new__(CashAmount)
+            obj._raw_value = value
+            obj._currency = currency
+            amounts.append(obj)
+        return tuple(amounts)
+
+
+def convert_many(
+    amounts_with_dates: Iterable[tuple[CashAmount, date | None]],
+    target_currency: Currency,
+) -> list[Decimal]:
+    """Returns raw values of CashAmounts converted to target Currency. Each
+    conversion factor is calculated only once per (Currency, date) pair."""
+
+    factors: dict[tuple[Currency, date | None], Decimal] = {}
+    zero_value = target_currency.zero_amount._raw_value  # noqa: SLF001
+    values: list[Decimal] = []
+    for amount, date_ in amounts_with_dates:
+        currency = amount._currency  # noqa: SLF001
+        raw_value = amount._raw_value  # noqa: SLF001
+        if currency == target_currency:
+            values.append(raw_value)
+            continue
+        if raw_value == 0:
+            values.append(zero_value)
+            continue
+        key = (currency, date_)
+        factor = factors.get(key)
+        if factor is None:
+            factor = currency.get_conversion_factor(target_currency, date_)
+            factors[key] = factor
+        values.append(raw_value * factor)
+    return values
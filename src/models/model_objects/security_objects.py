@@ -2,12 +2,13 @@ import copy
 import logging
 import string
 from abc import ABC, abstractmethod
-from bisect import bisect_right
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from collections.abc import Collection
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from enum import Enum, auto
+from operator import attrgetter
 from types import NoneType
 from typing import Any
 from uuid import UUID
@@ -29,6 +30,7 @@ from src.models.model_objects.currency_objects import (
 )
 from src.models.user_settings import user_settings
 from src.presenters.utilities.event import Event
+from src.utilities.decimal_history import DecimalHistory
 from src.utilities.number_utils import get_decimal_exponent
 
 
@@ -49,6 +51,32 @@ class SharesType(Enum):
     PAID_DIVIDEND = auto()
 
 
+class PriceHistoryView(Mapping[date, CashAmount]):
+    """A read-only mapping of dates to Security prices. CashAmounts are created
+    on access from the compact DecimalHistory."""
+
+    __slots__ = ("_currency", "_history")
+
+    def __init__(self, history: DecimalHistory, currency: Currency) -> None:
+        self._history = history
+        self._currency = currency
+
+    def __repr__(self) -> str:
+        return f"PriceHistoryView(len={len(self._history)})"
+
+    def __len__(self) -> int:
+        return len(self._history)
+
+    def __iter__(self) -> Iterator[date]:
+        return iter(self._history)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._history
+
+    def __getitem__(self, key: date) -> CashAmount:
+        return CashAmount(self._history[key], self._currency)
+
+
 class Security(CopyableMixin, NameMixin, UUIDMixin):
     __slots__ = (
         "_allow_colon",
@@ -59,14 +87,14 @@ class Security(CopyableMixin, NameMixin, UUIDMixin):
         "_latest_price",
         "_name",
         "_price_decimals",
+        "_price_exponent_counts",
         "_price_history",
-        "_price_history_pairs",
-        "_recalculate_price_history_pairs",
         "_shares_decimals",
         "_symbol",
         "_type",
         "_uuid",
         "event_price_updated",
+        "event_prices_changed",
     )
 
     NAME_MIN_LENGTH = 1
@@ -105,11 +133,11 @@ class Security(CopyableMixin, NameMixin, UUIDMixin):
             )
         self._shares_decimals = shares_decimals
 
-        self._price_history: dict[date, CashAmount] = {}
-        self._price_history_pairs: tuple[tuple[date, CashAmount], ...] = ()
+        self._price_history = DecimalHistory()
+        self._price_exponent_counts: defaultdict[int, int] = defaultdict(int)
         self._price_decimals = 0
-        self._recalculate_price_history_pairs = False
         self.event_price_updated = Event()
+        self.event_prices_changed = Event()
 
     @property
     def type_(self) -> str:
@@ -171,21 +199,27 @@ class Security(CopyableMixin, NameMixin, UUIDMixin):
         return None
 
     @property
-    def price_history(self) -> dict[date, CashAmount]:
+    def price_history(self) -> PriceHistoryView:
+        return PriceHistoryView(self._price_history, self._currency)
+
+    @property
+    def decimal_price_history(self) -> DecimalHistory:
         return self._price_history
 
     @property
     def price_history_pairs(self) -> tuple[tuple[date, CashAmount], ...]:
-        if self._recalculate_price_history_pairs:
-            pairs = sorted(self._price_history.items())
-            self._price_history_pairs = tuple(pairs)
-            self._recalculate_price_history_pairs = False
-        return self._price_history_pairs
+        currency = self._currency
+        return tuple(
+            (date_, CashAmount(value, currency))
+            for date_, value in self._price_history.iter_pairs()
+        )
 
     @property
     def decimal_price_history_pairs(self) -> tuple[tuple[date, Decimal], ...]:
+        currency = self._currency
         return tuple(
-            (date_, price.value_normalized) for date_, price in self.price_history_pairs
+            (date_, CashAmount(value, currency).value_normalized)
+            for date_, value in self._price_history.iter_pairs()
         )
 
     @property
@@ -206,19 +240,41 @@ class Security(CopyableMixin, NameMixin, UUIDMixin):
         if date_ is None:
             return self.price
         try:
-            return self._price_history[date_]
+            return CashAmount(self._price_history[date_], self._currency)
         except KeyError:
-            index = bisect_right(self.price_history_pairs, date_, key=lambda x: x[0])
-            if index:  # zero if date_ is earliest or history is empty
-                _, price = self.price_history_pairs[index - 1]
-                return price
+            return self.get_prices((date_,))[0]
+
+    def get_prices(self, dates: Sequence[date]) -> list[CashAmount]:
+        """Returns the prices valid on given dates. Dates without a price get
+        the latest earlier price, or NaN if there is none."""
+
+        if len(self._price_history) == 0:
             logging.warning(f"{self!s}: no price found, returning CashAmount('NaN')")
-            return CashAmount(Decimal("NaN"), self._currency)
+            return [CashAmount(Decimal("NaN"), self._currency)] * len(dates)
+        history = self._price_history
+        # each price is materialized once, however many dates share it
+        prices_by_index: dict[int, CashAmount] = {}
+        prices: list[CashAmount] = []
+        for index in history.latest_indexes(dates):
+            if index < 0:
+                logging.warning(
+                    f"{self!s}: no price found, returning CashAmount('NaN')"
+                )
+                prices.append(CashAmount(Decimal("NaN"), self._currency))
+                continue
+            price = prices_by_index.get(index)
+            if price is None:
+                price = prices_by_index[index] = CashAmount(
+                    history.value_at(index), self._currency
+                )
+            prices.append(price)
+        return prices
 
     def set_price(self, date_: date, price: CashAmount, *, update: bool = True) -> None:
         self._validate_date(date_)
         self._validate_price(price)
-        self._price_history[date_] = price
+        self._set_price(date_, price)
+        self.event_prices_changed()
         if update:
             self.update_values()
 
@@ -231,12 +287,15 @@ class Security(CopyableMixin, NameMixin, UUIDMixin):
         for date_, price in date_price_tuples:
             self._validate_date(date_)
             self._validate_price(price)
-            self._price_history[date_] = price
+            self._set_price(date_, price)
+        self.event_prices_changed()
         if update:
             self.update_values()
 
     def delete_price(self, date_: date, *, update: bool = True) -> None:
-        del self._price_history[date_]
+        value = self._price_history.pop(date_)
+        self._discount_price_exponent(value)
+        self.event_prices_changed()
         if update:
             self.update_values()
 
@@ -260,9 +319,9 @@ class Security(CopyableMixin, NameMixin, UUIDMixin):
         date_price_pairs = [
             (
                 date_.strftime("%Y-%m-%d"),
-                str(price.value_normalized),
+                str(price),
             )
-            for date_, price in self.price_history_pairs
+            for date_, price in self.decimal_price_history_pairs
         ]
         return {
             "datatype": "Security",
@@ -307,9 +366,9 @@ class Security(CopyableMixin, NameMixin, UUIDMixin):
             self._latest_date = None
             latest_price = CashAmount(Decimal("NaN"), self._currency)
         else:
-            self._earliest_date = min(date_ for date_ in self._price_history)
-            self._latest_date = max(date_ for date_ in self._price_history)
-            latest_price = self._price_history[self._latest_date]
+            self._earliest_date = self._price_history.date_at(0)
+            self._latest_date = self._price_history.date_at(-1)
+            latest_price = CashAmount(self._price_history.value_at(-1), self._currency)
 
         previous_latest_price = (
             self._latest_price if hasattr(self, "_latest_price") else None
@@ -318,15 +377,24 @@ class Security(CopyableMixin, NameMixin, UUIDMixin):
         if previous_latest_price != latest_price:
             self.event_price_updated()
 
-        self._price_decimals = max(
-            (
-                get_decimal_exponent(price.value_normalized)
-                for price in self._price_history.values()
-            ),
-            default=0,
+        self._price_decimals = max(self._price_exponent_counts, default=0)
+
+    def _set_price(self, date_: date, price: CashAmount) -> None:
+        exponent = get_decimal_exponent(price.value_normalized)
+        previous_value = self._price_history.set(
+            date_, price._raw_value  # noqa: SLF001
         )
+        if previous_value is not None:
+            self._discount_price_exponent(previous_value)
+        self._price_exponent_counts[exponent] += 1
 
-        self._recalculate_price_history_pairs = True
+    def _discount_price_exponent(self, value: Decimal) -> None:
+        exponent = get_decimal_exponent(
+            CashAmount(value, self._currency).value_normalized
+        )
+        self._price_exponent_counts[exponent] -= 1
+        if self._price_exponent_counts[exponent] == 0:
+            del self._price_exponent_counts[exponent]
 
     def _validate_date(self, date_: date) -> None:
         if not isinstance(date_, date):
@@ -339,6 +407,35 @@ class Security(CopyableMixin, NameMixin, UUIDMixin):
             raise CurrencyError("Security.currency and price.currency must match.")
 
 
+class _CostBasis:
+    """Running shares and cost of the acquisitions of a single Security converted
+    to a single Currency, one entry per _ShareLog transaction."""
+
+    __slots__ = ("costs", "generation", "shares")
+
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self.shares: list[Decimal] = []
+        self.costs: list[CashAmount] = []
+
+    def truncate(self, length: int) -> None:
+        del self.shares[length:]
+        del self.costs[length:]
+
+
+class _ShareLog:
+    """Transactions of a single Security within a SecurityAccount in chronological
+    order, together with the running total of shares after each of them."""
+
+    __slots__ = ("cost_bases", "totals", "transactions")
+
+    def __init__(self) -> None:
+        self.transactions: list[SecurityRelatedTransaction] = []
+        self.totals: list[Decimal] = []
+        # lazily extended prefixes, keyed by SecurityTransactionType and Currency
+        self.cost_bases: dict[tuple[SecurityTransactionType, Currency], _CostBasis] = {}
+
+
 class SecurityAccount(Account):
     __slots__ = (
         "_allow_colon",
@@ -346,29 +443,37 @@ class SecurityAccount(Account):
         "_balances",
         "_name",
         "_parent",
+        "_path",
         "_related_securities",
-        "_securities_history",
+        "_securities",
+        "_share_log_securities",
+        "_share_logs",
         "_transactions",
         "_uuid",
         "allow_update_balance",
+        "balance_outdated",
         "event_balance_updated",
     )
 
     def __init__(self, name: str, parent: AccountGroup | None = None) -> None:
         super().__init__(name, parent)
-        self._securities_history: list[tuple[datetime, dict[Security, Decimal]]] = []
+        # transactions are kept sorted by timestamp while allow_update_balance is True
         self._transactions: list[SecurityRelatedTransaction] = []
+        self._share_logs: dict[Security, _ShareLog] = {}
+        # Security under whose _ShareLog each transaction is recorded
+        self._share_log_securities: dict[SecurityRelatedTransaction, Security] = {}
+        self._securities: dict[Security, Decimal] = {}
         self._related_securities: frozenset[Security] = frozenset()
 
         # allow_update_balance attribute is used to block updating the balance
-        # when a transaction is added or removed during deserialization
+        # when a transaction is added or removed during deserialization,
+        # balance_outdated marks that an update was blocked since the last rebuild
         self.allow_update_balance = True
+        self.balance_outdated = False
 
     @property
     def securities(self) -> dict[Security, Decimal]:
-        if len(self._securities_history) == 0:
-            return {}
-        return copy.copy(self._securities_history[-1][1])
+        return copy.copy(self._securities)
 
     @property
     def transactions(self) -> tuple["SecurityRelatedTransaction", ...]:
@@ -391,15 +496,18 @@ class SecurityAccount(Account):
                 (balance.convert(currency) for balance in self._balances),
                 start=currency.zero_amount,
             )
-        index = bisect_right(self._securities_history, date_, key=lambda x: x[0].date())
-        if index:
-            _, security_dict = self._securities_history[index - 1]
-            balances = self._calculate_balances(security_dict, date_)
-            return sum(
-                (balance.convert(currency, date_) for balance in balances),
-                start=currency.zero_amount,
-            )
-        return currency.zero_amount
+        if len(self._transactions) == 0 or self._transactions[0].date_ > date_:
+            return currency.zero_amount
+        security_dict: dict[Security, Decimal] = {}
+        for security, log in self._share_logs.items():
+            index = bisect_right(log.transactions, date_, key=attrgetter("date_"))
+            if index and not log.totals[index - 1].is_zero():
+                security_dict[security] = log.totals[index - 1]
+        balances = self._calculate_balances(security_dict, date_)
+        return sum(
+            (balance.convert(currency, date_) for balance in balances),
+            start=currency.zero_amount,
+        )
 
     def get_shares_for_datetime(
         self, security: Security, datetime_: datetime | None = None
@@ -410,26 +518,26 @@ class SecurityAccount(Account):
         precedes SecurityAccount history."""
 
         if datetime_ is None:
-            if security in self.securities:
-                return self.securities[security]
+            if security in self._securities:
+                return self._securities[security]
             raise ValueError(
                 f"Security '{security.name}' not found in this SecurityAccount."
             )
-        index = bisect_right(self._securities_history, datetime_, key=lambda x: x[0])
-        if index:
-            _, security_dict = self._securities_history[index - 1]
-            if security in security_dict:
-                return security_dict[security]
-            raise ValueError(
-                f"Security '{security.name}' not found in this SecurityAccount."
+        if len(self._transactions) == 0 or self._transactions[0].datetime_ > datetime_:
+            raise ValueError("Datetime not found in SecurityAccount history.")
+        log = self._share_logs.get(security)
+        if log is not None:
+            index = bisect_right(
+                log.transactions, datetime_.timestamp(), key=attrgetter("timestamp")
             )
-        raise ValueError("Datetime not found in SecurityAccount history.")
+            if index and not log.totals[index - 1].is_zero():
+                return log.totals[index - 1]
+        raise ValueError(
+            f"Security '{security.name}' not found in this SecurityAccount."
+        )
 
     def _update_balances(self) -> None:
-        if len(self._securities_history) == 0:
-            self._balances = ()
-        else:
-            self._balances = self._calculate_balances(self._securities_history[-1][1])
+        self._balances = self._calculate_balances(self._securities)
         self.event_balance_updated()
 
     @staticmethod
@@ -447,54 +555,211 @@ class SecurityAccount(Account):
 
     def add_transaction(self, transaction: "SecurityRelatedTransaction") -> None:
         self._validate_transaction(transaction)
-        self._transactions.append(transaction)
         if self.allow_update_balance:
-            self.update_securities()
+            self._insert_transaction(transaction)
+            self._update_holdings()
+        else:
+            self._transactions.append(transaction)
+            self.balance_outdated = True
 
     def remove_transaction(self, transaction: "SecurityRelatedTransaction") -> None:
         self._validate_transaction(transaction)
-        self._transactions.remove(transaction)
-        if self.allow_update_balance:
+        if self.allow_update_balance and transaction in self._share_log_securities:
+            self._remove_transaction(transaction)
+            self._update_holdings()
+        else:
+            self._transactions.remove(transaction)
             self.update_securities()
 
-    def update_securities(self) -> None:
-        if len(self._securities_history) != 0:
-            for security in self._securities_history[-1][1]:
-                if self._update_balances in security.event_price_updated:
-                    security.event_price_updated.remove(self._update_balances)
+    def update_securities(
+        self, transaction: "SecurityRelatedTransaction | None" = None
+    ) -> None:
+        """Updates the shares history. If a transaction is given, only its entry
+        is moved to its new position (e.g. after its datetime, Security or shares
+        were edited). Otherwise the whole history is rebuilt. While
+        allow_update_balance is False, the update is skipped and the SecurityAccount
+        is marked as balance_outdated."""
+
+        if not self.allow_update_balance:
+            self.balance_outdated = True
+            return
+
+        if transaction is not None and transaction in self._share_log_securities:
+            self._remove_transaction(transaction)
+            self._insert_transaction(transaction)
+            self._update_holdings()
+            return
 
-        self._securities_history.clear()
         self._transactions.sort(key=lambda x: x.timestamp)
-        for i, transaction in enumerate(self._transactions):
-            if transaction.datetime_ == self._transactions[i - 1].datetime_ and i > 0:
-                new_datetime = transaction.datetime_ + timedelta(seconds=1)
-                transaction.set_attributes(
+        for i, transaction_ in enumerate(self._transactions):
+            if transaction_.datetime_ == self._transactions[i - 1].datetime_ and i > 0:
+                new_datetime = transaction_.datetime_ + timedelta(seconds=1)
+                transaction_.set_attributes(
                     datetime_=new_datetime, block_account_update=True
                 )
 
-        related_securities = set()
-        for transaction in self._transactions:
-            security_dict = (
-                defaultdict(lambda: Decimal(0))
-                if len(self._securities_history) == 0
-                else copy.copy(self._securities_history[-1][1])
-            )
-            security_dict[transaction.security] += transaction.get_shares(self)
-            security_dict = defaultdict(
-                lambda: Decimal(0),
-                {
-                    key: value
-                    for key, value in security_dict.items()
-                    if not value.is_zero()
-                },
-            )
-            self._securities_history.append((transaction.datetime_, security_dict))
-            related_securities.add(transaction.security)
+        self._share_logs = {}
+        self._share_log_securities = {}
+        for transaction_ in self._transactions:
+            log = self._share_logs.setdefault(transaction_.security, _ShareLog())
+            log.transactions.append(transaction_)
+            self._share_log_securities[transaction_] = transaction_.security
+        for log in self._share_logs.values():
+            log.totals = [Decimal(0)] * len(log.transactions)
+            self._accumulate_shares(log, 0)
+        self._invalidate_recipient_cost_bases(self._transactions)
+        self._update_holdings()
+        self.balance_outdated = False
+
+    def _insert_transaction(self, transaction: "SecurityRelatedTransaction") -> None:
+        if self.is_datetime_taken(transaction):
+            # transactions must not share the same datetime in any of their Accounts
+            transaction.settle_datetime()
+        transactions = self._transactions
+        key = attrgetter("timestamp")
+        index = bisect_left(transactions, transaction.timestamp, key=key)
+        transactions.insert(index, transaction)
+
+        security = transaction.security
+        log = self._share_logs.setdefault(security, _ShareLog())
+        index = bisect_right(log.transactions, transaction.timestamp, key=key)
+        log.transactions.insert(index, transaction)
+        log.totals.insert(index, Decimal(0))
+        self._accumulate_shares(log, index)
+        self._invalidate_cost_bases(log, index)
+        self._share_log_securities[transaction] = security
+
+    def is_datetime_taken(self, transaction: "SecurityRelatedTransaction") -> bool:
+        if self.balance_outdated:
+            # the transactions are not sorted until the history is rebuilt
+            return False
+        transactions = self._transactions
+        index = bisect_left(
+            transactions, transaction.timestamp, key=attrgetter("timestamp")
+        )
+        while (
+            index < len(transactions)
+            and transactions[index].timestamp == transaction.timestamp
+        ):
+            if transactions[index] is not transaction:
+                return True
+            index += 1
+        return False
+
+    def move_transaction(self, transaction: "SecurityRelatedTransaction") -> None:
+        if self.allow_update_balance and transaction in self._share_log_securities:
+            self.update_securities(transaction)
 
-        if len(self._securities_history) != 0:
-            for security in self._securities_history[-1][1]:
-                security.event_price_updated.append(self._update_balances)
-        self._related_securities = frozenset(related_securities)
+    def replay_transactions(
+        self, transactions: Collection["SecurityRelatedTransaction"]
+    ) -> None:
+        """Moves, adds or removes the entries of given transactions, which were
+        edited while allow_update_balance was False. Other transactions must not
+        have been changed in the meantime."""
+
+        replayed = set(transactions)
+        starts: dict[Security, int] = {}
+        for transaction in replayed:
+            if transaction not in self._share_log_securities:
+                continue
+            security = self._share_log_securities.pop(transaction)
+            log = self._share_logs[security]
+            index = log.transactions.index(transaction)
+            del log.transactions[index]
+            del log.totals[index]
+            starts[security] = min(index, starts.get(security, index))
+        # the remaining transactions all belong here, so they are accumulated
+        # only once all replayed ones are out
+        for security, start in starts.items():
+            log = self._share_logs[security]
+            if len(log.transactions) == 0:
+                del self._share_logs[security]
+            else:
+                self._accumulate_shares(log, start)
+                self._invalidate_cost_bases(log, start)
+        # the replayed transactions may sit at stale positions, so all of them
+        # are taken out before any is inserted again
+        present = [
+            transaction for transaction in self._transactions if transaction in replayed
+        ]
+        self._transactions = [
+            transaction
+            for transaction in self._transactions
+            if transaction not in replayed
+        ]
+        self.balance_outdated = False
+        for transaction in present:
+            self._insert_transaction(transaction)
+        self._update_holdings()
+
+    def _remove_transaction(self, transaction: "SecurityRelatedTransaction") -> None:
+        self._transactions.remove(transaction)
+
+        security = self._share_log_securities.pop(transaction)
+        log = self._share_logs[security]
+        index = log.transactions.index(transaction)
+        del log.transactions[index]
+        del log.totals[index]
+        if len(log.transactions) == 0:
+            del self._share_logs[security]
+        else:
+            self._accumulate_shares(log, index)
+            self._invalidate_cost_bases(log, index)
+
+    def _accumulate_shares(self, log: _ShareLog, start: int) -> None:
+        total = log.totals[start - 1] if start > 0 else Decimal(0)
+        for index in range(start, len(log.transactions)):
+            total += log.transactions[index].get_shares(self)
+            log.totals[index] = total
+
+    def update_cost_basis(self, transaction: "SecurityRelatedTransaction") -> None:
+        """Drops the cached average amounts per share which depend on the given
+        transaction (e.g. after its amount per share was edited)."""
+
+        if not self.allow_update_balance:
+            self.balance_outdated = True
+            return
+
+        log = self._share_logs.get(transaction.security)
+        if log is not None:
+            index = bisect_left(
+                log.transactions, transaction.timestamp, key=attrgetter("timestamp")
+            )
+            self._invalidate_cost_bases(log, index)
+
+    def _invalidate_cost_bases(self, log: _ShareLog, start: int) -> None:
+        if all(len(basis.shares) <= start for basis in log.cost_bases.values()):
+            # nothing cached from start onwards, so no recipient depends on it
+            return
+        for basis in log.cost_bases.values():
+            basis.truncate(start)
+        self._invalidate_recipient_cost_bases(log.transactions[start:])
+
+    def _invalidate_recipient_cost_bases(
+        self, transactions: Iterable["SecurityRelatedTransaction"]
+    ) -> None:
+        for transaction in transactions:
+            if isinstance(transaction, SecurityTransfer) and transaction.sender is self:
+                transaction.recipient.update_cost_basis(transaction)
+
+    def _update_holdings(self) -> None:
+        """Updates the latest shares, related Securities and balances."""
+
+        for security in self._securities:
+            if self._update_balances in security.event_price_updated:
+                security.event_price_updated.remove(self._update_balances)
+
+        self._securities = defaultdict(
+            lambda: Decimal(0),
+            {
+                security: log.totals[-1]
+                for security, log in self._share_logs.items()
+                if not log.totals[-1].is_zero()
+            },
+        )
+        for security in self._securities:
+            security.event_price_updated.append(self._update_balances)
+        self._related_securities = frozenset(self._share_logs)
         self._update_balances()
 
     def serialize(self) -> dict[str, Any]:
@@ -538,65 +803,78 @@ class SecurityAccount(Account):
             raise TypeError("Parameter 'datetime_' must be a datetime or None.")
         if not isinstance(currency, (Currency, NoneType)):
             raise TypeError("Parameter 'currency' must be a Currency or None.")
-        if datetime_ is None and (
-            len(self._securities_history) == 0
-            or security not in self._related_securities
-        ):
+        if datetime_ is None and security not in self._related_securities:
             raise ValueError(
                 f"Security {security.name} is not related to this SecurityAccount."
             )
-        if datetime_ is not None:
-            for _datetime, security_dict in reversed(self._securities_history):
-                if _datetime <= datetime_ and security in security_dict:
-                    break  # OK
-            else:
-                raise ValueError(
-                    f"Security {security.name} is not in this SecurityAccount."
-                )
-
         if currency is None:
             currency = security.currency
 
-        shares_price_pairs: list[tuple[Decimal, CashAmount]] = []
-        for transaction in self._transactions:
-            _transaction_datetime = transaction.datetime_
-            if transaction.security != security:
-                continue
-            if datetime_ is not None and _transaction_datetime > datetime_:
-                continue
-            if (
-                isinstance(transaction, SecurityTransaction)
-                and transaction.type_ == type_
-            ):
-                amount = transaction.amount_per_share
-            elif (
-                isinstance(transaction, SecurityTransfer)
-                and transaction.recipient == self
-                and type_ == SecurityTransactionType.BUY
-            ):
-                amount = transaction.sender.get_average_amount_per_share(
-                    security, _transaction_datetime, currency, type_
+        log = self._share_logs.get(security, _ShareLog())
+        if datetime_ is None:
+            index = len(log.transactions)
+        else:
+            index = bisect_right(
+                log.transactions, datetime_.timestamp(), key=attrgetter("timestamp")
+            )
+            # the Security must have been held at some point up to datetime_
+            if all(total.is_zero() for total in log.totals[:index]):
+                raise ValueError(
+                    f"Security {security.name} is not in this SecurityAccount."
                 )
-            else:
-                continue
-            try:
-                amount_ = amount.convert(currency, _transaction_datetime.date())
-            except ConversionFactorNotFoundError:
-                return CashAmount("NaN", currency)
-            shares_price_pairs.append((transaction.shares, amount_))
-
-        total_shares = 0
-        total_price = currency.zero_amount
-        for shares, price in shares_price_pairs:
-            total_price += price * shares
-            total_shares += shares
-
+        basis = self._get_cost_basis(log, currency, type_, index)
+        total_shares = basis.shares[index - 1]
         return (
-            total_price / total_shares
+            basis.costs[index - 1] / total_shares
             if total_shares != 0
             else CashAmount("NaN", currency)
         )
 
+    def _get_cost_basis(
+        self,
+        log: _ShareLog,
+        currency: Currency,
+        type_: SecurityTransactionType,
+        stop: int,
+    ) -> _CostBasis:
+        """Returns the cost basis of the log's Security in the given Currency,
+        extended to cover at least the first 'stop' transactions."""
+
+        generation = currency.factor_cache_generation
+        basis = log.cost_bases.get((type_, currency))
+        if basis is None or basis.generation != generation:
+            basis = _CostBasis(generation)
+            log.cost_bases[(type_, currency)] = basis
+        if len(basis.shares) >= stop:
+            return basis
+
+        total_shares = basis.shares[-1] if basis.shares else Decimal(0)
+        total_cost = basis.costs[-1] if basis.costs else currency.zero_amount
+        for transaction in log.transactions[len(basis.shares) : stop]:
+            if isinstance(transaction, SecurityTransaction):
+                amount = (
+                    transaction.amount_per_share if transaction.type_ == type_ else None
+                )
+            elif transaction.recipient is self and type_ == SecurityTransactionType.BUY:
+                # memoized in the sender's own cost basis
+                amount = transaction.sender.get_average_amount_per_share(
+                    transaction.security, transaction.datetime_, currency, type_
+                )
+            else:
+                amount = None
+
+            if amount is not None:
+                try:
+                    amount = amount.convert(currency, transaction.datetime_.date())
+                except ConversionFactorNotFoundError:
+                    total_cost = CashAmount("NaN", currency)
+                else:
+                    total_cost += amount * transaction.shares
+                total_shares += transaction.shares
+            basis.shares.append(total_shares)
+            basis.costs.append(total_cost)
+        return basis
+
     def get_shares(self, security: Security, type_: SharesType) -> Decimal:
         transactions = {t for t in self._transactions if t.security == security}
         if type_ == SharesType.TRANSFERRED:
@@ -779,6 +1057,10 @@ class SecurityTransaction(CashRelatedTransaction, SecurityRelatedTransaction):
             f"{self._datetime.strftime('%Y-%m-%d')})"
         )
 
+    @property
+    def accounts(self) -> frozenset[Account]:
+        return frozenset((self._security_account, self._cash_account))
+
     def is_account_related(self, account: Account) -> bool:
         return account in {self._security_account, self._cash_account}
 
@@ -955,6 +1237,7 @@ class SecurityTransaction(CashRelatedTransaction, SecurityRelatedTransaction):
     ) -> None:
         update_cash_account = False
         update_security_account = False
+        update_cost_basis = False
 
         self._description = description.strip()
 
@@ -986,12 +1269,10 @@ class SecurityTransaction(CashRelatedTransaction, SecurityRelatedTransaction):
                 update_security_account = self._shares != _shares
         self._shares = _shares
 
-        if (
-            not block_account_update
-            and hasattr(self, "_amount_per_share")
-            and not update_cash_account
-        ):
-            update_cash_account = self._amount_per_share != amount_per_share
+        if not block_account_update and hasattr(self, "_amount_per_share"):
+            update_cost_basis = self._amount_per_share != amount_per_share
+            if not update_cash_account:
+                update_cash_account = update_cost_basis
         self._amount_per_share = amount_per_share
 
         self._update_cached_data()
@@ -1000,6 +1281,7 @@ class SecurityTransaction(CashRelatedTransaction, SecurityRelatedTransaction):
             cash_account,
             update_cash_account=update_cash_account,
             update_security_account=update_security_account,
+            update_cost_basis=update_cost_basis,
         )
 
     def _update_cached_data(self) -> None:
@@ -1013,6 +1295,7 @@ class SecurityTransaction(CashRelatedTransaction, SecurityRelatedTransaction):
         *,
         update_cash_account: bool,
         update_security_account: bool,
+        update_cost_basis: bool,
     ) -> None:
         add_security_account = True
         add_cash_account = True
@@ -1034,12 +1317,14 @@ class SecurityTransaction(CashRelatedTransaction, SecurityRelatedTransaction):
         if add_security_account:
             self._security_account.add_transaction(self)
         elif update_security_account:
-            self._security_account.update_securities()
+            self._security_account.update_securities(self)
+        elif update_cost_basis:
+            self._security_account.update_cost_basis(self)
 
         if add_cash_account:
             self._cash_account.add_transaction(self)
         elif update_cash_account:
-            self._cash_account.update_balance()
+            self._cash_account.update_balance(self)
 
     def _validate_type(self, type_: SecurityTransactionType) -> None:
         if not isinstance(type_, SecurityTransactionType):
@@ -1138,6 +1423,10 @@ class SecurityTransfer(SecurityRelatedTransaction):
             f"{self._datetime.strftime('%Y-%m-%d')})"
         )
 
+    @property
+    def accounts(self) -> frozenset[Account]:
+        return frozenset((self._sender, self._recipient))
+
     def is_account_related(self, account: Account) -> bool:
         return account in {self._sender, self._recipient}
 
@@ -1326,12 +1615,12 @@ class SecurityTransfer(SecurityRelatedTransaction):
         if add_sender:
             self._sender.add_transaction(self)
         elif update_accounts:
-            self._sender.update_securities()
+            self._sender.update_securities(self)
 
         if add_recipient:
             self._recipient.add_transaction(self)
         elif update_accounts:
-            self._recipient.update_securities()
+            self._recipient.update_securities(self)
 
     def _validate_accounts(
         self, sender: SecurityAccount, recipient: SecurityAccount
@@ -1,9 +1,12 @@
 import logging
 from collections import defaultdict
-from collections.abc import Callable, Collection
+from collections.abc import Callable, Collection, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, TypeVar
+from functools import partial, wraps
+from operator import attrgetter
+from typing import Any, Concatenate, ParamSpec, TypeVar
 from uuid import UUID
 
 from src.models.base_classes.account import Account
@@ -31,44 +34,92 @@ from src.models.model_objects.currency_objects import (
     CashAmount,
     Currency,
     CurrencyError,
+    CurrencyGraph,
     ExchangeRate,
 )
 from src.models.model_objects.security_objects import (
     Security,
     SecurityAccount,
-    SecurityRelatedTransaction,
     SecurityTransaction,
     SecurityTransactionType,
     SecurityTransfer,
 )
+from src.models.transaction_store import TransactionStore
+from src.utilities.lookup_index import LookupIndex
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# sections of serialize() whose changes are tracked per item, with the functions
+# returning the item keys, see RecordKeeper.serialize_changes()
+_ITEM_SECTIONS: dict[str, Callable[[Any], str]] = {
+    "exchange_rates": str,
+    "securities": lambda security: str(security.uuid),
+    "transactions": lambda transaction: str(transaction.uuid),
+}
+
+
+def _changes_data(
+    method: Callable[Concatenate["RecordKeeper", P], R],
+) -> Callable[Concatenate["RecordKeeper", P], R]:
+    """Increments RecordKeeper.version once the decorated method returns or
+    raises, which invalidates the cached snapshots."""
+
+    @wraps(method)
+    def wrapper(self: "RecordKeeper", *args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._version += 1
+
+    return wrapper
 
 
 class RecordKeeper:
     __slots__ = (
+        "_account_group_paths",
         "_account_groups",
+        "_account_paths",
         "_accounts",
         "_base_currency",
         "_cash_accounts",
         "_cash_transactions",
         "_cash_transfers",
         "_categories",
+        "_category_paths",
+        "_changed_items",
+        "_changed_sections",
         "_currencies",
+        "_currency_codes",
+        "_currency_graph",
         "_descriptions",
+        "_exchange_rate_codes",
         "_exchange_rates",
+        "_payee_names",
         "_payees",
         "_refund_transactions",
+        "_removed_items",
         "_root_account_items",
         "_root_dual_purpose_categories",
         "_root_expense_categories",
         "_root_income_categories",
         "_securities",
         "_security_accounts",
+        "_security_names",
         "_security_transactions",
         "_security_transfers",
+        "_security_uuids",
+        "_snapshot_version",
+        "_snapshots",
+        "_tag_names",
         "_tags",
         "_transactions",
         "_transactions_uuid_dict",
+        "_version",
     )
+    # edits of more transactions rebuild the outdated Accounts instead of
+    # replaying the edited transactions
+    REPLAY_MAX_TRANSACTIONS = 64
 
     def __init__(self) -> None:
         self._accounts: list[Account] = []
@@ -78,6 +129,7 @@ class RecordKeeper:
         self._root_account_items: list[AccountGroup | Account] = []
         self._currencies: list[Currency] = []
         self._exchange_rates: list[ExchangeRate] = []
+        self._currency_graph = CurrencyGraph()
         self._securities: list[Security] = []
         self._payees: list[Attribute] = []
         self._categories: list[Category] = []
@@ -85,7 +137,7 @@ class RecordKeeper:
         self._root_expense_categories: list[Category] = []
         self._root_dual_purpose_categories: list[Category] = []
         self._tags: list[Attribute] = []
-        self._transactions: list[Transaction] = []
+        self._transactions = TransactionStore()
         self._cash_transactions: list[CashTransaction] = []
         self._refund_transactions: list[RefundTransaction] = []
         self._cash_transfers: list[CashTransfer] = []
@@ -95,33 +147,88 @@ class RecordKeeper:
         self._descriptions: defaultdict[str, int] = defaultdict(int)
         self._base_currency: Currency | None = None
 
+        # immutable snapshots returned by properties, valid while version is same
+        self._version = 0
+        self._snapshots: dict[str, tuple[Any, ...]] = {}
+        self._snapshot_version = 0
+
+        # versions of the last changes of the items in _ITEM_SECTIONS, of the
+        # removals of their keys and of the sections which changed as a whole
+        self._changed_items: dict[str, dict[Any, int]] = {
+            section: {} for section in _ITEM_SECTIONS
+        }
+        self._removed_items: dict[str, dict[str, int]] = {
+            section: {} for section in _ITEM_SECTIONS
+        }
+        self._changed_sections: dict[str, int] = {}
+
+        # lookup indexes, invalidated by edits which can change the keys
+        get_path = attrgetter("path")
+        get_name = attrgetter("name")
+        self._account_paths: LookupIndex[str, Account] = LookupIndex(
+            lambda: self._accounts, get_path
+        )
+        self._account_group_paths: LookupIndex[str, AccountGroup] = LookupIndex(
+            lambda: self._account_groups, get_path
+        )
+        self._category_paths: LookupIndex[str, Category] = LookupIndex(
+            lambda: self._categories, get_path
+        )
+        self._currency_codes: LookupIndex[str, Currency] = LookupIndex(
+            lambda: self._currencies, attrgetter("code")
+        )
+        self._exchange_rate_codes: LookupIndex[str, ExchangeRate] = LookupIndex(
+            lambda: self._exchange_rates, str
+        )
+        self._security_uuids: LookupIndex[UUID, Security] = LookupIndex(
+            lambda: self._securities, attrgetter("uuid")
+        )
+        self._security_names: LookupIndex[str, Security] = LookupIndex(
+            lambda: self._securities, get_name
+        )
+        self._payee_names: LookupIndex[str, Attribute] = LookupIndex(
+            lambda: self._payees, get_name
+        )
+        self._tag_names: LookupIndex[str, Attribute] = LookupIndex(
+            lambda: self._tags, get_name
+        )
+
     @property
     def accounts(self) -> tuple[Account, ...]:
-        return tuple(self._accounts)
+        return self._get_snapshot("accounts", lambda: tuple(self._accounts))
 
     @property
     def cash_accounts(self) -> tuple[CashAccount, ...]:
-        return tuple(self._cash_accounts)
+        return self._get_snapshot("cash_accounts", lambda: tuple(self._cash_accounts))
 
     @property
     def security_accounts(self) -> tuple[SecurityAccount, ...]:
-        return tuple(self._security_accounts)
+        return self._get_snapshot(
+            "security_accounts", lambda: tuple(self._security_accounts)
+        )
 
     @property
     def account_groups(self) -> tuple[AccountGroup, ...]:
-        return tuple(self._account_groups)
+        return self._get_snapshot("account_groups", lambda: tuple(self._account_groups))
 
     @property
     def account_items(self) -> tuple[Account | AccountGroup, ...]:
-        return tuple(RecordKeeper._flatten_account_items(self._root_account_items))
+        return self._get_snapshot(
+            "account_items",
+            lambda: tuple(
+                RecordKeeper._flatten_account_items(self._root_account_items)
+            ),
+        )
 
     @property
     def root_account_items(self) -> tuple[Account | AccountGroup, ...]:
-        return tuple(self._root_account_items)
+        return self._get_snapshot(
+            "root_account_items", lambda: tuple(self._root_account_items)
+        )
 
     @property
     def currencies(self) -> tuple[Currency, ...]:
-        return tuple(self._currencies)
+        return self._get_snapshot("currencies", lambda: tuple(self._currencies))
 
     @property
     def base_currency(self) -> Currency | None:
@@ -129,53 +236,73 @@ class RecordKeeper:
 
     @property
     def exchange_rates(self) -> tuple[ExchangeRate, ...]:
-        return tuple(self._exchange_rates)
+        return self._get_snapshot("exchange_rates", lambda: tuple(self._exchange_rates))
 
     @property
     def securities(self) -> tuple[Security, ...]:
-        return tuple(self._securities)
+        return self._get_snapshot("securities", lambda: tuple(self._securities))
 
     @property
     def payees(self) -> tuple[Attribute, ...]:
-        return tuple(self._payees)
+        return self._get_snapshot("payees", lambda: tuple(self._payees))
 
     @property
     def categories(self) -> tuple[Category, ...]:
-        return tuple(self._categories)
+        return self._get_snapshot("categories", lambda: tuple(self._categories))
 
     @property
     def root_income_categories(self) -> tuple[Category, ...]:
-        return tuple(self._root_income_categories)
+        return self._get_snapshot(
+            "root_income_categories", lambda: tuple(self._root_income_categories)
+        )
 
     @property
     def root_expense_categories(self) -> tuple[Category, ...]:
-        return tuple(self._root_expense_categories)
+        return self._get_snapshot(
+            "root_expense_categories", lambda: tuple(self._root_expense_categories)
+        )
 
     @property
     def root_dual_purpose_categories(self) -> tuple[Category, ...]:
-        return tuple(self._root_dual_purpose_categories)
+        return self._get_snapshot(
+            "root_dual_purpose_categories",
+            lambda: tuple(self._root_dual_purpose_categories),
+        )
 
     @property
     def income_categories(self) -> tuple[Category, ...]:
-        return tuple(RecordKeeper._flatten_categories(self._root_income_categories))
+        return self._get_snapshot(
+            "income_categories",
+            lambda: tuple(
+                RecordKeeper._flatten_categories(self._root_income_categories)
+            ),
+        )
 
     @property
     def expense_categories(self) -> tuple[Category, ...]:
-        return tuple(RecordKeeper._flatten_categories(self._root_expense_categories))
+        return self._get_snapshot(
+            "expense_categories",
+            lambda: tuple(
+                RecordKeeper._flatten_categories(self._root_expense_categories)
+            ),
+        )
 
     @property
     def dual_purpose_categories(self) -> tuple[Category, ...]:
-        return tuple(
-            RecordKeeper._flatten_categories(self._root_dual_purpose_categories)
+        return self._get_snapshot(
+            "dual_purpose_categories",
+            lambda: tuple(
+                RecordKeeper._flatten_categories(self._root_dual_purpose_categories)
+            ),
         )
 
     @property
     def tags(self) -> tuple[Attribute, ...]:
-        return tuple(self._tags)
+        return self._get_snapshot("tags", lambda: tuple(self._tags))
 
     @property
     def transactions(self) -> tuple[Transaction, ...]:
-        return tuple(self._transactions)
+        return self._get_snapshot("transactions", lambda: tuple(self._transactions))
 
     @property
     def transaction_uuid_dict(self) -> dict[UUID, Transaction]:
@@ -183,34 +310,66 @@ class RecordKeeper:
 
     @property
     def cash_transactions(self) -> tuple[CashTransaction, ...]:
-        return tuple(self._cash_transactions)
+        return self._get_snapshot(
+            "cash_transactions", lambda: tuple(self._cash_transactions)
+        )
 
     @property
     def refund_transactions(self) -> tuple[RefundTransaction, ...]:
-        return tuple(self._refund_transactions)
+        return self._get_snapshot(
+            "refund_transactions", lambda: tuple(self._refund_transactions)
+        )
 
     @property
     def cash_transfers(self) -> tuple[CashTransfer, ...]:
-        return tuple(self._cash_transfers)
+        return self._get_snapshot("cash_transfers", lambda: tuple(self._cash_transfers))
 
     @property
     def security_transactions(self) -> tuple[SecurityTransaction, ...]:
-        return tuple(self._security_transactions)
+        return self._get_snapshot(
+            "security_transactions", lambda: tuple(self._security_transactions)
+        )
 
     @property
     def security_transfers(self) -> tuple[SecurityTransfer, ...]:
-        return tuple(self._security_transfers)
+        return self._get_snapshot(
+            "security_transfers", lambda: tuple(self._security_transfers)
+        )
 
     @property
     def descriptions(self) -> tuple[str, ...]:
-        return tuple(self._descriptions)
+        return self._get_snapshot("descriptions", lambda: tuple(self._descriptions))
+
+    @property
+    def version(self) -> int:
+        """Incremented by every change of the data. Can be used as a key of caches
+        derived from the data."""
+        return self._version
 
     def __repr__(self) -> str:
         return "RecordKeeper"
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Coalesces balance updates of this RecordKeeper's AccountGroups within
+        this scope. Each affected AccountGroup recalculates its balances once,
+        when the scope exits."""
+
+        with AccountGroup.batch_balance_updates(self._account_groups):
+            yield
+
+    def bulk_add(self) -> AbstractContextManager[None]:
+        """Defers Account balance and securities updates while transactions are
+        added within this scope. When the scope exits, each Account which received
+        transactions is rebuilt exactly once. Account and AccountGroup balances
+        are outdated within the scope."""
+
+        return self._defer_account_updates()
+
+    @_changes_data
     def add_currency(self, currency_code: str, decimals: int) -> None:
         code_upper = currency_code.upper()
-        if any(currency.code == code_upper for currency in self._currencies):
+        if self._currency_codes.get(code_upper) is not None:
             raise AlreadyExistsError(
                 f"A Currency with code '{code_upper}' already exists."
             )
@@ -218,40 +377,52 @@ class RecordKeeper:
         if len(self._currencies) == 0:
             self._base_currency = currency
         self._currencies.append(currency)
+        self._currency_codes.add(currency)
+        self._currency_graph.rebuild(self._currencies)
 
+    @_changes_data
     def add_payee(self, name: str) -> None:
-        if any(payee.name == name for payee in self._payees):
+        if self._payee_names.get(name) is not None:
             raise AlreadyExistsError(f"A Payee {name=} already exists.")
         payee = Attribute(name, AttributeType.PAYEE)
         self._payees.append(payee)
+        self._payee_names.add(payee)
 
+    @_changes_data
     def add_tag(self, name: str) -> None:
-        if any(tag.name == name for tag in self._tags):
+        if self._tag_names.get(name) is not None:
             raise AlreadyExistsError(f"A Tag {name=} already exists.")
         tag = Attribute(name, AttributeType.TAG)
         self._tags.append(tag)
+        self._tag_names.add(tag)
 
+    @_changes_data
     def add_exchange_rate(
         self, primary_currency_code: str, secondary_currency_code: str
     ) -> None:
         exchange_rate_str = f"{primary_currency_code}/{secondary_currency_code}"
         exchange_rate_str_reverse = f"{secondary_currency_code}/{primary_currency_code}"
-        for exchange_rate in self._exchange_rates:
-            if (
-                str(exchange_rate) == exchange_rate_str
-                or str(exchange_rate) == exchange_rate_str_reverse
-            ):
-                raise AlreadyExistsError(
-                    f"An ExchangeRate between {primary_currency_code} "
-                    f"and {secondary_currency_code} already exists."
-                )
+        if (
+            self._exchange_rate_codes.get(exchange_rate_str) is not None
+            or self._exchange_rate_codes.get(exchange_rate_str_reverse) is not None
+        ):
+            raise AlreadyExistsError(
+                f"An ExchangeRate between {primary_currency_code} "
+                f"and {secondary_currency_code} already exists."
+            )
         primary_currency = self.get_currency(primary_currency_code)
         secondary_currency = self.get_currency(secondary_currency_code)
         exchange_rate = ExchangeRate(primary_currency, secondary_currency)
         self._exchange_rates.append(exchange_rate)
+        self._exchange_rate_codes.add(exchange_rate)
         exchange_rate.event_reset_currency_caches.append(self._reset_currency_caches)
-        self._reset_currency_caches()
+        exchange_rate.event_rates_changed.append(
+            partial(self._item_changed, "exchange_rates", exchange_rate)
+        )
+        self._mark_changed("exchange_rates", (exchange_rate,))
+        self._currency_graph.rebuild(self._currencies)
 
+    @_changes_data
     def add_security(
         self,
         name: str,
@@ -260,7 +431,7 @@ class RecordKeeper:
         currency_code: str,
         shares_decimals: int,
     ) -> None:
-        if any(security.name == name for security in self._securities):
+        if self._security_names.get(name) is not None:
             raise AlreadyExistsError(f"A Security with name='{name}' already exists.")
         symbol_upper = symbol.upper()
         if len(symbol_upper) != 0 and any(
@@ -272,15 +443,22 @@ class RecordKeeper:
 
         currency = self.get_currency(currency_code)
         security = Security(name, symbol, type_, currency, shares_decimals)
+        security.event_prices_changed.append(
+            partial(self._item_changed, "securities", security)
+        )
         self._securities.append(security)
+        self._mark_changed("securities", (security,))
+        self._security_uuids.add(security)
+        self._security_names.add(security)
 
+    @_changes_data
     def add_category(
         self,
         path: str,
         type_: CategoryType | None = None,
         index: int | None = None,
     ) -> None:
-        if any(category.path == path for category in self._categories):
+        if self._category_paths.get(path) is not None:
             raise AlreadyExistsError(f"A Category at {path=} already exists.")
 
         if "/" in path:
@@ -300,18 +478,22 @@ class RecordKeeper:
         category = Category(name, category_type, parent)
         self._set_category_index(category, index)
         self._categories.append(category)
+        self._category_paths.add(category)
 
+    @_changes_data
     def add_account_group(self, path: str, index: int | None = None) -> None:
         parent_path, _, name = path.rpartition("/")
         parent = self.get_account_group_or_none(parent_path)
-        if any(acc_group.path == path for acc_group in self._account_groups):
+        if self._account_group_paths.get(path) is not None:
             raise AlreadyExistsError(
                 f"An AccountGroup with path '{path}' already exists."
             )
         account_group = AccountGroup(name, parent)
         self._set_account_item_index(account_group, index)
         self._account_groups.append(account_group)
+        self._account_group_paths.add(account_group)
 
+    @_changes_data
     def add_cash_account(
         self,
         path: str,
@@ -328,9 +510,11 @@ class RecordKeeper:
         account = CashAccount(name, currency, initial_balance, iban, parent)
         self._set_account_item_index(account, index)
         self._accounts.append(account)
+        self._account_paths.add(account)
         self._cash_accounts.append(account)
         self._cash_accounts.sort(key=lambda account: account.path.lower())
 
+    @_changes_data
     def add_security_account(self, path: str, index: int | None = None) -> None:
         parent_path, _, name = path.rpartition("/")
         self._check_account_exists(path)
@@ -338,9 +522,11 @@ class RecordKeeper:
         account = SecurityAccount(name, parent)
         self._set_account_item_index(account, index)
         self._accounts.append(account)
+        self._account_paths.add(account)
         self._security_accounts.append(account)
         self._security_accounts.sort(key=lambda account: account.path.lower())
 
+    @_changes_data
     def add_cash_transaction(
         self,
         description: str,
@@ -375,11 +561,13 @@ class RecordKeeper:
             category_amount_pairs=category_amount_pairs,
             tag_amount_pairs=tag_amount_pairs,
         )
-        self._transactions.append(transaction)
+        self._transactions.add(transaction)
+        self._mark_changed("transactions", (transaction,))
         self._cash_transactions.append(transaction)
         self._transactions_uuid_dict[transaction.uuid] = transaction
         self._add_description(transaction.description)
 
+    @_changes_data
     def add_cash_transfer(
         self,
         description: str,
@@ -401,7 +589,8 @@ class RecordKeeper:
             amount_sent=CashAmount(amount_sent, account_sender.currency),
             amount_received=CashAmount(amount_received, account_recipient.currency),
         )
-        self._transactions.append(transfer)
+        self._transactions.add(transfer)
+        self._mark_changed("transactions", (transfer,))
         self._cash_transfers.append(transfer)
         self._transactions_uuid_dict[transfer.uuid] = transfer
 
@@ -409,8 +598,10 @@ class RecordKeeper:
             self.get_attribute(tag_name, AttributeType.TAG) for tag_name in tag_names
         ]
         transfer.add_tags(tags)
+        self._transactions.update((transfer,))
         self._add_description(transfer.description)
 
+    @_changes_data
     def add_refund(
         self,
         description: str,
@@ -452,11 +643,13 @@ class RecordKeeper:
             tag_amount_pairs=tag_amount_pairs,
             payee=payee,
         )
-        self._transactions.append(refund)
+        self._transactions.add(refund)
+        self._mark_changed("transactions", (refund,))
         self._refund_transactions.append(refund)
         self._transactions_uuid_dict[refund.uuid] = refund
         self._add_description(refund.description)
 
+    @_changes_data
     def add_security_transaction(
         self,
         description: str,
@@ -483,7 +676,8 @@ class RecordKeeper:
             security_account=security_account,
             cash_account=cash_account,
         )
-        self._transactions.append(transaction)
+        self._transactions.add(transaction)
+        self._mark_changed("transactions", (transaction,))
         self._security_transactions.append(transaction)
         self._transactions_uuid_dict[transaction.uuid] = transaction
 
@@ -491,8 +685,10 @@ class RecordKeeper:
             self.get_attribute(tag_name, AttributeType.TAG) for tag_name in tag_names
         ]
         transaction.add_tags(tags)
+        self._transactions.update((transaction,))
         self._add_description(transaction.description)
 
+    @_changes_data
     def add_security_transfer(
         self,
         description: str,
@@ -514,7 +710,8 @@ class RecordKeeper:
             sender=account_sender,
             recipient=account_recipient,
         )
-        self._transactions.append(transaction)
+        self._transactions.add(transaction)
+        self._mark_changed("transactions", (transaction,))
         self._security_transfers.append(transaction)
         self._transactions_uuid_dict[transaction.uuid] = transaction
 
@@ -522,8 +719,10 @@ class RecordKeeper:
             self.get_attribute(tag_name, AttributeType.TAG) for tag_name in tag_names
         ]
         transaction.add_tags(tags)
+        self._transactions.update((transaction,))
         self._add_description(transaction.description)
 
+    @_changes_data
     def edit_cash_transactions(
         self,
         transaction_uuids: Collection[UUID],
@@ -532,8 +731,9 @@ class RecordKeeper:
         transaction_type: CashTransactionType | None = None,
         account_path: str | None = None,
         payee_name: str | None = None,
-        category_path_amount_pairs: Collection[tuple[str, Decimal | None]]
-        | None = None,
+        category_path_amount_pairs: (
+            Collection[tuple[str, Decimal | None]] | None
+        ) = None,
         tag_name_amount_pairs: Collection[tuple[str, Decimal | None]] | None = None,
     ) -> None:
         transactions = self._get_transactions(transaction_uuids, CashTransaction)
@@ -618,19 +818,21 @@ class RecordKeeper:
                 payee=payee,
             )
 
-        for transaction in transactions:
-            self._remove_description(transaction.description)
-            transaction.set_attributes(
-                description=description,
-                datetime_=datetime_,
-                type_=transaction_type,
-                account=account,
-                category_amount_pairs=category_amount_pairs,
-                tag_amount_pairs=tag_amount_pairs,
-                payee=payee,
-            )
-            self._add_description(transaction.description)
+        with self._defer_account_updates(transactions):
+            for transaction in transactions:
+                self._remove_description(transaction.description)
+                transaction.set_attributes(
+                    description=description,
+                    datetime_=datetime_,
+                    type_=transaction_type,
+                    account=account,
+                    category_amount_pairs=category_amount_pairs,
+                    tag_amount_pairs=tag_amount_pairs,
+                    payee=payee,
+                )
+                self._add_description(transaction.description)
 
+    @_changes_data
     def edit_cash_transfers(
         self,
         transaction_uuids: Collection[UUID],
@@ -692,27 +894,29 @@ class RecordKeeper:
                 recipient=recipient,
             )
 
-        for transfer in transfers:
-            self._remove_description(transfer.description)
-            transfer.set_attributes(
-                description=description,
-                datetime_=datetime_,
-                amount_sent=_amount_sent,
-                amount_received=_amount_received,
-                sender=sender,
-                recipient=recipient,
-            )
-            self._add_description(transfer.description)
-
-        if tag_names is not None:
-            tags = [
-                self.get_attribute(tag_name, AttributeType.TAG)
-                for tag_name in tag_names
-            ]
+        with self._defer_account_updates(transfers):
             for transfer in transfers:
-                transfer.clear_tags()
-                transfer.add_tags(tags)
-
+                self._remove_description(transfer.description)
+                transfer.set_attributes(
+                    description=description,
+                    datetime_=datetime_,
+                    amount_sent=_amount_sent,
+                    amount_received=_amount_received,
+                    sender=sender,
+                    recipient=recipient,
+                )
+                self._add_description(transfer.description)
+
+            if tag_names is not None:
+                tags = [
+                    self.get_attribute(tag_name, AttributeType.TAG)
+                    for tag_name in tag_names
+                ]
+                for transfer in transfers:
+                    transfer.clear_tags()
+                    transfer.add_tags(tags)
+
+    @_changes_data
     def edit_refunds(
         self,
         transaction_uuids: Collection[UUID],
@@ -720,8 +924,9 @@ class RecordKeeper:
         datetime_: datetime | None = None,
         account_path: str | None = None,
         payee_name: str | None = None,
-        category_path_amount_pairs: Collection[tuple[str, Decimal | None]]
-        | None = None,
+        category_path_amount_pairs: (
+            Collection[tuple[str, Decimal | None]] | None
+        ) = None,
         tag_name_amount_pairs: Collection[tuple[str, Decimal]] | None = None,
     ) -> None:
         refunds = self._get_transactions(transaction_uuids, RefundTransaction)
@@ -767,18 +972,20 @@ class RecordKeeper:
                 payee=payee,
             )
 
-        for refund in refunds:
-            self._remove_description(refund.description)
-            refund.set_attributes(
-                description=description,
-                datetime_=datetime_,
-                account=account,
-                category_amount_pairs=category_amount_pairs,
-                tag_amount_pairs=tag_amount_pairs,
-                payee=payee,
-            )
-            self._add_description(refund.description)
+        with self._defer_account_updates(refunds):
+            for refund in refunds:
+                self._remove_description(refund.description)
+                refund.set_attributes(
+                    description=description,
+                    datetime_=datetime_,
+                    account=account,
+                    category_amount_pairs=category_amount_pairs,
+                    tag_amount_pairs=tag_amount_pairs,
+                    payee=payee,
+                )
+                self._add_description(refund.description)
 
+    @_changes_data
     def edit_security_transactions(
         self,
         transaction_uuids: Collection[UUID],
@@ -856,29 +1063,31 @@ class RecordKeeper:
                 security_account=security_account,
             )
 
-        for transaction in transactions:
-            self._remove_description(transaction.description)
-            transaction.set_attributes(
-                description=description,
-                datetime_=datetime_,
-                type_=transaction_type,
-                security=security,
-                amount_per_share=_amount_per_share,
-                shares=shares,
-                cash_account=cash_account,
-                security_account=security_account,
-            )
-            self._add_description(transaction.description)
-
-        if tag_names is not None:
-            tags = [
-                self.get_attribute(tag_name, AttributeType.TAG)
-                for tag_name in tag_names
-            ]
+        with self._defer_account_updates(transactions):
             for transaction in transactions:
-                transaction.clear_tags()
-                transaction.add_tags(tags)
-
+                self._remove_description(transaction.description)
+                transaction.set_attributes(
+                    description=description,
+                    datetime_=datetime_,
+                    type_=transaction_type,
+                    security=security,
+                    amount_per_share=_amount_per_share,
+                    shares=shares,
+                    cash_account=cash_account,
+                    security_account=security_account,
+                )
+                self._add_description(transaction.description)
+
+            if tag_names is not None:
+                tags = [
+                    self.get_attribute(tag_name, AttributeType.TAG)
+                    for tag_name in tag_names
+                ]
+                for transaction in transactions:
+                    transaction.clear_tags()
+                    transaction.add_tags(tags)
+
+    @_changes_data
     def edit_security_transfers(
         self,
         transaction_uuids: Collection[UUID],
@@ -917,33 +1126,33 @@ class RecordKeeper:
                 security=security,
             )
 
-        for transaction in transactions:
-            self._remove_description(transaction.description)
-            transaction.set_attributes(
-                description=description,
-                datetime_=datetime_,
-                sender=sender,
-                recipient=recipient,
-                shares=shares,
-                security=security,
-            )
-            self._add_description(transaction.description)
-
-        if tag_names is not None:
-            tags = [
-                self.get_attribute(tag_name, AttributeType.TAG)
-                for tag_name in tag_names
-            ]
+        with self._defer_account_updates(transactions):
             for transaction in transactions:
-                transaction.clear_tags()
-                transaction.add_tags(tags)
-
+                self._remove_description(transaction.description)
+                transaction.set_attributes(
+                    description=description,
+                    datetime_=datetime_,
+                    sender=sender,
+                    recipient=recipient,
+                    shares=shares,
+                    security=security,
+                )
+                self._add_description(transaction.description)
+
+            if tag_names is not None:
+                tags = [
+                    self.get_attribute(tag_name, AttributeType.TAG)
+                    for tag_name in tag_names
+                ]
+                for transaction in transactions:
+                    transaction.clear_tags()
+                    transaction.add_tags(tags)
+
+    @_changes_data
     def edit_category(
         self, current_path: str, new_path: str, index: int | None = None
     ) -> None:
-        if current_path != new_path and any(
-            category.path == new_path for category in self._categories
-        ):
+        if current_path != new_path and self._category_paths.get(new_path) is not None:
             raise AlreadyExistsError(
                 f"A Category with path='{new_path}' already exists."
             )
@@ -964,7 +1173,11 @@ class RecordKeeper:
         self._edit_category_parent(
             category=edited_category, new_parent=new_parent, index=index
         )
+        self._category_paths.invalidate()
+        if current_path != new_path:
+            self._mark_section_changed("transactions")
 
+    @_changes_data
     def edit_attribute(
         self,
         current_name: str,
@@ -973,15 +1186,10 @@ class RecordKeeper:
         *,
         merge: bool = False,
     ) -> None:
-        attributes = self._payees if type_ == AttributeType.PAYEE else self._tags
+        index = self._payee_names if type_ == AttributeType.PAYEE else self._tag_names
 
-        edited_attribute = None
-        existing_attribute = None
-        for attribute in attributes:
-            if attribute.name == current_name:
-                edited_attribute = attribute
-            elif attribute.name == new_name:
-                existing_attribute = attribute
+        edited_attribute = index.get(current_name)
+        existing_attribute = index.get(new_name) if new_name != current_name else None
 
         if edited_attribute is None:
             raise NotFoundError(
@@ -994,20 +1202,26 @@ class RecordKeeper:
 
         if existing_attribute is None:
             edited_attribute.name = new_name
+            index.invalidate()
+            self._mark_section_changed("transactions")
             return
 
         if merge:
             if type_ == AttributeType.PAYEE:
-                for transaction in self._cash_transactions + self._refund_transactions:
-                    if transaction.payee == edited_attribute:
-                        transaction.replace_payee(existing_attribute)
+                transactions = self._transactions.get_by_payee(edited_attribute)
+                for transaction in transactions:
+                    transaction.replace_payee(existing_attribute)
                 self._payees.remove(edited_attribute)
             else:
-                for transaction in self._transactions:
-                    if edited_attribute in transaction.tags:
-                        transaction.replace_tag(edited_attribute, existing_attribute)
+                transactions = self._transactions.get_by_tag(edited_attribute)
+                for transaction in transactions:
+                    transaction.replace_tag(edited_attribute, existing_attribute)
                 self._tags.remove(edited_attribute)
+            self._transactions.update(transactions)
+            self._mark_changed("transactions", transactions)
+            index.invalidate()
 
+    @_changes_data
     def edit_security(
         self,
         uuid_: UUID,
@@ -1016,13 +1230,17 @@ class RecordKeeper:
         type_: str | None = None,
     ) -> None:
         edited_security = self.get_security_by_uuid(uuid_)
+        self._mark_changed("securities", (edited_security,))
         if name is not None:
             edited_security.name = name
+            self._security_names.invalidate()
+            self._mark_section_changed("transactions")
         if symbol is not None:
             edited_security.symbol = symbol
         if type_ is not None:
             edited_security.type_ = type_
 
+    @_changes_data
     def edit_cash_account(
         self,
         current_path: str,
@@ -1044,8 +1262,12 @@ class RecordKeeper:
         self._edit_account_item_parent(
             item=edited_account, new_parent=new_parent, index=index
         )
+        self._account_paths.invalidate()
         self._cash_accounts.sort(key=lambda account: account.path.lower())
+        if current_path != new_path:
+            self._mark_section_changed("transactions")
 
+    @_changes_data
     def edit_security_account(
         self, current_path: str, new_path: str, index: int | None = None
     ) -> None:
@@ -1058,13 +1280,18 @@ class RecordKeeper:
         self._edit_account_item_parent(
             item=edited_account, new_parent=new_parent, index=index
         )
+        self._account_paths.invalidate()
         self._security_accounts.sort(key=lambda account: account.path.lower())
+        if current_path != new_path:
+            self._mark_section_changed("transactions")
 
+    @_changes_data
     def edit_account_group(
         self, current_path: str, new_path: str, index: int | None = None
     ) -> None:
-        if current_path != new_path and any(
-            account_group.path == new_path for account_group in self._account_groups
+        if (
+            current_path != new_path
+            and self._account_group_paths.get(new_path) is not None
         ):
             raise AlreadyExistsError(
                 f"An Account Group with path='{new_path}' already exists."
@@ -1078,7 +1305,13 @@ class RecordKeeper:
         self._edit_account_item_parent(
             item=edited_account_group, new_parent=new_parent, index=index
         )
+        # paths of all items within the AccountGroup have changed too
+        self._account_group_paths.invalidate()
+        self._account_paths.invalidate()
+        if current_path != new_path:
+            self._mark_section_changed("transactions")
 
+    @_changes_data
     def add_tags_to_transactions(
         self, transaction_uuids: Collection[UUID], tag_names: Collection[str]
     ) -> None:
@@ -1088,6 +1321,7 @@ class RecordKeeper:
             method_name="add_tags",
         )
 
+    @_changes_data
     def remove_tags_from_transactions(
         self, transaction_uuids: Collection[UUID], tag_names: Collection[str]
     ) -> None:
@@ -1111,7 +1345,10 @@ class RecordKeeper:
         for transaction in transactions:
             method = getattr(transaction, method_name)
             method(tags)
+        self._transactions.update(transactions)
+        self._mark_changed("transactions", transactions)
 
+    @_changes_data
     def remove_account(self, path: str) -> None:
         account = self.get_account(path, Account)
         if len(account.transactions) != 0:
@@ -1123,12 +1360,14 @@ class RecordKeeper:
         else:
             account.parent = None
         self._accounts.remove(account)
+        self._account_paths.invalidate()
         if isinstance(account, CashAccount):
             self._cash_accounts.remove(account)
         else:
             self._security_accounts.remove(account)
         del account
 
+    @_changes_data
     def remove_account_group(self, account_group_path: str) -> None:
         account_group = self.get_account_group(account_group_path)
         if len(account_group.children) != 0:
@@ -1140,45 +1379,38 @@ class RecordKeeper:
         else:
             account_group.parent = None
         self._account_groups.remove(account_group)
+        self._account_group_paths.invalidate()
         del account_group
 
+    @_changes_data
     def remove_transactions(self, transaction_uuids: Collection[UUID]) -> None:
         transactions = self._get_transactions(transaction_uuids, Transaction)
-        for transaction in transactions:
-            transaction.prepare_for_deletion()
-            self._transactions.remove(transaction)
-            if isinstance(transaction, CashTransaction):
-                self._cash_transactions.remove(transaction)
-            elif isinstance(transaction, RefundTransaction):
-                self._refund_transactions.remove(transaction)
-            elif isinstance(transaction, CashTransfer):
-                self._cash_transfers.remove(transaction)
-            elif isinstance(transaction, SecurityTransaction):
-                self._security_transactions.remove(transaction)
-            elif isinstance(transaction, SecurityTransfer):
-                self._security_transfers.remove(transaction)
-            else:
-                raise TypeError(  # pragma: no cover
-                    f"Unknown transaction type: {type(transaction)}"
-                )
-
-            # delete transaction from dictionary
-            del self._transactions_uuid_dict[transaction.uuid]
-            self._remove_description(transaction.description)
-
+        # refunds are detached first, so refunded transactions can be removed
+        # together with their refunds
+        transactions.sort(key=lambda x: not isinstance(x, RefundTransaction))
+        removed_transactions: set[Transaction] = set()
+        with self._defer_account_updates(transactions):
+            try:
+                for transaction in transactions:
+                    transaction.prepare_for_deletion()
+                    removed_transactions.add(transaction)
+            finally:
+                self._discard_transactions(removed_transactions)
+
+    @_changes_data
     def remove_security(self, uuid: str) -> None:
         security = self.get_security_by_uuid(uuid)
-        if any(
-            transaction.security == security
-            for transaction in self._transactions
-            if isinstance(transaction, SecurityRelatedTransaction)
-        ):
+        if self._transactions.get_by_security(security):
             raise InvalidOperationError(
                 "Cannot delete a Security referenced in any transaction."
             )
         self._securities.remove(security)
+        self._mark_removed("securities", (security,))
+        self._security_uuids.invalidate()
+        self._security_names.invalidate()
         del security
 
+    @_changes_data
     def remove_currency(self, code: str) -> None:
         currency = self.get_currency(code)
         if any(
@@ -1201,39 +1433,40 @@ class RecordKeeper:
                 "Cannot delete a Currency referenced in any Security."
             )
         self._currencies.remove(currency)
+        self._currency_codes.invalidate()
+        self._currency_graph.rebuild(self._currencies)
         if currency == self._base_currency:
             self._base_currency = (
                 self._currencies[0] if len(self._currencies) > 0 else None
             )
         del currency
 
+    @_changes_data
     def remove_exchange_rate(self, exchange_rate_code: str) -> None:
-        for exchange_rate in self._exchange_rates:
-            if str(exchange_rate) == exchange_rate_code:
-                removed_exchange_rate = exchange_rate
-                break
-        else:
+        removed_exchange_rate = self._exchange_rate_codes.get(exchange_rate_code)
+        if removed_exchange_rate is None:
             raise NotFoundError(f"ExchangeRate '{exchange_rate_code}' does not exist.")
 
         removed_exchange_rate.prepare_for_deletion()
         self._exchange_rates.remove(removed_exchange_rate)
-        self._reset_currency_caches()
+        self._mark_removed("exchange_rates", (removed_exchange_rate,))
+        self._exchange_rate_codes.invalidate()
+        self._currency_graph.rebuild(self._currencies)
         del removed_exchange_rate
 
+    @_changes_data
     def remove_category(self, path: str) -> None:
         category = self.get_category(path)
         if len(category.children) != 0:
             raise InvalidOperationError("Cannot delete a Category with children.")
-        if any(
-            category in transaction.categories
-            for transaction in (self._cash_transactions + self._refund_transactions)
-        ):
+        if self._transactions.get_by_category(category):
             raise InvalidOperationError(
                 "Cannot delete a Category referenced in any CashTransaction "
                 "or RefundTransaction."
             )
 
         self._categories.remove(category)
+        self._category_paths.invalidate()
         if category.parent is None:
             list_ref = self._get_root_category_list(category)
             list_ref.remove(category)
@@ -1241,29 +1474,30 @@ class RecordKeeper:
             category.parent = None
         del category
 
+    @_changes_data
     def remove_tag(self, name: str) -> None:
         tag = self.get_attribute(name, AttributeType.TAG)
-        if any(tag in transaction.tags for transaction in self._transactions):
+        if self._transactions.get_by_tag(tag):
             raise InvalidOperationError(
                 "Cannot delete a tag referenced in any Transaction."
             )
         self._tags.remove(tag)
+        self._tag_names.invalidate()
         del tag
 
+    @_changes_data
     def remove_payee(self, name: str) -> None:
         payee = self.get_attribute(name, AttributeType.PAYEE)
-        if any(
-            payee == transaction.payee
-            for transaction in self._transactions
-            if isinstance(transaction, CashTransaction | RefundTransaction)
-        ):
+        if self._transactions.get_by_payee(payee):
             raise InvalidOperationError(
                 "Cannot delete a payee referenced in any CashTransaction "
                 "or RefundTransaction."
             )
         self._payees.remove(payee)
+        self._payee_names.invalidate()
         del payee
 
+    @_changes_data
     def set_base_currency(self, code: str) -> None:
         currency = self.get_currency(code)
         self._base_currency = currency
@@ -1274,9 +1508,9 @@ class RecordKeeper:
         return self.get_account_group(path)
 
     def get_account_group(self, path: str) -> AccountGroup:
-        for account_group in self._account_groups:
-            if account_group.path == path:
-                return account_group
+        account_group = self._account_group_paths.get(path)
+        if account_group is not None:
+            return account_group
         raise NotFoundError(f"An AccountGroup with path='{path}' does not exist.")
 
     AccountType = TypeVar("AccountType", CashAccount, SecurityAccount, Account)
@@ -1290,53 +1524,53 @@ class RecordKeeper:
             raise TypeError("Parameter 'path' must be a string.")
         if not isinstance(type_, type(Account)):
             raise TypeError("Parameter type_ must be type(Account).")
-        for account in self._accounts:
-            if account.path == path:
-                if not isinstance(account, type_):
-                    raise TypeError(
-                        f"Type of Account at path='{path}' is not {type_.__name__}."
-                    )
-                return account
+        account = self._account_paths.get(path)
+        if account is not None:
+            if not isinstance(account, type_):
+                raise TypeError(
+                    f"Type of Account at path='{path}' is not {type_.__name__}."
+                )
+            return account
         raise NotFoundError(f"An Account with path='{path}' does not exist.")
 
     def get_security_by_uuid(self, uuid_: UUID) -> Security:
         if not isinstance(uuid_, UUID):
             raise TypeError("Parameter 'uuid' must be a UUID.")
-        for security in self._securities:
-            if security.uuid == uuid_:
-                return security
+        security = self._security_uuids.get(uuid_)
+        if security is not None:
+            return security
         raise NotFoundError(f"A Security with uuid='{uuid_!s}' does not exist.")
 
     def get_security_by_name(self, name: str) -> Security:
         if not isinstance(name, str):
             raise TypeError("Parameter 'name' must be a string.")
-        for security in self._securities:
-            if security.name == name:
-                return security
+        security = self._security_names.get(name)
+        if security is not None:
+            return security
         raise NotFoundError(f"A Security with name='{name}' does not exist.")
 
     def get_currency(self, code: str) -> Currency:
         if not isinstance(code, str):
             raise TypeError("Parameter 'code' must be a string.")
         code_upper = code.upper()
-        for currency in self._currencies:
-            if currency.code == code_upper:
-                return currency
+        currency = self._currency_codes.get(code_upper)
+        if currency is not None:
+            return currency
         raise NotFoundError(f"A Currency with code='{code_upper}' does not exist.")
 
     def get_exchange_rate(self, code: str) -> ExchangeRate:
         if not isinstance(code, str):
             raise TypeError("Parameter 'code' must be a string.")
         code_upper = code.upper()
-        for exchange_rate in self._exchange_rates:
-            if str(exchange_rate) == code_upper:
-                return exchange_rate
+        exchange_rate = self._exchange_rate_codes.get(code_upper)
+        if exchange_rate is not None:
+            return exchange_rate
         raise NotFoundError(f"An ExchangeRate with code='{code_upper}' does not exist.")
 
     def get_category(self, path: str) -> Category:
-        for category in self._categories:
-            if category.path == path:
-                return category
+        category = self._category_paths.get(path)
+        if category is not None:
+            return category
         raise NotFoundError(f"Category at {path=} does not exist.")
 
     def get_or_make_category(self, path: str, type_: CategoryType) -> Category:
@@ -1347,9 +1581,9 @@ class RecordKeeper:
             raise TypeError("Parameter 'path' must be a string.")
         if not isinstance(type_, CategoryType):
             raise TypeError("Parameter 'type_' must be a CategoryType.")
-        for category in self._categories:
-            if category.path == path:
-                return category
+        category = self._category_paths.get(path)
+        if category is not None:
+            return category
 
         # Category with path not found... making it (along with any parents).
         return self._make_category_leaf(path, type_)
@@ -1361,10 +1595,7 @@ class RecordKeeper:
             while "/" in current_path:
                 # Searching for any existing parent in path.
                 current_path, _, _ = current_path.rpartition("/")
-                for category in self._categories:
-                    if category.path == current_path:
-                        parent = category
-                        break
+                parent = self._category_paths.get(current_path)
                 if parent:
                     break
             else:
@@ -1397,25 +1628,25 @@ class RecordKeeper:
             raise TypeError("Parameter 'name' must be a string.")
         if not isinstance(type_, AttributeType):
             raise TypeError("Parameter 'type_' must be an AttributeType.")
-        attributes = self._payees if type_ == AttributeType.PAYEE else self._tags
-        for attribute in attributes:
-            if attribute.name == name:
-                return attribute
+        if type_ == AttributeType.PAYEE:
+            attributes, index = self._payees, self._payee_names
+        else:
+            attributes, index = self._tags, self._tag_names
+        attribute = index.get(name)
+        if attribute is not None:
+            return attribute
         # Attribute not found! Making a new one.
         logging.info(f"Creating {type_.name.title()}: '{name}'")
         attribute = Attribute(name, type_)
         attributes.append(attribute)
+        index.add(attribute)
+        self._version += 1
         return attribute
 
     def serialize(
         self,
         progress_callable: Callable[[int], None],
     ) -> dict[str, Any]:
-        serialized_currencies = [currency.serialize() for currency in self._currencies]
-        base_currency_code = (
-            self._base_currency.code if self._base_currency is not None else None
-        )
-
         serialized_exchange_rates = []
         no_of_exchange_rates = len(self._exchange_rates)
         step = no_of_exchange_rates // 33
@@ -1442,6 +1673,76 @@ class RecordKeeper:
             if (done + 1) == no_of_securities:
                 progress_callable(66)
 
+        # transactions are serialized sorted, which speeds up deserialization
+        sorted_transactions = tuple(self._transactions)
+        serialized_transactions = []
+        no_of_transactions = len(sorted_transactions)
+        step = no_of_transactions // 34
+        step = 1 if step == 0 else step
+        for done, security in enumerate(sorted_transactions):
+            serialized_transaction = security.serialize()
+            serialized_transactions.append(serialized_transaction)
+            if (done + 1) % step == 0:
+                progress = int(66 + done / no_of_transactions * 34)
+                progress_callable(progress)
+            if (done + 1) == no_of_transactions:
+                progress_callable(100)
+
+        return {
+            **self._serialize_unkeyed_sections(),
+            "exchange_rates": serialized_exchange_rates,
+            "securities": serialized_securities,
+            "transactions": serialized_transactions,
+        }
+
+    def serialize_changes(self, version: int) -> dict[str, Any]:
+        """Returns the serialized data which changed since this RecordKeeper reached
+        the given version. The sections which are not tracked per item are always
+        returned whole, like by serialize(). The exchange_rates, securities and
+        transactions sections are returned whole only if they changed as a whole
+        (e.g. by renaming a Category referenced by transactions), otherwise as
+        dicts of the serialized changed items ("put") and the keys of the removed
+        items ("delete")."""
+
+        data = self._serialize_unkeyed_sections()
+        sections: dict[str, Collection[Any]] = {
+            "exchange_rates": self._exchange_rates,
+            "securities": self._securities,
+            "transactions": self._transactions,
+        }
+        for section, items in sections.items():
+            if self._changed_sections.get(section, -1) >= version:
+                data[section] = [item.serialize() for item in items]
+                continue
+            changed_items = self._changed_items[section]
+            if section != "transactions":
+                # new items are put after the existing ones, in the order of
+                # the list they were appended to
+                changed_items = {
+                    item: changed_items[item] for item in items if item in changed_items
+                }
+            # transactions keep the order in which they were first changed, so
+            # new RefundTransactions follow their refunded transactions
+            data[section] = {
+                "put": [
+                    item.serialize()
+                    for item, changed_version in changed_items.items()
+                    if changed_version >= version
+                ],
+                "delete": [
+                    key
+                    for key, removed_version in self._removed_items[section].items()
+                    if removed_version >= version
+                ],
+            }
+        return data
+
+    def _serialize_unkeyed_sections(self) -> dict[str, Any]:
+        serialized_currencies = [currency.serialize() for currency in self._currencies]
+        base_currency_code = (
+            self._base_currency.code if self._base_currency is not None else None
+        )
+
         sorted_account_groups = sorted(self._account_groups, key=lambda x: x.path)
         serialized_account_groups = [
             account_group.serialize() for account_group in sorted_account_groups
@@ -1474,27 +1775,10 @@ class RecordKeeper:
             category.path for category in self._root_dual_purpose_categories
         ]
 
-        # Sorting transactions here speeds up sorting during deserialization
-        sorted_transactions = sorted(self._transactions, key=lambda x: x.timestamp)
-        serialized_transactions = []
-        no_of_transactions = len(sorted_transactions)
-        step = no_of_transactions // 34
-        step = 1 if step == 0 else step
-        for done, security in enumerate(sorted_transactions):
-            serialized_transaction = security.serialize()
-            serialized_transactions.append(serialized_transaction)
-            if (done + 1) % step == 0:
-                progress = int(66 + done / no_of_transactions * 34)
-                progress_callable(progress)
-            if (done + 1) == no_of_transactions:
-                progress_callable(100)
-
         return {
             "datatype": "RecordKeeper",
             "currencies": serialized_currencies,
             "base_currency_code": base_currency_code,
-            "exchange_rates": serialized_exchange_rates,
-            "securities": serialized_securities,
             "account_groups": serialized_account_groups,
             "accounts": serialized_accounts,
             "root_account_items": root_item_references,
@@ -1504,7 +1788,6 @@ class RecordKeeper:
             "root_income_categories": root_income_category_refs,
             "root_expense_categories": root_expense_category_refs,
             "root_dual_purpose_categories": root_dual_purpose_category_refs,
-            "transactions": serialized_transactions,
         }
 
     @staticmethod
@@ -1523,13 +1806,13 @@ class RecordKeeper:
         obj._exchange_rates = RecordKeeper._deserialize_exchange_rates(
             data["exchange_rates"], currencies, progress_callable
         )
-        for exchange_rate in obj._exchange_rates:
-            exchange_rate.event_reset_currency_caches.append(obj._reset_currency_caches)
+        obj._currency_graph.rebuild(obj._currencies)
 
         securities = RecordKeeper._deserialize_securities(
             data["securities"], currencies, progress_callable
         )
         obj._securities = list(securities.values())
+        obj._subscribe_to_price_events()
 
         account_groups = RecordKeeper._deserialize_account_groups(
             data["account_groups"]
@@ -1585,16 +1868,7 @@ class RecordKeeper:
             progress_callable,
         )
 
-        # Sorting transactions here is useful because front-end can assume that
-        # upon load of RecordKeeper._transactions, transactions are already sorted
-        # in descending order
-        obj._transactions = sorted(
-            obj._transactions_uuid_dict.values(),
-            key=lambda x: x.timestamp,
-            reverse=True,
-        )
-
-        for transaction in obj._transactions:
+        for transaction in obj._transactions_uuid_dict.values():
             if isinstance(transaction, CashTransaction):
                 obj._cash_transactions.append(transaction)
             elif isinstance(transaction, RefundTransaction):
@@ -1610,19 +1884,17 @@ class RecordKeeper:
                     f"Unknown transaction type: {type(transaction)}"
                 )
 
-        for account in obj._accounts:
-            account: CashAccount | SecurityAccount
-            account.allow_update_balance = True
-            if isinstance(account, CashAccount):
-                account.update_balance()
-            else:
-                account.update_securities()
-
-        # this sort is needed because updating CashAccount balance can change timestamps
-        obj._transactions.sort(
-            key=lambda x: x.timestamp,
-            reverse=True,
-        )
+        with obj.batch():
+            for account in obj._accounts:
+                account: CashAccount | SecurityAccount
+                account.allow_update_balance = True
+                if isinstance(account, CashAccount):
+                    account.update_balance()
+                else:
+                    account.update_securities()
+
+        # the store is built after the balance updates, which can change timestamps
+        obj._transactions = TransactionStore(obj._transactions_uuid_dict.values())
         obj._update_descriptions()
 
         return obj
@@ -1795,7 +2067,7 @@ class RecordKeeper:
         return _transaction_dict
 
     def _check_account_exists(self, path: str) -> None:
-        if any(account.path == path for account in self._accounts):
+        if self._account_paths.get(path) is not None:
             raise AlreadyExistsError(f"An Account with path={path} already exists.")
 
     def _create_category_amount_pairs(
@@ -1826,12 +2098,106 @@ class RecordKeeper:
 
     TransactionType = TypeVar("TransactionType", bound=Transaction)
 
+    def _get_snapshot(
+        self, key: str, build: Callable[[], tuple[Any, ...]]
+    ) -> tuple[Any, ...]:
+        if self._snapshot_version != self._version:
+            self._snapshots = {}
+            self._snapshot_version = self._version
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            snapshot = build()
+            self._snapshots[key] = snapshot
+        return snapshot
+
+    @contextmanager
+    def _defer_account_updates(
+        self, edited: Collection[Transaction] = ()
+    ) -> Iterator[None]:
+        """Blocks Account balance and securities updates within this scope. When
+        the scope exits (even due to an exception), each outdated Account replays
+        the edited Transactions, or is rebuilt once if there are none or too many
+        of them, and AccountGroup balances are recalculated once. The edited
+        Transactions and those whose datetime was shifted by a rebuild are then
+        moved to their new positions in the TransactionStore."""
+
+        deferred_accounts: list[CashAccount | SecurityAccount] = [
+            account for account in self._accounts if account.allow_update_balance
+        ]
+        for account in deferred_accounts:
+            account.allow_update_balance = False
+        try:
+            yield
+        finally:
+            outdated_accounts = [
+                account for account in deferred_accounts if account.balance_outdated
+            ]
+            for account in deferred_accounts:
+                if not account.balance_outdated:
+                    account.allow_update_balance = True
+            replay = 0 < len(edited) <= RecordKeeper.REPLAY_MAX_TRANSACTIONS
+            rebuilt_accounts: list[CashAccount | SecurityAccount] = []
+            # outdated Accounts stay blocked until their turn, so the datetime
+            # settling of a replayed transaction does not rebuild them
+            try:
+                with self.batch():
+                    for account in outdated_accounts:
+                        account.allow_update_balance = True
+                        if replay:
+                            account.replay_transactions(edited)
+                        elif isinstance(account, CashAccount):
+                            account.update_balance()
+                            rebuilt_accounts.append(account)
+                        else:
+                            account.update_securities()
+                            rebuilt_accounts.append(account)
+            finally:
+                for account in outdated_accounts:
+                    account.allow_update_balance = True
+            # replays shift only the edited transactions, rebuilds may shift any
+            # transactions sharing the same datetime
+            changed = dict.fromkeys(
+                transaction
+                for transaction in edited
+                if transaction in self._transactions
+            )
+            for account in rebuilt_accounts:
+                changed.update(
+                    dict.fromkeys(self._transactions.get_moved(account.transactions))
+                )
+            self._transactions.update(changed)
+            self._mark_changed("transactions", changed)
+            if outdated_accounts:
+                self._version += 1
+
+    def _discard_transactions(self, transactions: Collection[Transaction]) -> None:
+        """Removes detached Transactions from the transaction lists with a single
+        filtered pass over each list."""
+
+        if not transactions:
+            return
+
+        def keep(transaction: Transaction) -> bool:
+            return transaction not in transactions
+
+        self._transactions.remove_many(transactions)
+        self._mark_removed("transactions", transactions)
+        self._cash_transactions = list(filter(keep, self._cash_transactions))
+        self._refund_transactions = list(filter(keep, self._refund_transactions))
+        self._cash_transfers = list(filter(keep, self._cash_transfers))
+        self._security_transactions = list(filter(keep, self._security_transactions))
+        self._security_transfers = list(filter(keep, self._security_transfers))
+        for transaction in transactions:
+            del self._transactions_uuid_dict[transaction.uuid]
+            self._remove_description(transaction.description)
+
     def _get_transactions(
         self, uuids: Collection[UUID], type_: type[TransactionType]
     ) -> list[TransactionType]:
         transactions: list[RecordKeeper.TransactionType] = []
         if any(not isinstance(uuid_, UUID) for uuid_ in uuids):
             raise TypeError("Parameter 'uuids' must be a Collection ofUUID objects.")
+        uuids = frozenset(uuids)
         for transaction in self._transactions:
             if transaction.uuid in uuids:
                 if not isinstance(transaction, type_):
@@ -1944,8 +2310,10 @@ class RecordKeeper:
         return resulting_list
 
     def _save_category(self, category: Category) -> None:
-        if category not in self._categories:
+        if self._category_paths.get(category.path) is not category:
             self._categories.append(category)
+            self._category_paths.add(category)
+            self._version += 1
 
         if category.parent is not None:
             return
@@ -1977,6 +2345,40 @@ class RecordKeeper:
             if transaction.description:
                 self._descriptions[transaction.description] += 1
 
+    def _subscribe_to_price_events(self) -> None:
+        for exchange_rate in self._exchange_rates:
+            exchange_rate.event_reset_currency_caches.append(
+                self._reset_currency_caches
+            )
+            exchange_rate.event_rates_changed.append(
+                partial(self._item_changed, "exchange_rates", exchange_rate)
+            )
+        for security in self._securities:
+            security.event_prices_changed.append(
+                partial(self._item_changed, "securities", security)
+            )
+
+    def _item_changed(self, section: str, item: Security | ExchangeRate) -> None:
+        """Called by Securities and ExchangeRates, whose prices and rates are
+        edited directly rather than through this RecordKeeper."""
+        self._mark_changed(section, (item,))
+        self._version += 1
+
+    def _mark_changed(self, section: str, items: Iterable[Any]) -> None:
+        changed_items = self._changed_items[section]
+        for item in items:
+            changed_items[item] = self._version
+
+    def _mark_removed(self, section: str, items: Iterable[Any]) -> None:
+        get_key = _ITEM_SECTIONS[section]
+        changed_items = self._changed_items[section]
+        removed_items = self._removed_items[section]
+        for item in items:
+            changed_items.pop(item, None)
+            removed_items[get_key(item)] = self._version
+
+    def _mark_section_changed(self, section: str) -> None:
+        self._changed_sections[section] = self._version
+
     def _reset_currency_caches(self) -> None:
-        for currency in self._currencies:
-            currency.reset_cache()
+        self._currency_graph.reset_caches()
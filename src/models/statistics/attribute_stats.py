@@ -1,7 +1,7 @@
 from collections import defaultdict
 from collections.abc import Collection
 from dataclasses import dataclass, field
-from datetime import timedelta
+from datetime import date, timedelta
 
 from src.models.base_classes.transaction import Transaction
 from src.models.model_objects.attributes import Attribute, AttributeType
@@ -9,12 +9,19 @@ from src.models.model_objects.cash_objects import (
     CashTransaction,
     RefundTransaction,
 )
-from src.models.model_objects.currency_objects import CashAmount, Currency
+from src.models.model_objects.currency_objects import (
+    CashAmount,
+    Currency,
+    convert_many,
+)
 from src.models.model_objects.security_objects import (
     SecurityTransaction,
     SecurityTransactionType,
 )
-from src.models.statistics.common_classes import TransactionBalance
+from src.models.statistics.common_classes import (
+    TransactionBalance,
+    add_converted_values,
+)
 
 
 @dataclass
@@ -106,7 +113,7 @@ def calculate_periodic_totals_and_averages(
 
         for stat in stats:
             total_period_balance.transactions |= stat.transactions
-            total_period_balance.balance += stat.balance
+            total_period_balance.add_balance(stat.balance)
 
             add_balance(
                 attribute_totals, stat.attribute, stat.transactions, stat.balance
@@ -218,6 +225,8 @@ def calculate_attribute_stats(
     if base_currency is None:
         return stats_dict
 
+    # amounts are collected first and converted to base Currency in bulk
+    pending: list[tuple[AttributeStats, CashAmount, date]] = []
     for transaction in transactions:
         if not isinstance(
             transaction, (CashTransaction, RefundTransaction, SecurityTransaction)
@@ -229,9 +238,10 @@ def calculate_attribute_stats(
 
         if attribute_type == AttributeType.TAG:
             for tag in transaction.tags:
-                add_to_stats(stats_dict[tag], transaction)
+                add_to_stats(stats_dict[tag], transaction, pending)
         elif hasattr(transaction, "payee"):
-            add_to_stats(stats_dict[transaction.payee], transaction)
+            add_to_stats(stats_dict[transaction.payee], transaction, pending)
+    add_pending_amounts(pending, base_currency)
 
     return stats_dict
 
@@ -244,6 +254,7 @@ def split_attribute_stats(
     income_stats = AttributeStats(stats.attribute, 0, base_currency.zero_amount)
     expense_stats = AttributeStats(stats.attribute, 0, base_currency.zero_amount)
 
+    pending: list[tuple[AttributeStats, CashAmount, date]] = []
     for transaction in stats.transactions:
         target = (
             income_stats
@@ -259,7 +270,8 @@ def split_attribute_stats(
             )
             else expense_stats
         )
-        add_to_stats(target, transaction)
+        add_to_stats(target, transaction, pending)
+    add_pending_amounts(pending, base_currency)
 
     return income_stats, expense_stats
 
@@ -267,16 +279,27 @@ def split_attribute_stats(
 def add_to_stats(
     target: AttributeStats,
     transaction: CashTransaction | RefundTransaction | SecurityTransaction,
+    pending: list[tuple[AttributeStats, CashAmount, date]],
 ) -> None:
+    """Adds the transaction to target and appends its amount to pending.
+    The balance of target is updated by add_pending_amounts()."""
+
     if target.attribute.type_ == AttributeType.TAG:
         amount = transaction.get_amount_for_tag(target.attribute)
-        if amount.value_normalized != 0:
-            target.balance += amount.convert(target.balance.currency, transaction.date_)
-            target.transactions.add(transaction)
-            target.no_of_transactions += 1
+        if amount.value_normalized == 0:
+            return
     else:
-        target.balance += transaction.get_amount().convert(
-            target.balance.currency, transaction.date_
-        )
-        target.transactions.add(transaction)
-        target.no_of_transactions += 1
+        amount = transaction.get_amount()
+    pending.append((target, amount, transaction.date_))
+    target.transactions.add(transaction)
+    target.no_of_transactions += 1
+
+
+def add_pending_amounts(
+    pending: list[tuple[AttributeStats, CashAmount, date]], currency: Currency
+) -> None:
+    """Converts the pending amounts to currency in bulk and adds them to the
+    balances of their AttributeStats."""
+
+    values = convert_many(((amount, date_) for _, amount, date_ in pending), currency)
+    add_converted_values((stats for stats, _, _ in pending), values)
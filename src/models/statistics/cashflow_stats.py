@@ -13,7 +13,11 @@ from src.models.model_objects.cash_objects import (
     CashTransfer,
     RefundTransaction,
 )
-from src.models.model_objects.currency_objects import Currency
+from src.models.model_objects.currency_objects import (
+    CashAmount,
+    Currency,
+    convert_many,
+)
 from src.models.model_objects.security_objects import (
     SecurityTransaction,
     SecurityTransactionType,
@@ -21,6 +25,8 @@ from src.models.model_objects.security_objects import (
 )
 from src.models.statistics.common_classes import TransactionBalance
 
+_Pending = list[tuple[TransactionBalance, CashAmount, date]]
+
 
 class PeriodType(Enum):
     MONTH = auto()
@@ -108,103 +114,27 @@ def calculate_cash_flow(
     if end_date is None:
         end_date = transactions[-1].date_
 
-    start_balance = base_currency.zero_amount
-    end_balance = base_currency.zero_amount
-    delta_security = base_currency.zero_amount
-    for account in accounts:
-        # start balance is the ending balance of previous day
-        _start_balance = account.get_balance(
-            base_currency, start_date - timedelta(days=1)
-        )
-        _end_balance = account.get_balance(base_currency, end_date)
-        start_balance += _start_balance
-        end_balance += _end_balance
-        if isinstance(account, CashAccount):
-            initial_balance_date = account.balance_history[0][0].date()
-            if start_date <= initial_balance_date <= end_date:
-                stats.initial_balances += account.initial_balance.convert(
-                    base_currency, initial_balance_date
-                )
-        else:
-            delta_security -= _start_balance
-            delta_security += _end_balance
+    start_balance, end_balance, delta_security = _collect_balances(
+        stats, accounts, base_currency, start_date, end_date
+    )
 
+    # amounts are collected first and converted to base Currency in bulk
+    security_performance = TransactionBalance(delta_security)
+    pending: _Pending = []
     for transaction in transactions:
         date_ = transaction.date_
         if date_ < start_date or date_ > end_date:
             raise ValueError(f"Unexpected Transaction date: {date_}")
-        if isinstance(transaction, CashTransaction):
-            if transaction.type_ == CashTransactionType.INCOME:
-                stats.incomes.balance += transaction.amount.convert(
-                    base_currency, date_
-                )
-                stats.incomes.transactions.add(transaction)
-            else:
-                stats.expenses.balance += transaction.amount.convert(
-                    base_currency, date_
-                )
-                stats.expenses.transactions.add(transaction)
-        elif isinstance(transaction, RefundTransaction):
-            stats.refunds.balance += transaction.amount.convert(base_currency, date_)
-            stats.refunds.transactions.add(transaction)
-        elif isinstance(transaction, CashTransfer):
-            if transaction.sender in accounts and transaction.recipient in accounts:
-                continue
-            if transaction.sender in accounts:
-                stats.outward_transfers.balance += transaction.amount_sent.convert(
-                    base_currency, date_
-                )
-                stats.outward_transfers.transactions.add(transaction)
-            if transaction.recipient in accounts:
-                stats.inward_transfers.balance += transaction.amount_received.convert(
-                    base_currency, date_
-                )
-                stats.inward_transfers.transactions.add(transaction)
-        elif isinstance(transaction, SecurityTransaction):
-            if (
-                transaction.cash_account in accounts
-                and transaction.security_account in accounts
-            ):
-                if transaction.type_ == SecurityTransactionType.BUY:
-                    delta_security -= transaction.amount.convert(base_currency, date_)
-                else:
-                    delta_security += transaction.amount.convert(base_currency, date_)
-            elif transaction.cash_account in accounts:
-                if transaction.type_ == SecurityTransactionType.BUY:
-                    stats.outward_transfers.balance += transaction.amount.convert(
-                        base_currency, date_
-                    )
-                    stats.outward_transfers.transactions.add(transaction)
-                else:
-                    stats.inward_transfers.balance += transaction.amount.convert(
-                        base_currency, date_
-                    )
-                    stats.inward_transfers.transactions.add(transaction)
-            elif transaction.type_ == SecurityTransactionType.BUY:
-                stats.inward_transfers.balance += transaction.amount.convert(
-                    base_currency, date_
-                )
-                stats.inward_transfers.transactions.add(transaction)
-            else:
-                stats.outward_transfers.balance += transaction.amount.convert(
-                    base_currency, date_
-                )
-                stats.outward_transfers.transactions.add(transaction)
-        elif isinstance(transaction, SecurityTransfer):
-            if transaction.sender in accounts and transaction.recipient in accounts:
-                pass
-            elif transaction.sender in accounts:
-                shares = transaction.shares
-                security = transaction.security
-                amount = shares * security.get_price(date_)
-                stats.outward_transfers.balance += amount
-                stats.outward_transfers.transactions.add(transaction)
-            else:
-                shares = transaction.shares
-                security = transaction.security
-                amount = shares * security.get_price(date_)
-                stats.inward_transfers.balance += amount
-                stats.inward_transfers.transactions.add(transaction)
+        _collect_transaction(
+            stats, transaction, accounts, security_performance, pending
+        )
+
+    values = convert_many(
+        ((amount, date_) for _, amount, date_ in pending), base_currency
+    )
+    for (target, _, _), value in zip(pending, values, strict=True):
+        target.add_value(value)
+    delta_security = security_performance.balance
 
     stats.inflows = stats.incomes + stats.inward_transfers + stats.refunds
     stats.inflows.balance += stats.initial_balances
@@ -231,6 +161,131 @@ def calculate_cash_flow(
     return stats
 
 
+def _collect_balances(
+    stats: CashFlowStats,
+    accounts: Collection[Account],
+    base_currency: Currency,
+    start_date: date,
+    end_date: date,
+) -> tuple[CashAmount, CashAmount, CashAmount]:
+    start_balance = base_currency.zero_amount
+    end_balance = base_currency.zero_amount
+    delta_security = base_currency.zero_amount
+    for account in accounts:
+        # start balance is the ending balance of previous day
+        _start_balance = account.get_balance(
+            base_currency, start_date - timedelta(days=1)
+        )
+        _end_balance = account.get_balance(base_currency, end_date)
+        start_balance += _start_balance
+        end_balance += _end_balance
+        if isinstance(account, CashAccount):
+            initial_balance_date = account.balance_history[0][0].date()
+            if start_date <= initial_balance_date <= end_date:
+                stats.initial_balances += account.initial_balance.convert(
+                    base_currency, initial_balance_date
+                )
+        else:
+            delta_security -= _start_balance
+            delta_security += _end_balance
+    return start_balance, end_balance, delta_security
+
+
+def _collect_transaction(
+    stats: CashFlowStats,
+    transaction: Transaction,
+    accounts: Collection[Account],
+    security_performance: TransactionBalance,
+    pending: _Pending,
+) -> None:
+    if isinstance(transaction, CashTransaction):
+        target = (
+            stats.incomes
+            if transaction.type_ == CashTransactionType.INCOME
+            else stats.expenses
+        )
+        _add_pending(target, transaction, transaction.amount, pending)
+    elif isinstance(transaction, RefundTransaction):
+        _add_pending(stats.refunds, transaction, transaction.amount, pending)
+    elif isinstance(transaction, CashTransfer):
+        _collect_cash_transfer(stats, transaction, accounts, pending)
+    elif isinstance(transaction, SecurityTransaction):
+        _collect_security_transaction(
+            stats, transaction, accounts, security_performance, pending
+        )
+    elif isinstance(transaction, SecurityTransfer):
+        _collect_security_transfer(stats, transaction, accounts, pending)
+
+
+def _add_pending(
+    target: TransactionBalance,
+    transaction: Transaction,
+    amount: CashAmount,
+    pending: _Pending,
+) -> None:
+    pending.append((target, amount, transaction.date_))
+    target.transactions.add(transaction)
+
+
+def _collect_cash_transfer(
+    stats: CashFlowStats,
+    transaction: CashTransfer,
+    accounts: Collection[Account],
+    pending: _Pending,
+) -> None:
+    if transaction.sender in accounts and transaction.recipient in accounts:
+        return
+    if transaction.sender in accounts:
+        _add_pending(
+            stats.outward_transfers, transaction, transaction.amount_sent, pending
+        )
+    if transaction.recipient in accounts:
+        _add_pending(
+            stats.inward_transfers, transaction, transaction.amount_received, pending
+        )
+
+
+def _collect_security_transaction(
+    stats: CashFlowStats,
+    transaction: SecurityTransaction,
+    accounts: Collection[Account],
+    security_performance: TransactionBalance,
+    pending: _Pending,
+) -> None:
+    is_buy = transaction.type_ == SecurityTransactionType.BUY
+    if (
+        transaction.cash_account in accounts
+        and transaction.security_account in accounts
+    ):
+        amount = -transaction.amount if is_buy else transaction.amount
+        pending.append((security_performance, amount, transaction.date_))
+        return
+    # a buy leaves the cash account and enters the security account
+    if (transaction.cash_account in accounts) == is_buy:
+        target = stats.outward_transfers
+    else:
+        target = stats.inward_transfers
+    _add_pending(target, transaction, transaction.amount, pending)
+
+
+def _collect_security_transfer(
+    stats: CashFlowStats,
+    transaction: SecurityTransfer,
+    accounts: Collection[Account],
+    pending: _Pending,
+) -> None:
+    if transaction.sender in accounts and transaction.recipient in accounts:
+        return
+    # the value in Security currency is converted to base Currency with the rest
+    amount = transaction.shares * transaction.security.get_price(transaction.date_)
+    target = (
+        stats.outward_transfers
+        if transaction.sender in accounts
+        else stats.inward_transfers
+    )
+    _add_pending(target, transaction, amount, pending)
+
+
 def calculate_periodic_cash_flow(
     transactions: Collection[Transaction],
     accounts: Collection[Account],
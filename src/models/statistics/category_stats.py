@@ -1,6 +1,6 @@
 from collections.abc import Collection, Sequence
 from dataclasses import dataclass, field
-from datetime import timedelta
+from datetime import date, timedelta
 
 from src.models.model_objects.attributes import Category
 from src.models.model_objects.cash_objects import (
@@ -8,8 +8,15 @@ from src.models.model_objects.cash_objects import (
     CashTransactionType,
     RefundTransaction,
 )
-from src.models.model_objects.currency_objects import CashAmount, Currency
-from src.models.statistics.common_classes import TransactionBalance
+from src.models.model_objects.currency_objects import (
+    CashAmount,
+    Currency,
+    convert_many,
+)
+from src.models.statistics.common_classes import (
+    TransactionBalance,
+    add_converted_values,
+)
 
 
 @dataclass
@@ -68,7 +75,7 @@ def calculate_periodic_totals_and_averages(
             )
 
             if stat.category.parent is None:
-                total_balance.balance += stat.balance
+                total_balance.add_balance(stat.balance)
                 income_data = TransactionBalance(currency.zero_amount)
                 expense_data = TransactionBalance(currency.zero_amount)
 
@@ -164,6 +171,8 @@ def calculate_category_stats(
     if base_currency is None:
         return stats_dict  # no base Currency means no Transactions
 
+    # amounts are collected first and converted to base Currency in bulk
+    pending: list[tuple[CategoryStats, CashAmount, date]] = []
     for transaction in transactions:
         already_counted_ancestors = set()
         date_ = transaction.date_
@@ -175,7 +184,7 @@ def calculate_category_stats(
             stats = stats_dict[category]
             stats.transactions.add(transaction)
 
-            stats.balance += _amount.convert(base_currency, date_)
+            pending.append((stats, _amount, date_))
             stats.transactions_self += 1
             stats.transactions_total += 1
 
@@ -188,9 +197,18 @@ def calculate_category_stats(
                     and ancestor not in already_counted_ancestors
                 ):
                     ancestor_stats.transactions_total += 1
-                    ancestor_stats.balance += transaction.get_amount_for_category(
-                        ancestor, total=True
-                    ).convert(base_currency, date_)
+                    pending.append(
+                        (
+                            ancestor_stats,
+                            transaction.get_amount_for_category(ancestor, total=True),
+                            date_,
+                        )
+                    )
                     already_counted_ancestors.add(ancestor)
 
+    values = convert_many(
+        ((amount, date_) for _, amount, date_ in pending), base_currency
+    )
+    add_converted_values((stats for stats, _, _ in pending), values)
+
     return stats_dict
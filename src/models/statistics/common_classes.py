@@ -1,9 +1,9 @@
-from collections.abc import Collection
+from collections.abc import Collection, Iterable
 from decimal import Decimal
-from typing import Self
+from typing import Protocol, Self
 
 from src.models.base_classes.transaction import Transaction
-from src.models.model_objects.currency_objects import CashAmount
+from src.models.model_objects.currency_objects import CashAccumulator, CashAmount
 
 
 class TransactionBalance:
@@ -21,6 +21,14 @@ class TransactionBalance:
         else:
             self.transactions = set()
 
+    @property
+    def balance(self) -> CashAmount:
+        return self._accumulator.to_cash_amount()
+
+    @balance.setter
+    def balance(self, value: CashAmount) -> None:
+        self._accumulator = CashAccumulator(value)
+
     def __repr__(self) -> str:
         return (
             f"TransactionBalance({self.balance.to_str_normalized()}, len={len(self)})"
@@ -50,4 +58,32 @@ class TransactionBalance:
         balance: CashAmount,
     ) -> None:
         self.transactions = self.transactions.union(transactions)
-        self.balance += balance
+        self._accumulator.add(balance)
+
+    def add_balance(self, balance: CashAmount) -> None:
+        self._accumulator.add(balance)
+
+    def add_value(self, value: Decimal) -> None:
+        """Adds a raw value which is already in the balance Currency."""
+        self._accumulator.add_value(value)
+
+
+class _HasBalance(Protocol):
+    balance: CashAmount
+
+
+def add_converted_values(
+    targets: Iterable[_HasBalance], values: Iterable[Decimal]
+) -> None:
+    """Adds raw values (already converted to each target's balance Currency) to
+    the balances of the targets, creating only one CashAmount per target."""
+
+    accumulators: dict[int, tuple[_HasBalance, CashAccumulator]] = {}
+    for target, value in zip(targets, values, strict=True):
+        entry = accumulators.get(id(target))
+        if entry is None:
+            entry = (target, CashAccumulator(target.balance))
+            accumulators[id(target)] = entry
+        entry[1].add_value(value)
+    for target, accumulator in accumulators.values():
+        target.balance = accumulator.to_cash_amount()
@@ -0,0 +1,111 @@
+from bisect import bisect_right
+from collections.abc import Callable, Collection, Hashable
+from datetime import date
+from decimal import Decimal
+from typing import Generic, TypeVar
+
+from dateutil.relativedelta import relativedelta
+from src.utilities.decimal_history import DecimalHistory
+
+SeriesType = TypeVar("SeriesType", bound=Hashable)
+
+Periods = dict[str, tuple[date | None, date]]
+
+
+def get_return_periods(today: date) -> Periods:
+    """Returns the (start, end) dates of the periods shown in the Security and
+    Currency forms. Start None means the beginning of the series."""
+    return {
+        "1D": (today - relativedelta(days=1), today),
+        "7D": (today - relativedelta(days=7), today),
+        "1M": (today - relativedelta(months=1), today),
+        "3M": (today - relativedelta(months=3), today),
+        "6M": (today - relativedelta(months=6), today),
+        "1Y": (today - relativedelta(years=1), today),
+        "2Y": (today - relativedelta(years=2), today),
+        "3Y": (today - relativedelta(years=3), today),
+        "5Y": (today - relativedelta(years=5), today),
+        "7Y": (today - relativedelta(years=7), today),
+        "10Y": (today - relativedelta(years=10), today),
+        "YTD": (today.replace(month=1, day=1), today),
+        "Total": (None, today),
+    }
+
+
+class ReturnsCalculator(Generic[SeriesType]):
+    """Calculates percentage returns of price or rate series over a set of
+    periods, equivalent to calling calculate_return for every period.
+
+    Results are cached per series and recalculated only when the version
+    of the series' DecimalHistory changes or when the periods change."""
+
+    __slots__ = ("_cache", "_get_history", "_periods")
+
+    def __init__(self, get_history: Callable[[SeriesType], DecimalHistory]) -> None:
+        self._get_history = get_history
+        self._periods: Periods = {}
+        self._cache: dict[SeriesType, tuple[int, dict[str, Decimal]]] = {}
+
+    def calculate(
+        self, series: Collection[SeriesType], periods: Periods
+    ) -> dict[SeriesType, dict[str, Decimal]]:
+        """Returns a dictionary of period returns for every series. If 'Total'
+        is one of the periods, annualized 'Total p.a.' is added too."""
+
+        if periods != self._periods:
+            self._periods = dict(periods)
+            self._cache = {}
+
+        cache: dict[SeriesType, tuple[int, dict[str, Decimal]]] = {}
+        returns: dict[SeriesType, dict[str, Decimal]] = {}
+        for item in series:
+            history = self._get_history(item)
+            cached = self._cache.get(item)
+            if cached is None or cached[0] != history.version:
+                cached = (history.version, self._calculate_series(history))
+            cache[item] = cached
+            returns[item] = dict(cached[1])
+        # drop the series which are no longer present
+        self._cache = cache
+        return returns
+
+    def _calculate_series(self, history: DecimalHistory) -> dict[str, Decimal]:
+        ordinals = history.ordinals
+        if len(ordinals) == 0:
+            returns = {period: Decimal("NaN") for period in self._periods}
+            if "Total" in self._periods:
+                returns["Total p.a."] = Decimal("NaN")
+            return returns
+
+        earliest = ordinals[0]
+        # periods mostly share the same end date, look each date up only once
+        values: dict[int, Decimal] = {}
+
+        def get_value(ordinal: int) -> Decimal:
+            if ordinal not in values:
+                index = bisect_right(ordinals, ordinal)
+                values[ordinal] = (
+                    history.value_at(index - 1) if index else Decimal("NaN")
+                )
+            return values[ordinal]
+
+        returns: dict[str, Decimal] = {}
+        for period, (start, end) in self._periods.items():
+            start_ordinal = earliest if start is None else start.toordinal()
+            if start_ordinal < earliest:
+                returns[period] = Decimal("NaN")
+                continue
+            value_start = get_value(start_ordinal)
+            value_end = get_value(end.toordinal())
+            returns[period] = Decimal(100 * (value_end / value_start - 1))
+
+        if "Total" in returns:
+            days = ordinals[-1] - earliest
+            if days == 0:
+                returns["Total p.a."] = Decimal(0)
+            else:
+                exponent = Decimal(365) / Decimal(days)
+                returns["Total p.a."] = 100 * (
+                    ((1 + returns["Total"] / 100) ** exponent) - 1
+                )
+        return returns
@@ -28,7 +28,14 @@ class CashAmountFilter(BaseTransactionFilter):
     If no path to the currency of the CashAmountFilter is found, the filter accepts
     CashRelatedTransactions by default."""
 
-    __slots__ = ("_currency", "_maximum", "_minimum", "_mode")
+    __slots__ = (
+        "_currency",
+        "_maximum",
+        "_maximum_units",
+        "_minimum",
+        "_minimum_units",
+        "_mode",
+    )
 
     def __init__(
         self, minimum: CashAmount | None, maximum: CashAmount | None, mode: FilterMode
@@ -39,6 +46,9 @@ class CashAmountFilter(BaseTransactionFilter):
 
         self._minimum = minimum
         self._maximum = maximum
+        # integer bounds in minor units, used for amounts which have them
+        self._minimum_units = _get_units_bound(minimum, ceiling=True)
+        self._maximum_units = _get_units_bound(maximum, ceiling=False)
 
     @property
     def minimum(self) -> CashAmount | None:
@@ -84,7 +94,7 @@ class CashAmountFilter(BaseTransactionFilter):
             amounts = self._convert_amounts(amounts)
         except ConversionFactorNotFoundError:
             return True
-        return any(self._minimum <= amount <= self._maximum for amount in amounts)
+        return any(self._is_in_range(amount) for amount in amounts)
 
     def _keep_in_discard_mode(self, transaction: Transaction) -> bool:
         if not isinstance(transaction, CashRelatedTransaction):
@@ -94,9 +104,14 @@ class CashAmountFilter(BaseTransactionFilter):
             amounts = self._convert_amounts(amounts)
         except ConversionFactorNotFoundError:
             return True
-        return any(
-            amount < self._minimum or amount > self._maximum for amount in amounts
-        )
+        return any(not self._is_in_range(amount) for amount in amounts)
+
+    def _is_in_range(self, amount: CashAmount) -> bool:
+        if self._minimum_units is not None and self._maximum_units is not None:
+            units = amount.minor_units
+            if units is not None:
+                return self._minimum_units <= units <= self._maximum_units
+        return self._minimum <= amount <= self._maximum
 
     def _get_amounts(
         self, transaction: CashRelatedTransaction
@@ -147,3 +162,15 @@ class CashAmountFilter(BaseTransactionFilter):
             self._currency = minimum.currency
         else:
             self._currency = None
+
+
+def _get_units_bound(amount: CashAmount | None, *, ceiling: bool) -> int | None:
+    """Returns the smallest (ceiling) or largest integer number of minor units
+    which lies within the bound."""
+    if amount is None or not amount.is_finite():
+        return None
+    numerator, denominator = amount.value_normalized.as_integer_ratio()
+    numerator *= 10**amount.currency.decimals
+    if ceiling:
+        return -(-numerator // denominator)
+    return numerator // denominator
@@ -0,0 +1,220 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Collection, Hashable, Iterable, Iterator
+from datetime import datetime
+from operator import attrgetter
+
+from src.models.base_classes.account import Account
+from src.models.base_classes.transaction import Transaction
+from src.models.model_objects.attributes import Attribute, Category
+from src.models.model_objects.cash_objects import (
+    CashTransaction,
+    CashTransfer,
+    RefundTransaction,
+)
+from src.models.model_objects.security_objects import (
+    Security,
+    SecurityRelatedTransaction,
+    SecurityTransaction,
+)
+
+_get_timestamp = attrgetter("timestamp")
+
+
+class TransactionStore:
+    """Keeps Transactions sorted by timestamp, with secondary indexes (postings)
+    by Account, payee, tag, Category and Security.
+
+    The order and the indexes are updated by add(), remove() and update(). The
+    store cannot observe edits of its Transactions, so update() must be called
+    after the datetime, Accounts, payee, tags, Categories or Security of
+    a Transaction are changed. reindex() rebuilds everything, e.g. after Account
+    balance rebuilds shifted datetimes of Transactions sharing the same one.
+    Sorted postings are cached until the next change of the store."""
+
+    __slots__ = (
+        "_by_account",
+        "_by_category",
+        "_by_payee",
+        "_by_security",
+        "_by_tag",
+        "_keys",
+        "_sorted_postings",
+        "_timestamps",
+        "_transactions",
+    )
+
+    def __init__(self, transactions: Iterable[Transaction] = ()) -> None:
+        self._transactions: list[Transaction] = []
+        self._timestamps: list[float] = []
+        self._by_account: dict[Account, set[Transaction]] = {}
+        self._by_payee: dict[Attribute, set[Transaction]] = {}
+        self._by_tag: dict[Attribute, set[Transaction]] = {}
+        self._by_category: dict[Category, set[Transaction]] = {}
+        self._by_security: dict[Security, set[Transaction]] = {}
+        # timestamp and index keys under which each Transaction is stored
+        self._keys: dict[
+            Transaction,
+            tuple[float, tuple[tuple[dict[Hashable, set[Transaction]], Hashable], ...]],
+        ] = {}
+        # keyed by id() of the postings dict, which lives as long as the store
+        self._sorted_postings: dict[tuple[int, Hashable], tuple[Transaction, ...]] = {}
+        self._transactions.extend(transactions)
+        self.reindex()
+
+    def __len__(self) -> int:
+        return len(self._transactions)
+
+    def __iter__(self) -> Iterator[Transaction]:
+        return iter(self._transactions)
+
+    def __reversed__(self) -> Iterator[Transaction]:
+        return reversed(self._transactions)
+
+    def __contains__(self, transaction: object) -> bool:
+        return transaction in self._keys
+
+    def __repr__(self) -> str:
+        return f"TransactionStore(len={len(self._transactions)})"
+
+    def add(self, transaction: Transaction) -> None:
+        index = bisect_right(self._timestamps, transaction.timestamp)
+        self._transactions.insert(index, transaction)
+        self._timestamps.insert(index, transaction.timestamp)
+        self._index(transaction)
+        self._sorted_postings.clear()
+
+    def remove(self, transaction: Transaction) -> None:
+        timestamp, keys = self._keys.pop(transaction)
+        index = bisect_left(self._timestamps, timestamp)
+        while self._transactions[index] is not transaction:
+            index += 1
+        del self._transactions[index]
+        del self._timestamps[index]
+        for postings, key in keys:
+            self._discard_posting(postings, key, transaction)
+        self._sorted_postings.clear()
+
+    def remove_many(self, transactions: Collection[Transaction]) -> None:
+        """Removes the Transactions with a single filtered pass over the store."""
+
+        if not transactions:
+            return
+        for transaction in transactions:
+            _, keys = self._keys.pop(transaction)
+            for postings, key in keys:
+                self._discard_posting(postings, key, transaction)
+        kept = [
+            index
+            for index, transaction in enumerate(self._transactions)
+            if transaction in self._keys
+        ]
+        self._transactions = [self._transactions[index] for index in kept]
+        self._timestamps = [self._timestamps[index] for index in kept]
+        self._sorted_postings.clear()
+
+    def update(self, transactions: Iterable[Transaction]) -> None:
+        """Moves the edited Transactions to their new positions and postings."""
+
+        for transaction in transactions:
+            self.remove(transaction)
+            self.add(transaction)
+
+    def get_moved(self, transactions: Iterable[Transaction]) -> list[Transaction]:
+        """Returns the stored Transactions whose timestamp changed since they were
+        added or updated."""
+
+        keys = self._keys
+        return [
+            transaction
+            for transaction in transactions
+            if transaction in keys and keys[transaction][0] != transaction.timestamp
+        ]
+
+    def reindex(self) -> None:
+        self._transactions.sort(key=_get_timestamp)
+        self._timestamps = list(map(_get_timestamp, self._transactions))
+        for postings in (
+            self._by_account,
+            self._by_payee,
+            self._by_tag,
+            self._by_category,
+            self._by_security,
+        ):
+            postings.clear()
+        self._keys = {}
+        self._sorted_postings.clear()
+        for transaction in self._transactions:
+            self._index(transaction)
+
+    def get_between(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> tuple[Transaction, ...]:
+        """Returns Transactions from start to end (inclusive) in ascending order."""
+
+        lo = 0 if start is None else bisect_left(self._timestamps, start.timestamp())
+        hi = (
+            len(self._timestamps)
+            if end is None
+            else bisect_right(self._timestamps, end.timestamp())
+        )
+        return tuple(self._transactions[lo:hi])
+
+    def get_by_account(self, account: Account) -> tuple[Transaction, ...]:
+        return self._get_sorted_postings(self._by_account, account)
+
+    def get_by_payee(self, payee: Attribute) -> tuple[Transaction, ...]:
+        return self._get_sorted_postings(self._by_payee, payee)
+
+    def get_by_tag(self, tag: Attribute) -> tuple[Transaction, ...]:
+        return self._get_sorted_postings(self._by_tag, tag)
+
+    def get_by_category(self, category: Category) -> tuple[Transaction, ...]:
+        return self._get_sorted_postings(self._by_category, category)
+
+    def get_by_security(self, security: Security) -> tuple[Transaction, ...]:
+        return self._get_sorted_postings(self._by_security, security)
+
+    def _get_sorted_postings(
+        self, postings: dict[Hashable, set[Transaction]], key: Hashable
+    ) -> tuple[Transaction, ...]:
+        cache_key = (id(postings), key)
+        transactions = self._sorted_postings.get(cache_key)
+        if transactions is None:
+            transactions = tuple(sorted(postings.get(key, ()), key=_get_timestamp))
+            self._sorted_postings[cache_key] = transactions
+        return transactions
+
+    def _index(self, transaction: Transaction) -> None:
+        keys = [(self._by_account, account) for account in _get_accounts(transaction)]
+        keys.extend((self._by_tag, tag) for tag in transaction.tags)
+        if isinstance(transaction, CashTransaction | RefundTransaction):
+            keys.append((self._by_payee, transaction.payee))
+            keys.extend(
+                (self._by_category, category) for category in transaction.categories
+            )
+        if isinstance(transaction, SecurityRelatedTransaction):
+            keys.append((self._by_security, transaction.security))
+        for postings, key in keys:
+            postings.setdefault(key, set()).add(transaction)
+        self._keys[transaction] = (transaction.timestamp, tuple(keys))
+
+    @staticmethod
+    def _discard_posting(
+        postings: dict[Hashable, set[Transaction]],
+        key: Hashable,
+        transaction: Transaction,
+    ) -> None:
+        transactions = postings[key]
+        transactions.discard(transaction)
+        if not transactions:
+            del postings[key]
+
+
+def _get_accounts(transaction: Transaction) -> tuple[Account, ...]:
+    if isinstance(transaction, CashTransaction | RefundTransaction):
+        return (transaction.account,)
+    if isinstance(transaction, CashTransfer):
+        return (transaction.sender, transaction.recipient)
+    if isinstance(transaction, SecurityTransaction):
+        return (transaction.security_account, transaction.cash_account)
+    return (transaction.sender, transaction.recipient)
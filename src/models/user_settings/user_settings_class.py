@@ -32,6 +32,7 @@ class UserSettings(JSONSerializableMixin, CopyableMixin):
         "_check_for_updates_on_startup",
         "_exchange_rate_decimals",
         "_general_date_format",
+        "_journal_saves",
         "_logs_max_size_bytes",
         "_number_format",
         "_time_zone",
@@ -60,6 +61,8 @@ class UserSettings(JSONSerializableMixin, CopyableMixin):
 
         self._check_for_updates_on_startup = True
 
+        self._journal_saves = False
+
         self._transaction_table_column_order = ()
 
     @property
@@ -266,6 +269,22 @@ class UserSettings(JSONSerializableMixin, CopyableMixin):
         )
         self._check_for_updates_on_startup = value
 
+    @property
+    def journal_saves(self) -> bool:
+        return self._journal_saves
+
+    @journal_saves.setter
+    def journal_saves(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError("UserSettings.journal_saves must be a bool.")
+        if self._journal_saves == value:
+            return
+
+        logging.info(
+            f"Changing UserSettings.journal_saves from {self._journal_saves} to {value}"
+        )
+        self._journal_saves = value
+
     @property
     def transaction_table_column_order(self) -> tuple[TransactionTableColumn, ...]:
         return self._transaction_table_column_order
@@ -324,6 +343,7 @@ class UserSettings(JSONSerializableMixin, CopyableMixin):
             "exchange_rate_decimals": self._exchange_rate_decimals,
             "amount_per_share_decimals": self._amount_per_share_decimals,
             "check_for_updates_on_startup": self._check_for_updates_on_startup,
+            "journal_saves": self._journal_saves,
             "transaction_table_column_order": transaction_table_column_names,
         }
 
@@ -350,6 +370,7 @@ class UserSettings(JSONSerializableMixin, CopyableMixin):
         check_for_updates_on_startup: bool = data.get(
             "check_for_updates_on_startup", True
         )
+        journal_saves: bool = data.get("journal_saves", False)
 
         transaction_table_column_order: tuple[TransactionTableColumn, ...] = tuple(
             TransactionTableColumn[name]
@@ -367,6 +388,7 @@ class UserSettings(JSONSerializableMixin, CopyableMixin):
         obj._exchange_rate_decimals = exchange_rate_decimals
         obj._amount_per_share_decimals = amount_per_share_decimals
         obj._check_for_updates_on_startup = check_for_updates_on_startup
+        obj._journal_saves = journal_saves
         obj._transaction_table_column_order = transaction_table_column_order
 
         return obj
@@ -79,55 +79,57 @@ class ImportTransactionsDialogPresenter(TransactionDialogPresenter):
             )
             if profile_dict["has_header"]:
                 next(reader)
-            for row in reader:
-                try:
-                    date_str = _parse_field(row, column_dict["date"])
-                    datetime_ = _parse_date(date_str, column_dict["date"])
-                    datetime_ = datetime_.astimezone(settings.time_zone)
-
-                    description = _parse_field(row, column_dict["description"])
-                    amount = _parse_amount(
-                        _parse_field(row, column_dict["amount"]), column_dict["amount"]
-                    )
-                    iban = _parse_field(row, column_dict["iban"])
-                    payee = _parse_field(row, column_dict["payee"])
-                    payee = payee_map.get(
-                        payee, payee
-                    )  # Replace payee with mapped payee
-                    category = _parse_field(row, column_dict["category"])
-                    tag = _parse_field(row, column_dict["tag"])
-
-                    iban_account_path = (
-                        self._get_account_path_from_iban(iban) if iban else ""
-                    )
-                    if iban_account_path:
-                        # IBAN account found, this is going to be a Cash Transfer
-                        self._add_cash_transfer(
-                            description=description,
-                            datetime_=datetime_,
-                            amount=amount,
-                            currency=currency,
-                            cash_account_path=cash_account_path,
-                            iban_account_path=iban_account_path,
-                            tag=tag,
+            with self._record_keeper.bulk_add():
+                for row in reader:
+                    try:
+                        date_str = _parse_field(row, column_dict["date"])
+                        datetime_ = _parse_date(date_str, column_dict["date"])
+                        datetime_ = datetime_.astimezone(settings.time_zone)
+
+                        description = _parse_field(row, column_dict["description"])
+                        amount = _parse_amount(
+                            _parse_field(row, column_dict["amount"]),
+                            column_dict["amount"],
                         )
-                    else:
-                        # IBAN account not found, this is going to be a Cash Transaction
-                        self._add_cash_transaction(
-                            description=description,
-                            datetime_=datetime_,
-                            amount=amount,
-                            currency=currency,
-                            cash_account_path=cash_account_path,
-                            payee=payee,
-                            category=category,
-                            tag=tag,
+                        iban = _parse_field(row, column_dict["iban"])
+                        payee = _parse_field(row, column_dict["payee"])
+                        payee = payee_map.get(
+                            payee, payee
+                        )  # Replace payee with mapped payee
+                        category = _parse_field(row, column_dict["category"])
+                        tag = _parse_field(row, column_dict["tag"])
+
+                        iban_account_path = (
+                            self._get_account_path_from_iban(iban) if iban else ""
                         )
-
-                    transactions_added += 1
-                except Exception as exception:  # noqa: BLE001
-                    handle_exception(exception)
-                    break  # Stop adding transactions upon error
+                        if iban_account_path:
+                            # IBAN account found, this is a Cash Transfer
+                            self._add_cash_transfer(
+                                description=description,
+                                datetime_=datetime_,
+                                amount=amount,
+                                currency=currency,
+                                cash_account_path=cash_account_path,
+                                iban_account_path=iban_account_path,
+                                tag=tag,
+                            )
+                        else:
+                            # IBAN account not found, this is a Cash Transaction
+                            self._add_cash_transaction(
+                                description=description,
+                                datetime_=datetime_,
+                                amount=amount,
+                                currency=currency,
+                                cash_account_path=cash_account_path,
+                                payee=payee,
+                                category=category,
+                                tag=tag,
+                            )
+
+                        transactions_added += 1
+                    except Exception as exception:  # noqa: BLE001
+                        handle_exception(exception)
+                        break  # Stop adding transactions upon error
 
         self.event_pre_add(transactions_added)
         self.event_update_model()
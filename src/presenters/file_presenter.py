@@ -15,8 +15,17 @@ from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 from PyQt6.QtCore import QObject, QThread, pyqtSignal
 from PyQt6.QtWidgets import QApplication
+from src.models.json.binary_format import BINARY_FILE_SUFFIX, BinaryFile, write_binary
 from src.models.json.custom_json_decoder import CustomJSONDecoder
 from src.models.json.custom_json_encoder import CustomJSONEncoder
+from src.models.json.journal import (
+    COMPACTION_RATIO,
+    SavedState,
+    apply_records,
+    create_records,
+    get_journal_path,
+    get_unkeyed_sections,
+)
 from src.models.record_keeper import RecordKeeper
 from src.models.user_settings import user_settings
 from src.presenters.utilities.event import Event
@@ -94,24 +103,44 @@ class LoadFileWorker(QObject):
         super().__init__(parent)
         self.path: Path
         self.encryption_session: EncryptionSession | None = None
+        self.saved_state: SavedState | None = None
 
     def run(self) -> None:
         try:
-            if self.encryption_session.is_password_set:
-                self.data = self._load_encrypted_json()
+            if self.path.suffix == BINARY_FILE_SUFFIX:
+                # price histories are read lazily, so deserialize before closing
+                with BinaryFile(self.path) as file:
+                    self.data = file.read()
+                    self._deserialize()
             else:
-                self.data = self._load_unencrypted_json()
-            logging.disable(logging.INFO)  # suppress logging of object creation
-            self.record_keeper = RecordKeeper.deserialize(
-                self.data["data"],
-                progress_callable=self._progress,
-            )
-            logging.disable(logging.NOTSET)
+                if self.encryption_session.is_password_set:
+                    self.data = self._load_encrypted_json()
+                else:
+                    self.data = self._load_unencrypted_json()
+                self._deserialize()
+            if user_settings.settings.journal_saves:
+                version = self.record_keeper.version
+                self.saved_state = SavedState(
+                    self.path,
+                    self.data["datetime_saved"],
+                    self.record_keeper,
+                    version,
+                    get_unkeyed_sections(self.record_keeper.serialize_changes(version)),
+                )
             self.finished.emit()
         except Exception as exc:  # noqa: BLE001
             self.exception = exc
             self.failed.emit()
 
+    def _deserialize(self) -> None:
+        self._apply_journal()
+        logging.disable(logging.INFO)  # suppress logging of object creation
+        self.record_keeper = RecordKeeper.deserialize(
+            self.data["data"],
+            progress_callable=self._progress,
+        )
+        logging.disable(logging.NOTSET)
+
     def _load_encrypted_json(self) -> dict[str, Any]:
         with self.path.open(mode="rb") as file:
             return self.encryption_session.decrypt(file.read())
@@ -120,6 +149,33 @@ class LoadFileWorker(QObject):
         with self.path.open(mode="r", encoding="UTF-8") as file:
             return json.load(file, cls=CustomJSONDecoder)
 
+    def _apply_journal(self) -> None:
+        journal_path = get_journal_path(self.path)
+        if not journal_path.exists():
+            return
+
+        with journal_path.open(mode="rb") as file:
+            lines = [line for line in file.read().splitlines() if line]
+        records: list[dict[str, Any]] = []
+        for number, line in enumerate(lines, start=1):
+            try:
+                if self.encryption_session.is_password_set:
+                    entry = self.encryption_session.decrypt(line)
+                else:
+                    entry = json.loads(line.decode("utf-8"), cls=CustomJSONDecoder)
+            except (ValueError, InvalidTag):
+                if number < len(lines):
+                    raise
+                # the last entry torn by an interrupted save, its changes are
+                # in the entry of the following save
+                logging.warning(f"Skipping unreadable journal entry: {journal_path}")
+                continue
+            if entry["base_datetime_saved"] != self.data["datetime_saved"]:
+                logging.warning(f"Skipping outdated journal entry: {journal_path}")
+                continue
+            records.extend(entry["records"])
+        apply_records(self.data["data"], records)
+
     def _progress(self, progress: int) -> None:
         self.progress.emit(progress)
 
@@ -136,30 +192,117 @@ class SaveFileWorker(QObject):
         self.path: Path
         self.record_keeper: RecordKeeper
         self.encryption_session: EncryptionSession | None = None
+        self.saved_state: SavedState | None = None
 
     def run(self) -> None:
         try:
-            self.status_text.emit("Serializing data...")
-            data = {
-                "version": constants.VERSION,
-                "datetime_saved": datetime.now(user_settings.settings.time_zone),
-                "data": self.record_keeper.serialize(self._progress),
-            }
-            self.progress_unknown.emit()
-            if self.encryption_session.is_password_set:
-                self._save_encrypted_json(data)
-            else:
-                self._save_json(data)
+            version = self.record_keeper.version
+            if not self._append_to_journal(version):
+                self.status_text.emit("Serializing data...")
+                serialized_data = self.record_keeper.serialize(self._progress)
+                self.progress_unknown.emit()
+                self._save_snapshot(serialized_data, version)
             self.finished.emit()
         except Exception as exc:  # noqa: BLE001
             self.exception = exc
             self.failed.emit()
 
+    def _save_snapshot(self, serialized_data: dict[str, Any], version: int) -> None:
+        datetime_saved = datetime.now(user_settings.settings.time_zone)
+        data = {
+            "version": constants.VERSION,
+            "datetime_saved": datetime_saved,
+            "data": serialized_data,
+        }
+        if self.path.suffix == BINARY_FILE_SUFFIX:
+            self._save_binary(data)
+        elif self.encryption_session.is_password_set:
+            self._save_encrypted_json(data)
+        else:
+            self._save_json(data)
+        # the journal belongs to the replaced base snapshot
+        get_journal_path(self.path).unlink(missing_ok=True)
+
+        self.saved_state = None
+        if user_settings.settings.journal_saves:
+            self.saved_state = SavedState(
+                self.path,
+                datetime_saved.isoformat(),
+                self.record_keeper,
+                version,
+                get_unkeyed_sections(serialized_data),
+            )
+
+    def _append_to_journal(self, version: int) -> bool:
+        """Returns False if a new base snapshot must be saved instead."""
+
+        if (
+            not user_settings.settings.journal_saves
+            or self.saved_state is None
+            or self.saved_state.path != self.path
+            or self.saved_state.record_keeper is not self.record_keeper
+            or not self.path.exists()
+        ):
+            return False
+
+        self.status_text.emit("Serializing changes...")
+        self.progress_unknown.emit()
+        changes = self.record_keeper.serialize_changes(self.saved_state.version)
+        records = create_records(self.saved_state.data, changes)
+        base_datetime_saved = self.saved_state.datetime_saved
+        if records:
+            entry = {
+                "datatype": "JournalEntry",
+                "version": constants.VERSION,
+                "base_datetime_saved": base_datetime_saved,
+                "datetime_saved": datetime.now(
+                    user_settings.settings.time_zone
+                ).isoformat(),
+                "records": records,
+            }
+            if self.encryption_session.is_password_set:
+                self.status_text.emit("Encrypting data...")
+                line = self.encryption_session.encrypt(entry)
+            else:
+                line = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+
+            journal_path = get_journal_path(self.path)
+            journal_size = journal_path.stat().st_size if journal_path.exists() else 0
+            if journal_size + len(line) > self.path.stat().st_size * COMPACTION_RATIO:
+                logging.info(f"Compacting journal: {journal_path}")
+                return False
+            self._append_journal_line(journal_path, line)
+
+        self.saved_state = SavedState(
+            self.path,
+            base_datetime_saved,
+            self.record_keeper,
+            version,
+            get_unkeyed_sections(changes),
+        )
+        return True
+
+    def _append_journal_line(self, journal_path: Path, line: bytes) -> None:
+        self.status_text.emit("Writing to journal...")
+        with journal_path.open(mode="a+b") as file:
+            if file.tell() > 0:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    # drop the last entry torn by an interrupted save, so only
+                    # the last entry can be unreadable
+                    file.seek(0)
+                    file.truncate(file.read().rfind(b"\n") + 1)
+            file.write(line + b"\n")
+
     def _save_json(self, data: dict) -> None:
         with self.path.open(mode="w", encoding="UTF-8") as file:
             self.status_text.emit("Writing to file...")
             json.dump(data, file, cls=CustomJSONEncoder, ensure_ascii=False)
 
+    def _save_binary(self, data: dict) -> None:
+        self.status_text.emit("Writing to file...")
+        write_binary(self.path, data)
+
     def _save_encrypted_json(self, data: dict) -> None:
         self.status_text.emit("Encrypting data...")
         encrypted_bytes = self.encryption_session.encrypt(data)
@@ -182,6 +325,7 @@ class FilePresenter:
 
         # File path initialization
         self._current_file_path: Path | None = None
+        self._saved_state: SavedState | None = None
         self.update_unsaved_changes(unsaved_changes=False)
 
         self.create_demo_template_files()
@@ -268,6 +412,7 @@ class FilePresenter:
         logging.info("Creating New File, resetting to clean state")
         self.event_load_record_keeper(RecordKeeper())
         self._current_file_path = None
+        self._saved_state = None
         self.update_unsaved_changes(unsaved_changes=False)
 
     def update_unsaved_changes(self, *, unsaved_changes: bool) -> None:
@@ -343,6 +488,7 @@ class FilePresenter:
 
         data = self._worker.data
         record_keeper = self._worker.record_keeper
+        self._saved_state = self._worker.saved_state
         self._worker.thread().quit()
         self._worker.deleteLater()
         self._thread.deleteLater()
@@ -398,6 +544,7 @@ class FilePresenter:
         self._worker.path = path
         self._worker.encryption_session = self._encryption_session
         self._worker.record_keeper = record_keeper
+        self._worker.saved_state = self._saved_state
         self._thread.started.connect(self._worker.run)
         self._worker.finished.connect(lambda: self._file_save_completed(callback))
         self._worker.failed.connect(self._worker_operation_failed)
@@ -424,6 +571,7 @@ class FilePresenter:
         self._busy_indicator.close()
         self._view.set_item_view_update_state(enabled=True)
 
+        self._saved_state = self._worker.saved_state
         self._worker.thread().quit()
         self._worker.deleteLater()
         self._thread.deleteLater()
@@ -5,12 +5,12 @@ from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
 
-from dateutil.relativedelta import relativedelta
 from PyQt6.QtCore import QSortFilterProxyModel, Qt
 from PyQt6.QtWidgets import QApplication
 from src.models.custom_exceptions import InvalidOperationError
 from src.models.model_objects.currency_objects import ExchangeRate
 from src.models.record_keeper import RecordKeeper
+from src.models.statistics.return_stats import ReturnsCalculator, get_return_periods
 from src.models.user_settings import user_settings
 from src.presenters.utilities.event import Event
 from src.presenters.utilities.handle_exception import handle_exception
@@ -35,6 +35,9 @@ class CurrencyFormPresenter:
     def __init__(self, view: CurrencyForm, record_keeper: RecordKeeper) -> None:
         self.view = view
         self._record_keeper = record_keeper
+        self._returns_calculator: ReturnsCalculator[ExchangeRate] = ReturnsCalculator(
+            lambda exchange_rate: exchange_rate.rate_history
+        )
 
         self._initialize_models()
 
@@ -561,43 +564,6 @@ class CurrencyFormPresenter:
         self, exchange_rates: Collection[ExchangeRate]
     ) -> dict[ExchangeRate, dict[str, Decimal]]:
         today = datetime.now(user_settings.settings.time_zone).date()
-        periods = {
-            "1D": (today - relativedelta(days=1), today),
-            "7D": (today - relativedelta(days=7), today),
-            "1M": (today - relativedelta(months=1), today),
-            "3M": (today - relativedelta(months=3), today),
-            "6M": (today - relativedelta(months=6), today),
-            "1Y": (today - relativedelta(years=1), today),
-            "2Y": (today - relativedelta(years=2), today),
-            "3Y": (today - relativedelta(years=3), today),
-            "5Y": (today - relativedelta(years=5), today),
-            "7Y": (today - relativedelta(years=7), today),
-            "10Y": (today - relativedelta(years=10), today),
-            "YTD": (today.replace(month=1, day=1), today),
-            "Total": (None, today),
-        }
-
-        returns = {
-            exchange_rate: {
-                period: exchange_rate.calculate_return(start, end)
-                for period, (start, end) in periods.items()
-            }
-            for exchange_rate in exchange_rates
-        }
-
-        # add annualized Total period to returns
-        for exchange_rate in exchange_rates:
-            try:
-                return_total = returns[exchange_rate]["Total"] / 100
-                days = (exchange_rate.latest_date - exchange_rate.earliest_date).days
-                if days == 0:
-                    returns[exchange_rate]["Total p.a."] = Decimal(0)
-                    continue
-                exponent = Decimal(365) / Decimal(days)
-                returns[exchange_rate]["Total p.a."] = 100 * (
-                    ((1 + return_total) ** exponent) - 1
-                )
-            except TypeError:
-                returns[exchange_rate]["Total p.a."] = Decimal("NaN")
-
-        return returns
+        return self._returns_calculator.calculate(
+            exchange_rates, get_return_periods(today)
+        )
@@ -4,13 +4,13 @@ from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
 
-from dateutil.relativedelta import relativedelta
 from PyQt6.QtCore import QSortFilterProxyModel, Qt
 from PyQt6.QtWidgets import QApplication
 from src.models.custom_exceptions import InvalidOperationError
 from src.models.model_objects.currency_objects import CashAmount
 from src.models.model_objects.security_objects import Security
 from src.models.record_keeper import RecordKeeper
+from src.models.statistics.return_stats import ReturnsCalculator, get_return_periods
 from src.models.statistics.security_stats import SecurityStatsData
 from src.models.user_settings import user_settings
 from src.presenters.utilities.event import Event
@@ -47,6 +47,9 @@ class SecurityFormPresenter:
         self._reset_models_on_show = False
         self._update_overview_on_show = False
         self._update_manage_on_show = False
+        self._returns_calculator: ReturnsCalculator[Security] = ReturnsCalculator(
+            lambda security: security.decimal_price_history
+        )
 
         self.view.signal_update_quotes.connect(self.event_update_quotes)
 
@@ -624,46 +627,7 @@ class SecurityFormPresenter:
         self, securities: list[Security]
     ) -> dict[Security, dict[str, Decimal]]:
         today = datetime.now(user_settings.settings.time_zone).date()
-        periods = {
-            "1D": (today - relativedelta(days=1), today),
-            "7D": (today - relativedelta(days=7), today),
-            "1M": (today - relativedelta(months=1), today),
-            "3M": (today - relativedelta(months=3), today),
-            "6M": (today - relativedelta(months=6), today),
-            "1Y": (today - relativedelta(years=1), today),
-            "2Y": (today - relativedelta(years=2), today),
-            "3Y": (today - relativedelta(years=3), today),
-            "5Y": (today - relativedelta(years=5), today),
-            "7Y": (today - relativedelta(years=7), today),
-            "10Y": (today - relativedelta(years=10), today),
-            "YTD": (today.replace(month=1, day=1), today),
-            "Total": (None, today),
-        }
-
-        returns = {
-            security: {
-                period: security.calculate_return(start, end)
-                for period, (start, end) in periods.items()
-            }
-            for security in securities
-        }
-
-        # add annualized Total period to returns
-        for security in securities:
-            try:
-                return_total = returns[security]["Total"] / 100
-                days = (security.latest_date - security.earliest_date).days
-                if days == 0:
-                    returns[security]["Total p.a."] = Decimal(0)
-                    continue
-                exponent = Decimal(365) / Decimal(days)
-                returns[security]["Total p.a."] = 100 * (
-                    ((1 + return_total) ** exponent) - 1
-                )
-            except TypeError:
-                returns[security]["Total p.a."] = Decimal("NaN")
-
-        return returns
+        return self._returns_calculator.calculate(securities, get_return_periods(today))
 
     def _set_security_table_column_visibility(self) -> None:
         for column in range(self._security_table_model.columnCount()):
@@ -56,6 +56,7 @@ class SettingsFormPresenter:
         self._view.check_for_updates_on_startup = (
             user_settings.settings.check_for_updates_on_startup
         )
+        self._view.journal_saves = user_settings.settings.journal_saves
         self._view.number_format = user_settings.settings.number_format
         self._backup_paths = list(user_settings.settings.backup_paths)
         self._backup_paths_list_model.pre_reset_model()
@@ -133,6 +134,7 @@ class SettingsFormPresenter:
             user_settings.settings.check_for_updates_on_startup = (
                 self._view.check_for_updates_on_startup
             )
+            user_settings.settings.journal_saves = self._view.journal_saves
             user_settings.settings.number_format = self._view.number_format
         except Exception as exception:  # noqa: BLE001
             handle_exception(exception)
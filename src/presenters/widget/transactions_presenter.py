@@ -1,6 +1,7 @@
 import logging
 import re
 from collections.abc import Collection
+from decimal import Decimal
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -17,7 +18,11 @@ from src.models.model_objects.cash_objects import (
     CashTransfer,
     RefundTransaction,
 )
-from src.models.model_objects.currency_objects import ConversionFactorNotFoundError
+from src.models.model_objects.currency_objects import (
+    CashAmount,
+    ConversionFactorNotFoundError,
+    convert_many,
+)
 from src.models.model_objects.security_objects import (
     SecurityTransaction,
     SecurityTransactionType,
@@ -66,6 +71,8 @@ from src.views.utilities.message_box_functions import ask_yes_no_question
 from src.views.widgets.transaction_table_widget import TransactionTableWidget
 
 if TYPE_CHECKING:
+    from datetime import date
+
     from src.presenters.dialog.transaction_dialog_presenter import (
         TransactionDialogPresenter,
     )
@@ -187,8 +194,10 @@ class TransactionsPresenter:
         self._model.post_reset_model()
 
     def _update_model_data(self) -> None:
+        # RecordKeeper.transactions are sorted in ascending order, the model
+        # expects them in descending order
         self._model.load_data(
-            self._record_keeper.transactions,
+            reversed(self._record_keeper.transactions),
             self._record_keeper.transaction_uuid_dict,
             self._record_keeper.base_currency,
         )
@@ -649,7 +658,7 @@ class TransactionsPresenter:
             self._view.set_selected_amount(len(transactions), "N/A")
             return
 
-        amount = base_currency.zero_amount
+        amounts: list[tuple[CashAmount, date]] = []
         for transaction in transactions:
             if isinstance(transaction, CashTransaction | RefundTransaction):
                 _amount = transaction.get_amount(transaction.account)
@@ -660,12 +669,15 @@ class TransactionsPresenter:
                 _amount = transaction.amount
             else:
                 continue
+            amounts.append((_amount, transaction.date_))
 
-            try:
-                amount += _amount.convert(base_currency, transaction.date_)
-            except ConversionFactorNotFoundError:
-                self._view.set_selected_amount(len(transactions), "N/A")
+        try:
+            values = convert_many(amounts, base_currency)
+        except ConversionFactorNotFoundError:
+            self._view.set_selected_amount(len(transactions), "N/A")
+            return
 
+        amount = CashAmount(sum(values, start=Decimal(0)), base_currency)
         self._view.set_selected_amount(len(transactions), amount.to_str_rounded())
 
     def _reset_columns(self) -> None:
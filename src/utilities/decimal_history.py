@@ -0,0 +1,161 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import date
+from decimal import Decimal
+
+from src.utilities.number_utils import get_decimal_exponent
+
+
+def _to_units(value: Decimal, scale: int) -> int:
+    numerator, denominator = value.as_integer_ratio()
+    return numerator * 10**scale // denominator
+
+
+def _from_units(units: int, scale: int, places: int) -> Decimal:
+    if places != scale:
+        units //= 10 ** (scale - places)
+    sign, digits, _ = Decimal(units).as_tuple()
+    return Decimal((sign, digits, -places))
+
+
+def _store_item(
+    values: "array[int] | list[int]", index: int, value: int, *, insert: bool
+) -> "array[int] | list[int]":
+    """Stores the value and returns the values, switched to a list of Python
+    integers if the value does not fit into the array."""
+    try:
+        if insert:
+            values.insert(index, value)
+        else:
+            values[index] = value
+    except OverflowError:
+        values = list(values)
+        return _store_item(values, index, value, insert=insert)
+    return values
+
+
+class DecimalHistory(Mapping[date, Decimal]):
+    """A sorted mapping of dates to finite Decimals, stored compactly.
+
+    Dates are kept as day ordinals in an array('i') and values as integers scaled
+    by a common power of ten in an array('q'). The number of decimal places of
+    each value is kept in an array('b'), so values are materialized as Decimals
+    with their original exponent, only when accessed. Values which do not fit
+    into the arrays switch the storage to lists of Python integers."""
+
+    __slots__ = ("_ordinals", "_places", "_scale", "_units", "_version")
+
+    def __init__(self) -> None:
+        self._ordinals = array("i")
+        self._units: array[int] | list[int] = array("q")
+        self._places: array[int] | list[int] = array("b")
+        self._scale = 0
+        self._version = 0
+
+    @property
+    def ordinals(self) -> "array[int]":
+        """Sorted day ordinals. Must not be modified."""
+        return self._ordinals
+
+    @property
+    def version(self) -> int:
+        """Incremented whenever a value is set or removed."""
+        return self._version
+
+    def __repr__(self) -> str:
+        return f"DecimalHistory(len={len(self._ordinals)})"
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __iter__(self) -> Iterator[date]:
+        return (date.fromordinal(ordinal) for ordinal in self._ordinals)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, date):
+            return False
+        return self._find(key.toordinal()) is not None
+
+    def __getitem__(self, key: date) -> Decimal:
+        index = self._find(key.toordinal()) if isinstance(key, date) else None
+        if index is None:
+            raise KeyError(key)
+        return self.value_at(index)
+
+    def iter_pairs(self) -> Iterator[tuple[date, Decimal]]:
+        """Returns an iterator of (date, value) pairs in chronological order."""
+        scale = self._scale
+        for ordinal, units, places in zip(
+            self._ordinals, self._units, self._places, strict=True
+        ):
+            yield date.fromordinal(ordinal), _from_units(units, scale, places)
+
+    def value_at(self, index: int) -> Decimal:
+        """Returns the value at given position in chronological order."""
+        return _from_units(self._units[index], self._scale, self._places[index])
+
+    def date_at(self, index: int) -> date:
+        """Returns the date at given position in chronological order."""
+        return date.fromordinal(self._ordinals[index])
+
+    def bisect_right(self, date_: date) -> int:
+        """Returns the number of entries dated on or before given date."""
+        return bisect_right(self._ordinals, date_.toordinal())
+
+    def latest_indexes(self, dates: Iterable[date]) -> list[int]:
+        """Returns the position of the latest entry dated on or before each of
+        given dates, or -1 for dates older than every entry."""
+        ordinals = self._ordinals
+        return [bisect_right(ordinals, date_.toordinal()) - 1 for date_ in dates]
+
+    def set(self, date_: date, value: Decimal) -> Decimal | None:
+        """Sets the value for given date. Returns the replaced value, if any."""
+        if not value.is_finite():
+            raise ValueError("DecimalHistory values must be finite.")
+        places = get_decimal_exponent(value)
+        if places > self._scale:
+            self._rescale(places)
+        units = _to_units(value, self._scale)
+        self._version += 1
+
+        ordinal = date_.toordinal()
+        index = bisect_left(self._ordinals, ordinal)
+        if index < len(self._ordinals) and self._ordinals[index] == ordinal:
+            previous = self.value_at(index)
+            self._store(index, units, places, insert=False)
+            return previous
+        self._ordinals.insert(index, ordinal)
+        self._store(index, units, places, insert=True)
+        return None
+
+    def pop(self, date_: date) -> Decimal:
+        """Removes the value for given date and returns it."""
+        index = self._find(date_.toordinal())
+        if index is None:
+            raise KeyError(date_)
+        value = self.value_at(index)
+        self._version += 1
+        del self._ordinals[index]
+        del self._units[index]
+        del self._places[index]
+        return value
+
+    def _find(self, ordinal: int) -> int | None:
+        index = bisect_left(self._ordinals, ordinal)
+        if index < len(self._ordinals) and self._ordinals[index] == ordinal:
+            return index
+        return None
+
+    def _store(self, index: int, units: int, places: int, *, insert: bool) -> None:
+        self._units = _store_item(self._units, index, units, insert=insert)
+        self._places = _store_item(self._places, index, places, insert=insert)
+
+    def _rescale(self, scale: int) -> None:
+        factor = 10 ** (scale - self._scale)
+        scaled = [units * factor for units in self._units]
+        try:
+            self._units = array("q", scaled)
+        except OverflowError:
+            self._units = scaled
+        self._scale = scale
@@ -8,20 +8,18 @@ from pathlib import Path
 from types import TracebackType
 from typing import Protocol, Self, TypeVar
 
+from src.models.json.journal import get_journal_path
 from src.models.user_settings import user_settings
 from src.utilities import constants
 
+_DATA_FILE_SUFFIXES = (".json.enc", ".json", ".kpb")
+
 
 def backup_json_file(file_path: Path) -> None:
     dt_now = datetime.now(user_settings.settings.time_zone)
     size_limit = user_settings.settings.backups_max_size_bytes
 
-    if file_path.name.endswith(".json.enc"):
-        file_suffix = ".json.enc"
-    elif file_path.name.endswith(".json"):
-        file_suffix = ".json"
-    else:
-        raise ValueError(f"File {file_path} does not end with .json or .json.enc")
+    file_suffix = _get_data_file_suffix(file_path)
 
     file_name_stem = file_path.name.removesuffix(file_suffix)
 
@@ -46,6 +44,7 @@ def backup_json_file(file_path: Path) -> None:
         backup_path = backup_directory / backup_name
         shutil.copyfile(file_path, backup_path)
         logging.info(f"Backed up {file_path} to {backup_path}")
+        _backup_journal_file(file_path, backup_path)
 
         while True:
             # Keep deleting backups until size limit is satisfied
@@ -54,7 +53,7 @@ def backup_json_file(file_path: Path) -> None:
                 file_path
                 for file_path in backup_directory.iterdir()
                 if file_path.is_file()
-                and "".join(file_path.suffixes) in {".json", ".json.enc"}
+                and "".join(file_path.suffixes) in _DATA_FILE_SUFFIXES
                 and contains_timestamp(file_path, file_suffix)
             ]
             total_size = sum(f.stat().st_size for f in old_backup_paths if f.is_file())
@@ -77,6 +76,20 @@ def backup_json_file(file_path: Path) -> None:
                 oldest_backup = min(old_backup_paths, key=get_datetime_from_file_path)
                 logging.info(f"Removing oldest backup: {oldest_backup}")
                 oldest_backup.unlink()
+                get_journal_path(oldest_backup).unlink(missing_ok=True)
+
+
+def _backup_journal_file(file_path: Path, backup_path: Path) -> None:
+    journal_path = get_journal_path(file_path)
+    if journal_path.exists():
+        shutil.copyfile(journal_path, get_journal_path(backup_path))
+
+
+def _get_data_file_suffix(path: Path) -> str:
+    for suffix in _DATA_FILE_SUFFIXES:
+        if path.name.endswith(suffix):
+            return suffix
+    raise ValueError(f"File {path} does not end with .json, .json.enc or .kpb")
 
 
 def contains_timestamp(path: Path, suffix: str) -> bool:
@@ -97,12 +110,7 @@ def get_datetime_from_file_path(path: Path) -> datetime:
     """Return datetime from a Path containing a '%Y_%m_%d_%Hh%Mm%Ss' timestamp
     at the end of the stem."""
 
-    if path.name.endswith(".json.enc"):
-        suffix = ".json.enc"
-    elif path.name.endswith(".json"):
-        suffix = ".json"
-    else:
-        raise ValueError(f"File {path} does not end with .json or .json.enc")
+    suffix = _get_data_file_suffix(path)
 
     stem = str(path).removesuffix(suffix)
     timestamp = stem[-len(constants.TIMESTAMP_EXAMPLE) :]
@@ -0,0 +1,47 @@
+from collections.abc import Callable, Collection, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class LookupIndex(Generic[K, T]):
+    """Maps keys (e.g. paths, names or UUIDs) to the items of a collection.
+
+    The mapping is built lazily and kept up to date by add(). It is rebuilt
+    whenever the size of the collection no longer matches the indexed size,
+    or when a hit turns out to be stale. invalidate() must be called after any
+    edit which can change the key of an item without removing it."""
+
+    __slots__ = ("_get_items", "_items", "_key", "_size")
+
+    def __init__(
+        self, get_items: Callable[[], Collection[T]], key: Callable[[T], K]
+    ) -> None:
+        self._get_items = get_items
+        self._key = key
+        self._items: dict[K, T] | None = None
+        self._size = 0
+
+    def get(self, key: K) -> T | None:
+        items = self._get_items()
+        if self._items is None or len(items) != self._size:
+            self._rebuild(items)
+        item = self._items.get(key)
+        if item is not None and self._key(item) != key:
+            self._rebuild(items)
+            item = self._items.get(key)
+        return item
+
+    def add(self, item: T) -> None:
+        """Indexes an item which was just appended to the collection."""
+        if self._items is not None:
+            self._items[self._key(item)] = item
+            self._size += 1
+
+    def invalidate(self) -> None:
+        self._items = None
+
+    def _rebuild(self, items: Collection[T]) -> None:
+        self._items = {self._key(item): item for item in items}
+        self._size = len(items)
@@ -1,5 +1,5 @@
 import unicodedata
-from collections.abc import Collection, Sequence
+from collections.abc import Collection, Iterable, Sequence
 from decimal import Decimal
 from uuid import UUID
 
@@ -104,7 +104,7 @@ class TransactionTableModel(QAbstractTableModel):
     # FIXME: it feels hacky to rely on transactions being pre-sorted descending
     def load_data(
         self,
-        transactions: Collection[Transaction],
+        transactions: Iterable[Transaction],
         transaction_uuid_dict: dict[UUID, Transaction],
         base_currency: Currency | None,
     ) -> None:
@@ -52,6 +52,7 @@ class SettingsForm(CustomWidget, Ui_SettingsForm):
             self.signal_data_changed.emit
         )
         self.checkforUpdatesCheckBox.toggled.connect(self.signal_data_changed.emit)
+        self.journalSavesCheckBox.toggled.connect(self.signal_data_changed.emit)
 
         self.exchangeRateDecimalsSpinBox.setMaximum(18)
         self.pricePerShareDecimalsSpinBox.setMaximum(18)
@@ -112,6 +113,14 @@ class SettingsForm(CustomWidget, Ui_SettingsForm):
     def check_for_updates_on_startup(self, value: bool) -> None:
         self.checkforUpdatesCheckBox.setChecked(value)
 
+    @property
+    def journal_saves(self) -> bool:
+        return self.journalSavesCheckBox.isChecked()
+
+    @journal_saves.setter
+    def journal_saves(self, value: bool) -> None:
+        self.journalSavesCheckBox.setChecked(value)
+
     @property
     def number_format(self) -> NumberFormat:
         return NumberFormat(self.numberFormatComboBox.currentText())
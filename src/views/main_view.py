@@ -76,7 +76,11 @@ class MainView(QMainWindow, Ui_MainWindow):
 
     def get_save_path(self) -> str:
         path, selected_filter = QFileDialog.getSaveFileName(
-            self, filter="Encrypted JSON file (*.json.enc);;JSON file (*.json)"
+            self,
+            filter=(
+                "Encrypted JSON file (*.json.enc);;JSON file (*.json);;"
+                "Binary file (*.kpb)"
+            ),
         )
 
         if not path:
@@ -86,6 +90,7 @@ class MainView(QMainWindow, Ui_MainWindow):
         ext_map = {
             "Encrypted JSON file (*.json.enc)": ".json.enc",
             "JSON file (*.json)": ".json",
+            "Binary file (*.kpb)": ".kpb",
         }
 
         chosen_ext = ext_map.get(selected_filter)
@@ -112,7 +117,7 @@ class MainView(QMainWindow, Ui_MainWindow):
 
     def get_open_path(self) -> str:
         return QFileDialog.getOpenFileName(
-            self, filter="All JSON files (*.json *.json.enc)"
+            self, filter="All Kapytal files (*.json *.json.enc *.kpb)"
         )[0]
 
     def ask_save_before_close(self) -> bool | None:
@@ -70,6 +70,13 @@ class Ui_SettingsForm(object):
         self.numberFormatComboBox = QtWidgets.QComboBox(parent=self.generalTab)
         self.numberFormatComboBox.setObjectName("numberFormatComboBox")
         self.formLayout.setWidget(5, QtWidgets.QFormLayout.ItemRole.FieldRole, self.numberFormatComboBox)
+        self.journalSavesLabel = QtWidgets.QLabel(parent=self.generalTab)
+        self.journalSavesLabel.setObjectName("journalSavesLabel")
+        self.formLayout.setWidget(6, QtWidgets.QFormLayout.ItemRole.LabelRole, self.journalSavesLabel)
+        self.journalSavesCheckBox = QtWidgets.QCheckBox(parent=self.generalTab)
+        self.journalSavesCheckBox.setText("")
+        self.journalSavesCheckBox.setObjectName("journalSavesCheckBox")
+        self.formLayout.setWidget(6, QtWidgets.QFormLayout.ItemRole.FieldRole, self.journalSavesCheckBox)
         self.verticalLayout_3.addLayout(self.formLayout)
         self.line = QtWidgets.QFrame(parent=self.generalTab)
         self.line.setFrameShape(QtWidgets.QFrame.Shape.HLine)
@@ -206,6 +213,9 @@ class Ui_SettingsForm(object):
         self.pricePerShareDecimalsSpinBox.setToolTip(_translate("SettingsForm", "<html><head/><body><p>Number of decimal places of Amount per Share spinbox in Security Transaction Dialog.</p></body></html>"))
         self.checkForUpdatesLabel.setText(_translate("SettingsForm", "Check for updates on startup"))
         self.numberFormatLabel.setText(_translate("SettingsForm", "Number format"))
+        self.journalSavesLabel.setToolTip(_translate("SettingsForm", "<html><head/><body><p>Saves append only the changes to a journal file next to the data file. The data file is rewritten once the journal grows too large.</p></body></html>"))
+        self.journalSavesLabel.setText(_translate("SettingsForm", "Save changes to journal file"))
+        self.journalSavesCheckBox.setToolTip(_translate("SettingsForm", "<html><head/><body><p>Saves append only the changes to a journal file next to the data file. The data file is rewritten once the journal grows too large.</p></body></html>"))
         self.label.setText(_translate("SettingsForm", "<html><head/><body><p>For details on valid date format syntax, see <a href=\"https://docs.python.org/3/library/datetime.html#strftime-and-strptime-format-codes\"><span style=\" text-decoration: underline; color:#007af4;\">Python datetime library documentation</span></a></p></body></html>"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.generalTab), _translate("SettingsForm", "General"))
         self.backupsSizeLimitLabel.setText(_translate("SettingsForm", "Maximum backup directory size"))
@@ -0,0 +1,109 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from src.models.json.binary_format import (
+    BinaryFile,
+    BinaryFormatError,
+    PackedPairs,
+    convert_binary_to_json,
+    convert_json_to_binary,
+    read_binary,
+    write_binary,
+)
+from src.models.json.custom_json_decoder import CustomJSONDecoder
+from src.models.json.custom_json_encoder import CustomJSONEncoder
+from src.models.record_keeper import RecordKeeper
+from tests.models.test_record_keeper import (
+    get_preloaded_record_keeper_with_various_transactions,
+)
+
+
+def _get_file_data(record_keeper: RecordKeeper) -> dict[str, Any]:
+    return {
+        "version": "1.0.0",
+        "datetime_saved": "01.01.2024 12:00:00 +0100",
+        "data": record_keeper.serialize(lambda *args, **kwargs: None),  # noqa: ARG005
+    }
+
+
+def _json_roundtrip(data: Any) -> Any:
+    return json.loads(json.dumps(data, cls=CustomJSONEncoder), cls=CustomJSONDecoder)
+
+
+def test_binary_roundtrip(tmp_path: Path) -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    data = _json_roundtrip(_get_file_data(record_keeper))
+    path = tmp_path / "data.kpb"
+    write_binary(path, data)
+
+    assert _json_roundtrip(read_binary(path)) == data
+
+    with BinaryFile(path) as file:
+        lazy_data = file.read()
+        assert all(
+            isinstance(security["date_price_pairs"], PackedPairs)
+            for security in lazy_data["data"]["securities"]
+        )
+        loaded = RecordKeeper.deserialize(
+            lazy_data["data"],
+            lambda *args, **kwargs: None,  # noqa: ARG005
+        )
+    assert _get_file_data(loaded)["data"] == _get_file_data(record_keeper)["data"]
+
+
+def test_convert_json_and_binary(tmp_path: Path) -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    data = _get_file_data(record_keeper)
+    json_path = tmp_path / "data.json"
+    binary_path = tmp_path / "data.kpb"
+    converted_path = tmp_path / "converted.json"
+    with json_path.open(mode="w", encoding="UTF-8") as file:
+        json.dump(data, file, cls=CustomJSONEncoder, ensure_ascii=False)
+
+    convert_json_to_binary(json_path, binary_path)
+    convert_binary_to_json(binary_path, converted_path)
+
+    with json_path.open(encoding="UTF-8") as file:
+        expected = json.load(file, cls=CustomJSONDecoder)
+    with converted_path.open(encoding="UTF-8") as file:
+        assert json.load(file, cls=CustomJSONDecoder) == expected
+
+
+def test_binary_fallback_encodings(tmp_path: Path) -> None:
+    # values which the typed encodings cannot reproduce exactly are kept as-is
+    transactions = [
+        {
+            "datatype": "CashTransaction",
+            "uuid": "not-a-uuid",
+            "datetime": "2024-01-01 12:00:00",
+            "amount": "1e3 CZK",
+            "rate": "+1.0",
+            "tags": [["a", "1"], ["b"]],
+            "note": None,
+        },
+        {
+            "datatype": "CashTransaction",
+            "uuid": "4f1fb2b5-7f0b-4b5a-8f4e-2a3a1f0c5d6e",
+            "datetime": "2024-01-01T12:00:00+01:00",
+            "amount": "-0.50 EUR",
+            "rate": "1.0",
+            "tags": [],
+            "note": [1, 2.5, True],
+        },
+    ]
+    data = {
+        "version": "1.0.0",
+        "data": {"datatype": "RecordKeeper", "transactions": transactions},
+    }
+    path = tmp_path / "data.kpb"
+    write_binary(path, data)
+    assert read_binary(path) == data
+
+
+def test_binary_invalid_file(tmp_path: Path) -> None:
+    path = tmp_path / "data.kpb"
+    path.write_bytes(b"NOT A KAPYTAL FILE" * 4)
+    with pytest.raises(BinaryFormatError), BinaryFile(path):
+        pass
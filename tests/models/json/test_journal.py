@@ -0,0 +1,177 @@
+import json
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from src.models.json.custom_json_decoder import CustomJSONDecoder
+from src.models.json.custom_json_encoder import CustomJSONEncoder
+from src.models.json.journal import (
+    apply_records,
+    create_records,
+    get_unkeyed_sections,
+)
+from src.models.model_objects.attributes import AttributeType
+from src.models.model_objects.cash_objects import (
+    CashTransaction,
+    CashTransactionType,
+    CashTransfer,
+)
+from src.models.model_objects.currency_objects import CashAmount
+from src.models.record_keeper import RecordKeeper
+from src.models.user_settings import user_settings
+from tests.models.test_record_keeper import (
+    get_preloaded_record_keeper,
+    get_preloaded_record_keeper_with_various_transactions,
+)
+
+
+def _serialize(record_keeper: RecordKeeper) -> dict[str, Any]:
+    return record_keeper.serialize(lambda *args, **kwargs: None)  # noqa: ARG005
+
+
+def _json_roundtrip(data: Any) -> Any:
+    return json.loads(json.dumps(data, cls=CustomJSONEncoder), cls=CustomJSONDecoder)
+
+
+def _assert_records_applied(
+    old: dict[str, Any], records: list[dict[str, Any]], record_keeper: RecordKeeper
+) -> None:
+    # records are applied to data decoded from a file, like in LoadFileWorker
+    data = _json_roundtrip(old)
+    apply_records(data, _json_roundtrip(records))
+    loaded = RecordKeeper.deserialize(
+        data,
+        lambda *args, **kwargs: None,  # noqa: ARG005
+    )
+    assert _serialize(loaded) == _serialize(record_keeper)
+
+
+def test_create_records_no_changes() -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    saved_data = get_unkeyed_sections(_serialize(record_keeper))
+    changes = record_keeper.serialize_changes(record_keeper.version)
+    assert create_records(saved_data, changes) == []
+
+
+def test_create_and_apply_records() -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    old = _serialize(record_keeper)
+    version = record_keeper.version
+
+    edited = next(
+        t
+        for t in record_keeper.transactions
+        if isinstance(t, CashTransaction) and not t.is_refunded
+    )
+    removed = next(t for t in record_keeper.transactions if isinstance(t, CashTransfer))
+    record_keeper.edit_cash_transactions([edited.uuid], description="Edited")
+    record_keeper.remove_transactions([removed.uuid])
+    record_keeper.add_payee("New Payee")
+    security = record_keeper.securities[0]
+    security.set_price(
+        date(2020, 1, 1),
+        CashAmount(Decimal(123), security.currency),
+    )
+
+    changes = record_keeper.serialize_changes(version)
+    records = create_records(get_unkeyed_sections(old), changes)
+    assert {(record["operation"], record["section"]) for record in records} == {
+        ("put", "transactions"),
+        ("delete", "transactions"),
+        ("put", "securities"),
+        ("replace", "payees"),
+    }
+    assert len(records) == 4
+    _assert_records_applied(old, records, record_keeper)
+
+    # replaying the records is idempotent
+    data = _json_roundtrip(old)
+    apply_records(data, _json_roundtrip(records))
+    apply_records(data, _json_roundtrip(records))
+    assert len(data["transactions"]) == len(record_keeper.transactions)
+
+    # changes before the given version are not returned again
+    saved_data = get_unkeyed_sections(changes)
+    changes = record_keeper.serialize_changes(record_keeper.version)
+    assert create_records(saved_data, changes) == []
+
+
+def test_create_records_rename_replaces_transactions() -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    old = _serialize(record_keeper)
+    version = record_keeper.version
+
+    payee = record_keeper.payees[0]
+    record_keeper.edit_attribute(payee.name, "Renamed Payee", AttributeType.PAYEE)
+
+    records = create_records(
+        get_unkeyed_sections(old), record_keeper.serialize_changes(version)
+    )
+    assert {(record["operation"], record["section"]) for record in records} == {
+        ("replace", "transactions"),
+        ("replace", "payees"),
+    }
+    _assert_records_applied(old, records, record_keeper)
+
+
+def test_create_records_exchange_rate_added_again() -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    old = _serialize(record_keeper)
+    version = record_keeper.version
+
+    exchange_rate = record_keeper.exchange_rates[0]
+    primary_code = exchange_rate.primary_currency.code
+    secondary_code = exchange_rate.secondary_currency.code
+    record_keeper.remove_exchange_rate(str(exchange_rate))
+    record_keeper.add_exchange_rate(primary_code, secondary_code)
+    record_keeper.exchange_rates[-1].set_rate(date(2020, 1, 1), Decimal(2))
+
+    records = create_records(
+        get_unkeyed_sections(old), record_keeper.serialize_changes(version)
+    )
+    assert [(record["operation"], record["section"]) for record in records] == [
+        ("delete", "exchange_rates"),
+        ("put", "exchange_rates"),
+    ]
+    _assert_records_applied(old, records, record_keeper)
+
+
+def test_create_records_added_refund() -> None:
+    record_keeper = get_preloaded_record_keeper()
+    old = _serialize(record_keeper)
+    version = record_keeper.version
+
+    datetime_ = datetime.now(user_settings.settings.time_zone)
+    record_keeper.add_cash_transaction(
+        "An expense transaction",
+        datetime_,
+        CashTransactionType.EXPENSE,
+        "Bank Accounts/Raiffeisen CZK",
+        "Albert",
+        (("Food and Drink/Groceries", Decimal(1000)),),
+        (("Test Tag", Decimal(1000)),),
+    )
+    refunded_transaction = record_keeper.transactions[0]
+    record_keeper.add_refund(
+        "Refund!",
+        datetime_ + timedelta(days=1),
+        refunded_transaction.uuid,
+        "Bank Accounts/Raiffeisen CZK",
+        "Albert",
+        (("Food and Drink/Groceries", Decimal(1000)),),
+        (("Test Tag", Decimal(1000)),),
+    )
+    # the refunded transaction changes after its refund was added
+    record_keeper.edit_cash_transactions(
+        [refunded_transaction.uuid], description="Edited"
+    )
+
+    records = create_records(
+        get_unkeyed_sections(old), record_keeper.serialize_changes(version)
+    )
+    assert [
+        record["value"]["uuid"]
+        for record in records
+        if record["section"] == "transactions"
+    ] == [str(transaction.uuid) for transaction in record_keeper.transactions]
+    _assert_records_applied(old, records, record_keeper)
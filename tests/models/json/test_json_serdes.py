@@ -317,6 +317,7 @@ def test_user_settings() -> None:
     assert decoded.amount_per_share_decimals == settings.amount_per_share_decimals
     assert decoded.number_format == settings.number_format
     assert decoded.check_for_updates_on_startup == settings.check_for_updates_on_startup
+    assert decoded.journal_saves == settings.journal_saves
 
 
 settings_json = r"""{
@@ -339,6 +340,7 @@ def test_user_settings_missing_keys() -> None:
     assert decoded.amount_per_share_decimals == 9
     assert decoded.number_format == NumberFormat.SEP_NONE_DECIMAL_POINT
     assert decoded.check_for_updates_on_startup is True
+    assert decoded.journal_saves is False
 
 
 def test_record_keeper_with_extra_data() -> None:
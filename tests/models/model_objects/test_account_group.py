@@ -7,6 +7,7 @@ from hypothesis import assume, given
 from hypothesis import strategies as st
 from src.models.custom_exceptions import NotFoundError
 from src.models.model_objects.account_group import AccountGroup
+from src.models.model_objects.cash_objects import CashAccount
 from src.models.model_objects.currency_objects import CashAmount, Currency, ExchangeRate
 from src.models.user_settings import user_settings
 from tests.models.test_assets.composites import (
@@ -155,5 +156,72 @@ def test_set_child_index_negative() -> None:
         parent.set_child_index(None, -1)
 
 
+def test_batch_balance_updates() -> None:
+    currency = Currency("CZK", 2)
+    root = AccountGroup("Root")
+    group = AccountGroup("Group", root)
+    account_1 = CashAccount("1", currency, CashAmount(0, currency), parent=group)
+    account_2 = CashAccount("2", currency, CashAmount(0, currency), parent=root)
+    root_updates = []
+    root.event_balance_updated.append(lambda: root_updates.append(root.balances))
+
+    with AccountGroup.batch_balance_updates((root, group)):
+        for amount in range(1, 11):
+            account_1.initial_balance = CashAmount(amount, currency)
+            with AccountGroup.batch_balance_updates((root,)):
+                account_2.initial_balance = CashAmount(amount, currency)
+        assert root_updates == []
+
+    assert root_updates == [(CashAmount(20, currency),)]
+    assert group.balances == (CashAmount(10, currency),)
+
+    account_1.initial_balance = CashAmount(1, currency)
+    assert root.balances == (CashAmount(11, currency),)
+
+
+def test_batch_balance_updates_only_defers_given_groups() -> None:
+    currency = Currency("CZK", 2)
+    batched = AccountGroup("Batched")
+    other = AccountGroup("Other")
+    nested = AccountGroup("Nested")
+    account_1 = CashAccount("1", currency, CashAmount(0, currency), parent=batched)
+    account_2 = CashAccount("2", currency, CashAmount(0, currency), parent=other)
+    account_3 = CashAccount("3", currency, CashAmount(0, currency), parent=nested)
+
+    with AccountGroup.batch_balance_updates((batched,)):
+        account_1.initial_balance = CashAmount(1, currency)
+        account_2.initial_balance = CashAmount(2, currency)
+        assert batched.balances == (CashAmount(0, currency),)
+        assert other.balances == (CashAmount(2, currency),)
+        with AccountGroup.batch_balance_updates((batched, nested)):
+            account_3.initial_balance = CashAmount(3, currency)
+        assert nested.balances == (CashAmount(0, currency),)
+
+    assert batched.balances == (CashAmount(1, currency),)
+    assert nested.balances == (CashAmount(3, currency),)
+    account_3.initial_balance = CashAmount(4, currency)
+    assert nested.balances == (CashAmount(4, currency),)
+
+
+def test_path_follows_rename_and_reparent() -> None:
+    currency = Currency("CZK", 2)
+    root = AccountGroup("Root")
+    other = AccountGroup("Other")
+    group = AccountGroup("Group", root)
+    account = CashAccount("Account", currency, CashAmount(0, currency), parent=group)
+    assert account.path == "Root/Group/Account"
+
+    root.name = "Renamed"
+    assert group.path == "Renamed/Group"
+    assert account.path == "Renamed/Group/Account"
+
+    group.parent = other
+    assert account.path == "Other/Group/Account"
+
+    account.name = "Account 2"
+    account.parent = root
+    assert account.path == "Renamed/Account 2"
+
+
 def get_account_group() -> AccountGroup:
     return AccountGroup("Valid Name", None)
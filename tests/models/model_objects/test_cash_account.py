@@ -278,3 +278,34 @@ def test_parent_change_balance_update() -> None:
     assert cash_account.get_balance(currency).value_normalized == amount
     assert parent_1.get_balance(currency).value_normalized == 0
     assert parent_2.get_balance(currency).value_normalized == amount
+
+
+@given(currency=currencies(), data=st.data())
+def test_incremental_balance_history_matches_rebuild(
+    currency: Currency, data: st.DataObject
+) -> None:
+    account = data.draw(cash_accounts(currency=currency))
+    transactions = [
+        data.draw(cash_transactions(currency=currency, account=account))
+        for _ in range(4)
+    ]
+
+    history = account.balance_history
+    account.update_balance()
+    assert account.balance_history == history
+
+    transactions[0].set_attributes(
+        datetime_=max(t.datetime_ for t in transactions) + timedelta(days=1)
+    )
+    history = account.balance_history
+    account.update_balance()
+    assert account.balance_history == history
+    assert history[-1][2] == transactions[0]
+
+    account.remove_transaction(transactions[1])
+    history = account.balance_history
+    account.update_balance()
+    assert account.balance_history == history
+    assert len(history) == len(transactions)
+    for _, balance, transaction in history[1:]:
+        assert account.get_balance_after_transaction(currency, transaction) == balance
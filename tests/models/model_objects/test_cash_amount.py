@@ -1,3 +1,4 @@
+import locale
 from datetime import datetime, timedelta
 from decimal import Decimal, InvalidOperation
 from typing import Any
@@ -6,11 +7,14 @@ import pytest
 from hypothesis import assume, given
 from hypothesis import strategies as st
 from src.models.model_objects.currency_objects import (
+    CashAccumulator,
     CashAmount,
     ConversionFactorNotFoundError,
     Currency,
     CurrencyError,
     ExchangeRate,
+    MultiCurrencyAccumulator,
+    convert_many,
 )
 from src.models.user_settings import user_settings
 from tests.models.test_assets.composites import (
@@ -471,6 +475,125 @@ def test_convert_no_path() -> None:
         cash_amount.convert(currencies["XXX"])
 
 
+def test_convert_many() -> None:
+    currencies = get_currencies()
+    today = datetime.now(user_settings.settings.time_zone).date()
+    yesterday = today - timedelta(days=1)
+    amounts_with_dates = [
+        (CashAmount(Decimal(1_000_000), currencies["CZK"]), yesterday),
+        (CashAmount(Decimal(500_000), currencies["CZK"]), yesterday),
+        (CashAmount(Decimal(1_000_000), currencies["CZK"]), None),
+        (CashAmount(Decimal(0), currencies["CZK"]), None),
+        (CashAmount(Decimal("0.5"), currencies["BTC"]), today),
+    ]
+    values = convert_many(amounts_with_dates, currencies["BTC"])
+    assert values == [
+        amount.convert(currencies["BTC"], date_).value_normalized
+        for amount, date_ in amounts_with_dates
+    ]
+
+
+def test_convert_many_no_path() -> None:
+    currencies = get_currencies()
+    with pytest.raises(ConversionFactorNotFoundError):
+        convert_many(
+            [(CashAmount(Decimal(1), currencies["CZK"]), None)], currencies["XXX"]
+        )
+
+
+@given(
+    initial=cash_amounts(),
+    values=st.lists(valid_decimals(min_value=-1e6, max_value=1e6), max_size=10),
+)
+def test_cash_accumulator(initial: CashAmount, values: list[Decimal]) -> None:
+    accumulator = CashAccumulator(initial)
+    expected = initial
+    for value in values:
+        amount = CashAmount(value, initial.currency)
+        accumulator.add(amount)
+        accumulator.subtract(amount)
+        accumulator.add(amount)
+        expected = expected + amount - amount + amount
+    result = accumulator.to_cash_amount()
+    assert result == expected
+    assert result.currency == initial.currency
+    assert accumulator.to_cash_amount() is result
+    assert accumulator.currency == initial.currency
+
+
+@given(initial=everything_except(CashAmount))
+def test_cash_accumulator_invalid_type(initial: Any) -> None:
+    with pytest.raises(
+        TypeError, match=r"Parameter 'initial_amount' must be a CashAmount\."
+    ):
+        CashAccumulator(initial)
+
+
+def test_cash_accumulator_currency_mismatch() -> None:
+    accumulator = CashAccumulator(Currency("CZK", 2).zero_amount)
+    with pytest.raises(CurrencyError):
+        accumulator.add(CashAmount(1, Currency("EUR", 2)))
+    with pytest.raises(CurrencyError):
+        accumulator.subtract(CashAmount(1, Currency("EUR", 2)))
+
+
+def test_multi_currency_accumulator() -> None:
+    czk = Currency("CZK", 2)
+    eur = Currency("EUR", 2)
+    accumulator = MultiCurrencyAccumulator()
+    assert accumulator.to_cash_amounts() == ()
+    accumulator.add(CashAmount(1, eur))
+    accumulator.add(CashAmount(2, czk))
+    accumulator.add(CashAmount("1.5", eur))
+    assert accumulator.to_cash_amounts() == (
+        CashAmount("2.5", eur),
+        CashAmount(2, czk),
+    )
+
+
+@given(
+    units_1=st.integers(min_value=-(10**20), max_value=10**20),
+    units_2=st.integers(min_value=-(10**20), max_value=10**20),
+    currency=currencies(min_decimals=0),
+)
+def test_minor_units(units_1: int, units_2: int, currency: Currency) -> None:
+    amount_1 = CashAmount.from_minor_units(units_1, currency)
+    amount_2 = CashAmount.from_minor_units(units_2, currency)
+    decimal_1 = CashAmount(Decimal(units_1).scaleb(-currency.decimals), currency)
+    decimal_2 = CashAmount(Decimal(units_2).scaleb(-currency.decimals), currency)
+
+    assert amount_1.minor_units == units_1
+    assert decimal_1.minor_units == units_1
+    assert hash(amount_1) == hash(decimal_1)
+    assert amount_1.value_normalized.as_tuple() == decimal_1.value_normalized.as_tuple()
+    assert amount_1.value_rounded.as_tuple() == decimal_1.value_rounded.as_tuple()
+    assert amount_1.serialize() == decimal_1.serialize()
+    assert (amount_1 + amount_2).value_normalized.as_tuple() == (
+        decimal_1 + decimal_2
+    ).value_normalized.as_tuple()
+    assert (amount_1 + amount_2).minor_units == units_1 + units_2
+    assert (amount_1 - amount_2).minor_units == units_1 - units_2
+    assert (amount_1 == amount_2) == (units_1 == units_2)
+    assert (amount_1 < amount_2) == (units_1 < units_2)
+    assert (amount_1 <= amount_2) == (units_1 <= units_2)
+
+
+def test_minor_units_not_exact() -> None:
+    currency = Currency("CZK", 2)
+    assert CashAmount("1.5", currency).minor_units is None
+    assert CashAmount("1.505", currency).minor_units is None
+    assert CashAmount("-0.00", currency).minor_units is None
+    assert CashAmount("NaN", currency).minor_units is None
+    assert CashAmount("1.50", currency).minor_units == 150
+    assert CashAmount.from_minor_units(0, currency).minor_units == 0
+
+
+@given(units=everything_except(int), currency=currencies())
+def test_from_minor_units_invalid_type(units: Any, currency: Currency) -> None:
+    with pytest.raises(TypeError, match="Parameter 'units' must be an integer"):
+        CashAmount.from_minor_units(units, currency)
+
+
 def test_nan() -> None:
     nan_amount = CashAmount(Decimal("NaN"), Currency("CZK", 2))
     assert not nan_amount.is_positive()
@@ -482,8 +605,6 @@ def test_nan() -> None:
 
 
 def test_round() -> None:
-    import locale
-
     locale.setlocale(locale.LC_ALL, "en_US.UTF-8")
 
     amount = CashAmount(Decimal("1.23456789"), Currency("EUR", 2))
@@ -509,8 +630,6 @@ def test_round() -> None:
 
 
 def test_round_quantization() -> None:
-    import locale
-
     locale.setlocale(locale.LC_ALL, "en_US.UTF-8")
 
     amount = CashAmount(Decimal("1.0000"), Currency("EUR", 2))
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from types import NoneType
 from typing import Any
@@ -240,3 +240,30 @@ def test_is_accounts_related(
     assert transaction.is_accounts_related(related_accounts)
     unrelated_accounts = (unrelated_account,)
     assert not transaction.is_accounts_related(unrelated_accounts)
+
+
+def test_datetime_collision_moves_transfer_in_both_accounts() -> None:
+    currency = Currency("CZK", 2)
+    sender = CashAccount("Sender", currency, currency.zero_amount)
+    recipient = CashAccount("Recipient", currency, currency.zero_amount)
+    other = CashAccount("Other", currency, currency.zero_amount)
+    amount = CashAmount(1, currency)
+    datetime_ = datetime(2024, 1, 1, 12, tzinfo=user_settings.settings.time_zone)
+
+    CashTransfer("existing", datetime_, other, recipient, amount, amount)
+    transfer = CashTransfer("moved", datetime_, sender, recipient, amount, amount)
+    assert transfer.datetime_ == datetime_ + timedelta(seconds=1)
+    for account in (sender, recipient):
+        assert account.balance_history[-1][2] == transfer
+        assert account.balance_history[-1][0] == transfer.datetime_
+
+    later = CashTransfer(
+        "later", datetime_ + timedelta(seconds=1), sender, other, amount, amount
+    )
+    assert later.datetime_ == datetime_ + timedelta(seconds=2)
+    for account in (sender, recipient, other):
+        datetimes = [entry[0] for entry in account.balance_history[1:]]
+        assert datetimes == sorted(set(datetimes))
+        assert datetimes == [
+            entry[2].datetime_ for entry in account.balance_history[1:]
+        ]
@@ -110,6 +110,24 @@ def test_path(first_category: Category, length: int, data: st.DataObject) -> Non
     assert categories[-1].path == expected_string[:-1]
 
 
+def test_path_follows_rename_and_reparent() -> None:
+    root = Category("Root", CategoryType.EXPENSE)
+    other = Category("Other", CategoryType.EXPENSE)
+    child = Category("Child", CategoryType.EXPENSE, root)
+    grandchild = Category("Grandchild", CategoryType.EXPENSE, child)
+    assert grandchild.path == "Root/Child/Grandchild"
+
+    root.name = "Renamed"
+    assert grandchild.path == "Renamed/Child/Grandchild"
+
+    child.parent = other
+    assert child.path == "Other/Child"
+    assert grandchild.path == "Other/Child/Grandchild"
+
+    child.parent = None
+    assert grandchild.path == "Child/Grandchild"
+
+
 @given(data=st.data())
 def test_set_child_index(data: st.DataObject) -> None:
     parent = data.draw(categories())
@@ -249,3 +267,47 @@ def test_descendants_multiple_children() -> None:
     assert c1.descendants == frozenset([c2a, c2b, c3aa, c3ab, c3ba, c3bb])
     assert c2a.descendants == frozenset([c3aa, c3ab])
     assert c2b.descendants == frozenset([c3ba, c3bb])
+
+
+def test_hierarchy_follows_reparent() -> None:
+    c1 = Category("1", CategoryType.EXPENSE)
+    c2a = Category("2a", CategoryType.EXPENSE, c1)
+    c2b = Category("2b", CategoryType.EXPENSE, c1)
+    c3 = Category("3", CategoryType.EXPENSE, c2a)
+    other = Category("Other", CategoryType.EXPENSE)
+    assert c3.is_descendant_of(c1)
+    assert c1.is_ancestor_of(c3)
+    assert not c3.is_descendant_of(c2b)
+    assert not c3.is_descendant_of(other)
+
+    c2a.parent = c2b
+    assert c3.ancestors == frozenset([c1, c2a, c2b])
+    assert c2b.descendants == frozenset([c2a, c3])
+    assert c3.is_descendant_of(c2b)
+
+    c2b.parent = other
+    assert c3.is_descendant_of(other)
+    assert not c3.is_descendant_of(c1)
+    assert c1.descendants == frozenset()
+    assert not c3.is_descendant_of(c3)
+
+
+def test_hierarchy_numbering_per_tree() -> None:
+    c1 = Category("1", CategoryType.EXPENSE)
+    c2 = Category("2", CategoryType.EXPENSE, c1)
+    other = Category("Other", CategoryType.EXPENSE)
+    other_child = Category("Other Child", CategoryType.EXPENSE, other)
+    assert c2.is_descendant_of(c1)
+    assert other_child.is_descendant_of(other)
+    numbering = c1._tree_position.numbering
+
+    # changes of another tree keep the numbering of this one
+    Category("Other Child 2", CategoryType.EXPENSE, other)
+    assert c2.is_descendant_of(c1)
+    assert c1._tree_position.numbering is numbering
+
+    # a numbered root attached to a Category without a numbering is renumbered
+    root = Category("Root", CategoryType.EXPENSE)
+    c1.parent = root
+    assert c2.is_descendant_of(root)
+    assert c1.ancestors == frozenset([root])
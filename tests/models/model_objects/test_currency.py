@@ -1,14 +1,19 @@
 import string
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from typing import Any
 
 import pytest
 from hypothesis import assume, given
 from hypothesis import strategies as st
 from src.models.model_objects.currency_objects import (
+    ConversionFactorNotFoundError,
     Currency,
     CurrencyError,
+    CurrencyGraph,
     ExchangeRate,
 )
+from src.models.user_settings import user_settings
 from tests.models.test_assets.composites import currencies, everything_except
 
 
@@ -128,3 +133,142 @@ def test_remove_exchange_rate(currency: Currency, other: Currency) -> None:
     assert other in currency.convertible_to
     currency.remove_exchange_rate(exchange_rate)
     assert other not in currency.convertible_to
+
+
+def test_conversion_factor_cache_dated() -> None:
+    czk = Currency("CZK", 2)
+    eur = Currency("EUR", 2)
+    exchange_rate = ExchangeRate(eur, czk)
+    exchange_rate.event_reset_currency_caches.append(czk.reset_cache)
+    exchange_rate.event_reset_currency_caches.append(eur.reset_cache)
+    today = datetime.now(user_settings.settings.time_zone).date()
+    yesterday = today - timedelta(days=1)
+    exchange_rate.set_rate(yesterday, "25")
+    exchange_rate.set_rate(today, "24")
+
+    assert czk.get_conversion_factor(eur, yesterday) == 1 / Decimal(25)
+    assert czk.get_conversion_factor(eur, yesterday) == 1 / Decimal(25)
+    assert eur.get_conversion_factor(czk, yesterday) == Decimal(25)
+    assert czk.get_conversion_factor(eur, today) == 1 / Decimal(24)
+    assert czk.factor_cache_info.hits == 1
+    assert czk.factor_cache_info.misses == 2
+    assert eur.factor_cache_info.hits == 1
+    assert eur.factor_cache_info.misses == 0
+    assert czk.factor_cache_info.size == 2
+
+    exchange_rate.set_rate(yesterday, "26")
+    assert czk.factor_cache_info.size == 0
+    assert czk.get_conversion_factor(eur, yesterday) == 1 / Decimal(26)
+
+
+def test_conversion_factor_cache_eviction() -> None:
+    czk = Currency("CZK", 2)
+    eur = Currency("EUR", 2)
+    exchange_rate = ExchangeRate(eur, czk)
+    start = date(2000, 1, 1)
+    exchange_rate.set_rate(start, "25")
+    for day in range(Currency.FACTOR_CACHE_MAX_SIZE + 1):
+        czk.get_conversion_factor(eur, start + timedelta(days=day))
+
+    assert czk.factor_cache_info.size == Currency.FACTOR_CACHE_MAX_SIZE
+    czk.get_conversion_factor(eur, start)
+    assert czk.factor_cache_info.misses == Currency.FACTOR_CACHE_MAX_SIZE + 2
+
+
+def test_conversion_factor_cache_reverse_hit_recency() -> None:
+    czk = Currency("CZK", 2)
+    eur = Currency("EUR", 2)
+    exchange_rate = ExchangeRate(eur, czk)
+    start = date(2000, 1, 1)
+    exchange_rate.set_rate(start, "25")
+    for day in range(Currency.FACTOR_CACHE_MAX_SIZE):
+        eur.get_conversion_factor(czk, start + timedelta(days=day))
+
+    # the reverse hit refreshes the oldest entry, so the next one is evicted
+    czk.get_conversion_factor(eur, start)
+    eur.get_conversion_factor(czk, start - timedelta(days=1))
+    hits = eur.factor_cache_info.hits
+    eur.get_conversion_factor(czk, start)
+    assert eur.factor_cache_info.hits == hits + 1
+    eur.get_conversion_factor(czk, start + timedelta(days=1))
+    assert eur.factor_cache_info.hits == hits + 1
+
+
+def test_conversion_factor_cache_reset_by_rate_edits() -> None:
+    czk = Currency("CZK", 2)
+    eur = Currency("EUR", 2)
+    usd = Currency("USD", 2)
+    eur_czk = ExchangeRate(eur, czk)
+    usd_eur = ExchangeRate(usd, eur)
+    today = datetime.now(user_settings.settings.time_zone).date()
+    yesterday = today - timedelta(days=1)
+    eur_czk.set_rate(yesterday, "25")
+    usd_eur.set_rate(yesterday, "2")
+    assert usd.get_conversion_factor(czk, yesterday) == Decimal(50)
+
+    # no RecordKeeper resets the caches, the ExchangeRate resets them itself
+    eur_czk.set_rate(yesterday, "26", update=False)
+    assert usd.get_conversion_factor(czk, yesterday) == Decimal(52)
+    assert czk.get_conversion_factor(usd, yesterday) == 1 / Decimal(52)
+
+    eur_czk.set_rates([(today, "27")], update=False)
+    assert usd.get_conversion_factor(czk, today) == Decimal(54)
+
+    eur_czk.delete_rate(today, update=False)
+    assert usd.get_conversion_factor(czk, today) == Decimal(52)
+
+def test_currency_graph_shortest_route() -> None:
+    czk = Currency("CZK", 2)
+    eur = Currency("EUR", 2)
+    usd = Currency("USD", 2)
+    gbp = Currency("GBP", 2)
+    eur_czk = ExchangeRate(eur, czk)
+    usd_eur = ExchangeRate(usd, eur)
+    gbp_usd = ExchangeRate(gbp, usd)
+    graph = CurrencyGraph()
+    graph.rebuild((czk, eur, usd, gbp))
+
+    assert graph.get_route(czk, gbp) == (eur_czk, usd_eur, gbp_usd)
+
+    gbp_czk = ExchangeRate(gbp, czk)
+    graph.rebuild((czk, eur, usd, gbp))
+    assert graph.get_route(czk, gbp) == (gbp_czk,)
+    assert graph.get_route(czk, usd) in {(eur_czk, usd_eur), (gbp_czk, gbp_usd)}
+
+
+def test_currency_routes_follow_exchange_rate_changes() -> None:
+    czk = Currency("CZK", 2)
+    eur = Currency("EUR", 2)
+    usd = Currency("USD", 2)
+    gbp = Currency("GBP", 2)
+    eur_czk = ExchangeRate(eur, czk)
+    usd_eur = ExchangeRate(usd, eur)
+    graph = CurrencyGraph()
+    graph.rebuild((czk, eur, usd, gbp))
+    assert graph.get_route(czk, usd) == (eur_czk, usd_eur)
+
+    # CZK is not part of the new ExchangeRate, but may route through it
+    gbp_usd = ExchangeRate(gbp, usd)
+    assert graph.get_route(czk, gbp) == (eur_czk, usd_eur, gbp_usd)
+
+    usd_eur.prepare_for_deletion()
+    assert graph.get_route(czk, usd) is None
+    assert graph.get_route(czk, gbp) is None
+
+
+def test_currency_graph_no_route() -> None:
+    czk = Currency("CZK", 2)
+    eur = Currency("EUR", 2)
+    usd = Currency("USD", 2)
+    exchange_rate = ExchangeRate(eur, czk)
+    exchange_rate.set_rate(date(2000, 1, 1), "25")
+    graph = CurrencyGraph()
+    graph.rebuild((czk, eur, usd))
+
+    assert graph.get_route(czk, usd) is None
+    with pytest.raises(ConversionFactorNotFoundError):
+        czk.get_conversion_factor(usd)
+
+    exchange_rate.prepare_for_deletion()
+    graph.rebuild((czk, eur, usd))
+    assert graph.get_route(czk, eur) is None
@@ -43,7 +43,8 @@ def test_creation(primary: Currency, secondary: Currency) -> None:
 @given(
     primary=currencies(),
     secondary=currencies(),
-    rate=valid_decimals(min_value=Decimal("0.01")) | st.integers(min_value=1, max_value=1e6),
+    rate=valid_decimals(min_value=Decimal("0.01"))
+    | st.integers(min_value=1, max_value=1e6),
     date_=st.dates(),
 )
 def test_set_rate(
@@ -59,7 +60,8 @@ def test_set_rate(
 @given(
     primary=currencies(),
     secondary=currencies(),
-    rate=valid_decimals(min_value=Decimal("0.01")) | st.integers(min_value=1, max_value=1e6),
+    rate=valid_decimals(min_value=Decimal("0.01"))
+    | st.integers(min_value=1, max_value=1e6),
     date_=st.dates(),
 )
 def test_set_and_delete_rate(
@@ -258,3 +260,70 @@ def test_set_rates(primary: Currency, secondary: Currency, data: st.DataObject)
         assert exchange_rate.latest_rate.is_nan()
 
     assert exchange_rate.latest_date == latest_date
+
+
+@given(
+    data=st.lists(
+        st.tuples(
+            st.dates(min_value=date(2000, 1, 1), max_value=date(2001, 1, 1)),
+            st.decimals(min_value="0.01", max_value=1_000, places=2),
+        ),
+        min_size=1,
+        max_size=10,
+        unique_by=lambda x: x[0],
+    ),
+    dates=st.lists(
+        st.dates(min_value=date(1999, 12, 1), max_value=date(2001, 2, 1)),
+        max_size=20,
+    ),
+)
+def test_get_rates(data: list[tuple[date, Decimal]], dates: list[date]) -> None:
+    exchange_rate = ExchangeRate(Currency("EUR", 2), Currency("CZK", 2))
+    exchange_rate.set_rates(data)
+
+    pairs = sorted(data)
+    expected = []
+    for date_ in dates:
+        earlier_rates = [rate for _date, rate in pairs if _date <= date_]
+        expected.append(earlier_rates[-1] if earlier_rates else pairs[0][1])
+
+    assert exchange_rate.get_rates(dates) == expected
+    assert [exchange_rate.get_rate(date_) for date_ in dates] == expected
+
+
+def test_get_rates_long_sparse_history() -> None:
+    exchange_rate = ExchangeRate(Currency("EUR", 2), Currency("CZK", 2))
+    exchange_rate.set_rate(date(1900, 1, 1), "30")
+    exchange_rate.set_rate(date(1901, 1, 1), "29")
+    exchange_rate.set_rate(date(2010, 1, 1), "25")
+
+    assert exchange_rate.get_rates(
+        [date(1899, 1, 1), date(1950, 1, 1), date(2000, 1, 1), date(2020, 1, 1)]
+    ) == [Decimal(30), Decimal(29), Decimal(29), Decimal(25)]
+
+
+def test_get_rates_empty() -> None:
+    exchange_rate = ExchangeRate(Currency("EUR", 2), Currency("CZK", 2))
+    rates = exchange_rate.get_rates([date(2000, 1, 1), date(2000, 1, 2)])
+    assert len(rates) == 2
+    assert all(rate.is_nan() for rate in rates)
+
+
+def test_update_values_after_overwrite_and_delete() -> None:
+    exchange_rate = ExchangeRate(Currency("EUR", 2), Currency("CZK", 2))
+    exchange_rate.set_rate(date(2000, 1, 3), "25.5")
+    exchange_rate.set_rate(date(2000, 1, 1), "25.123")
+    exchange_rate.set_rate(date(2000, 1, 2), "25")
+    assert exchange_rate.rate_decimals == 3
+    assert exchange_rate.earliest_date == date(2000, 1, 1)
+    assert exchange_rate.latest_date == date(2000, 1, 3)
+
+    exchange_rate.set_rate(date(2000, 1, 1), "25.12")
+    assert exchange_rate.rate_decimals == 2
+
+    exchange_rate.delete_rate(date(2000, 1, 1))
+    exchange_rate.delete_rate(date(2000, 1, 3))
+    assert exchange_rate.rate_decimals == 0
+    assert exchange_rate.earliest_date == date(2000, 1, 2)
+    assert exchange_rate.latest_date == date(2000, 1, 2)
+    assert exchange_rate.latest_rate == Decimal(25)
@@ -395,6 +395,95 @@ def test_calculate_return_before_earliest_date() -> None:
     assert returns.is_nan()
 
 
+@given(
+    data=st.lists(
+        st.tuples(
+            st.dates(min_value=date(2000, 1, 1), max_value=date(2001, 1, 1)),
+            st.decimals(min_value="0.01", max_value=1_000, places=2),
+        ),
+        min_size=1,
+        max_size=10,
+        unique_by=lambda x: x[0],
+    ),
+    dates=st.lists(
+        st.dates(min_value=date(1999, 12, 1), max_value=date(2001, 2, 1)),
+        max_size=20,
+    ),
+)
+def test_get_prices(data: list[tuple[date, Decimal]], dates: list[date]) -> None:
+    security = get_security()
+    security.set_prices(
+        [(date_, CashAmount(value, security.currency)) for date_, value in data]
+    )
+
+    pairs = sorted(data)
+    expected = []
+    for date_ in dates:
+        earlier_values = [value for _date, value in pairs if _date <= date_]
+        expected.append(earlier_values[-1] if earlier_values else None)
+
+    prices = security.get_prices(dates)
+    for date_, price, value in zip(dates, prices, expected, strict=True):
+        if value is None:
+            assert price.is_nan()
+            assert security.get_price(date_).is_nan()
+        else:
+            assert price == CashAmount(value, security.currency)
+            assert security.get_price(date_) == price
+
+
+def test_get_prices_long_sparse_history() -> None:
+    security = get_security()
+    currency = security.currency
+    security.set_price(date(1900, 1, 1), CashAmount(30, currency))
+    security.set_price(date(1901, 1, 1), CashAmount(29, currency))
+    security.set_price(date(2010, 1, 1), CashAmount(25, currency))
+
+    prices = security.get_prices(
+        [date(1899, 1, 1), date(1950, 1, 1), date(2000, 1, 1), date(2020, 1, 1)]
+    )
+    assert prices[0].is_nan()
+    assert prices[1:] == [
+        CashAmount(29, currency),
+        CashAmount(29, currency),
+        CashAmount(25, currency),
+    ]
+
+
+def test_update_values_after_overwrite_and_delete() -> None:
+    security = get_security()
+    currency = security.currency
+    security.set_price(date(2000, 1, 3), CashAmount("100.5", currency))
+    security.set_price(date(2000, 1, 1), CashAmount("99.123", currency))
+    security.set_price(date(2000, 1, 2), CashAmount("100", currency))
+    assert security.price_decimals == 3
+    assert security.earliest_date == date(2000, 1, 1)
+    assert security.latest_date == date(2000, 1, 3)
+
+    security.set_price(date(2000, 1, 1), CashAmount("99.12", currency))
+    assert security.price_decimals == 2
+
+    security.delete_price(date(2000, 1, 1))
+    security.delete_price(date(2000, 1, 3))
+    assert security.price_decimals == 2
+    assert security.earliest_date == date(2000, 1, 2)
+    assert security.latest_date == date(2000, 1, 2)
+    assert security.price == CashAmount(100, currency)
+
+
+def test_prices_keep_their_exponent() -> None:
+    security = get_security()
+    currency = security.currency
+    security.set_price(date(2000, 1, 1), CashAmount("25.50", currency))
+    security.set_price(date(2000, 1, 2), CashAmount("1.2345", currency))
+
+    price = security.get_price(date(2000, 1, 1))
+    assert price.value_normalized == Decimal("25.50")
+    assert price.minor_units == 2550
+    assert security.get_prices([date(2000, 1, 1)])[0].minor_units == 2550
+    assert security.get_price(date(2000, 1, 2)).minor_units is None
+
+
 def get_security() -> Security:
     return Security(
         "Vanguard FTSE All-World UCITS ETF USD Acc",
@@ -1,5 +1,4 @@
 import math
-from collections import defaultdict
 from datetime import datetime, timedelta
 from decimal import Decimal
 from types import NoneType
@@ -11,7 +10,12 @@ from hypothesis import strategies as st
 from src.models.base_classes.account import UnrelatedAccountError
 from src.models.model_objects.account_group import AccountGroup
 from src.models.model_objects.cash_objects import CashAccount
-from src.models.model_objects.currency_objects import CashAmount, Currency, ExchangeRate
+from src.models.model_objects.currency_objects import (
+    CashAmount,
+    Currency,
+    CurrencyGraph,
+    ExchangeRate,
+)
 from src.models.model_objects.security_objects import (
     Security,
     SecurityAccount,
@@ -116,10 +120,7 @@ def test_get_balance(
     security_b = Security("B", "B", "ETF", currency_b, 1)
     security_a.set_price(date_, CashAmount(price_a, currency_a))
     security_b.set_price(date_, CashAmount(price_b, currency_b))
-    d = defaultdict(lambda: Decimal(0))
-    d[security_a] += shares_a
-    d[security_b] += shares_b
-    account._securities_history = [(datetime_, d)]
+    account._securities = {security_a: Decimal(shares_a), security_b: Decimal(shares_b)}
     account._update_balances()
     balance_a = account.get_balance(currency_a)
     balance_b = account.get_balance(currency_b)
@@ -232,10 +233,7 @@ def test_get_balance_same_currency_securities(
     security_b = Security("B", "B", "ETF", currency, 1)
     security_a.set_price(date_, CashAmount(price_a, currency))
     security_b.set_price(date_, CashAmount(price_b, currency))
-    d = defaultdict(lambda: Decimal(0))
-    d[security_a] += shares_a
-    d[security_b] += shares_b
-    account._securities_history = [(datetime_, d)]
+    account._securities = {security_a: Decimal(shares_a), security_b: Decimal(shares_b)}
     account._update_balances()
     balance_a = account.get_balance(currency)
     balance_b = account.get_balance(currency)
@@ -555,3 +553,159 @@ def test_get_shares_for_datetime() -> None:
 
     with pytest.raises(ValueError, match="Datetime not found"):
         account.get_shares_for_datetime(security, today - timedelta(days=10))
+
+
+def test_incremental_shares_history() -> None:
+    account = SecurityAccount("Test")
+    usd = Currency("USD", 2)
+    cash_account = CashAccount("Test", usd, CashAmount(0, usd))
+    security = Security("Alphabet", "ABC", "Stock", usd, 1)
+    security_other = Security("Other", "OTHER", "Stock", usd, 1)
+    today = datetime.now(user_settings.settings.time_zone)
+
+    def buy(security: Security, shares: int, days_ago: int) -> SecurityTransaction:
+        return SecurityTransaction(
+            "test",
+            today - timedelta(days=days_ago),
+            SecurityTransactionType.BUY,
+            security,
+            shares,
+            CashAmount(1, usd),
+            account,
+            cash_account,
+        )
+
+    buy(security, 1, 1)
+    t_2 = buy(security, 2, 3)
+    buy(security_other, 4, 2)
+    t_4 = buy(security, 8, 5)
+
+    assert account.transactions == tuple(
+        sorted(account.transactions, key=lambda x: x.timestamp)
+    )
+    assert account.get_shares_for_datetime(security, today - timedelta(days=4)) == 8
+    assert account.get_shares_for_datetime(security, today - timedelta(days=2)) == 10
+    assert account.securities == {security: 11, security_other: 4}
+
+    t_2.set_attributes(datetime_=today - timedelta(hours=1))
+    assert account.get_shares_for_datetime(security, today - timedelta(days=1)) == 9
+    assert account.get_shares_for_datetime(security, today) == 11
+
+    t_4.set_attributes(security=security_other)
+    assert account.securities == {security: 3, security_other: 12}
+
+    totals = {
+        security: list(log.totals) for security, log in account._share_logs.items()
+    }
+    account.update_securities()
+    assert {
+        security: list(log.totals) for security, log in account._share_logs.items()
+    } == totals
+
+    SecurityTransaction(
+        "test",
+        today,
+        SecurityTransactionType.SELL,
+        security,
+        3,
+        CashAmount(1, usd),
+        account,
+        cash_account,
+    )
+    assert account.securities == {security_other: 12}
+    assert account.securities[security] == 0
+
+
+def test_average_amount_per_share_follows_edits() -> None:
+    usd = Currency("USD", 2)
+    eur = Currency("EUR", 2)
+    exchange_rate = ExchangeRate(usd, eur)
+    currency_graph = CurrencyGraph()
+    currency_graph.rebuild((usd, eur))
+    exchange_rate.event_reset_currency_caches.append(currency_graph.reset_caches)
+    today = datetime.now(user_settings.settings.time_zone)
+    exchange_rate.set_rate((today - timedelta(days=10)).date(), 2)
+
+    cash_account = CashAccount("Test", usd, CashAmount(0, usd))
+    security = Security("Alphabet", "ABC", "Stock", usd, 1)
+    account_1 = SecurityAccount("1")
+    account_2 = SecurityAccount("2")
+    account_3 = SecurityAccount("3")
+    buy = SecurityTransaction(
+        "buy",
+        today - timedelta(days=5),
+        SecurityTransactionType.BUY,
+        security,
+        10,
+        CashAmount(10, usd),
+        account_1,
+        cash_account,
+    )
+    SecurityTransfer(
+        "1->2", today - timedelta(days=4), security, 5, account_1, account_2
+    )
+    SecurityTransfer(
+        "2->3", today - timedelta(days=3), security, 5, account_2, account_3
+    )
+
+    assert account_3.get_average_amount_per_share(security) == CashAmount(10, usd)
+    assert account_3.get_average_amount_per_share(security, currency=eur) == CashAmount(
+        20, eur
+    )
+
+    buy.set_attributes(amount_per_share=CashAmount(20, usd))
+    assert account_3.get_average_amount_per_share(security) == CashAmount(20, usd)
+
+    SecurityTransaction(
+        "buy",
+        today - timedelta(days=6),
+        SecurityTransactionType.BUY,
+        security,
+        10,
+        CashAmount(40, usd),
+        account_1,
+        cash_account,
+    )
+    assert account_3.get_average_amount_per_share(security) == CashAmount(30, usd)
+    assert account_2.get_average_amount_per_share(
+        security, today - timedelta(days=3, hours=12)
+    ) == CashAmount(30, usd)
+
+    exchange_rate.set_rate((today - timedelta(days=10)).date(), 3)
+    assert account_3.get_average_amount_per_share(security, currency=eur) == CashAmount(
+        90, eur
+    )
+
+
+def test_average_amount_per_share_follows_rate_edits() -> None:
+    eur = Currency("EUR", 2)
+    czk = Currency("CZK", 2)
+    exchange_rate = ExchangeRate(eur, czk)
+    currency_graph = CurrencyGraph()
+    currency_graph.rebuild((eur, czk))
+    exchange_rate.event_reset_currency_caches.append(currency_graph.reset_caches)
+    today = datetime.now(user_settings.settings.time_zone)
+    rate_date = (today - timedelta(days=10)).date()
+    exchange_rate.set_rate(rate_date, 25)
+
+    cash_account = CashAccount("Test", eur, CashAmount(0, eur))
+    security = Security("Alphabet", "ABC", "Stock", eur, 1)
+    account = SecurityAccount("1")
+    SecurityTransaction(
+        "buy",
+        today - timedelta(days=5),
+        SecurityTransactionType.BUY,
+        security,
+        10,
+        CashAmount(100, eur),
+        account,
+        cash_account,
+    )
+
+    assert account.get_average_amount_per_share(security, currency=czk) == CashAmount(
+        2500, czk
+    )
+    exchange_rate.set_rate(rate_date, 30)
+    assert account.get_average_amount_per_share(security, currency=czk) == CashAmount(
+        3000, czk
+    )
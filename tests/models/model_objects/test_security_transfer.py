@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from decimal import Decimal
 from types import NoneType
 from typing import Any
 
@@ -6,9 +7,13 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 from src.models.custom_exceptions import TransferSameAccountError
+from src.models.model_objects.cash_objects import CashAccount, CashTransfer
+from src.models.model_objects.currency_objects import CashAmount, Currency
 from src.models.model_objects.security_objects import (
     Security,
     SecurityAccount,
+    SecurityTransaction,
+    SecurityTransactionType,
     SecurityTransfer,
 )
 from src.models.user_settings import user_settings
@@ -162,3 +167,62 @@ def test_is_accounts_related(
     assert transaction.is_accounts_related(related_accounts)
     unrelated_accounts = (unrelated_account,)
     assert not transaction.is_accounts_related(unrelated_accounts)
+
+
+def test_datetime_collision_moves_transfer_in_both_accounts() -> None:
+    currency = Currency("CZK", 2)
+    cash_account = CashAccount("Cash", currency, currency.zero_amount)
+    security = Security("Alphabet", "ABC", "Stock", currency, 1)
+    sender = SecurityAccount("Sender")
+    recipient = SecurityAccount("Recipient")
+    datetime_ = datetime(2024, 1, 1, 12, tzinfo=user_settings.settings.time_zone)
+
+    def buy(account: SecurityAccount, datetime_: datetime) -> SecurityTransaction:
+        return SecurityTransaction(
+            "buy",
+            datetime_,
+            SecurityTransactionType.BUY,
+            security,
+            10,
+            CashAmount(1, currency),
+            account,
+            cash_account,
+        )
+
+    buy(sender, datetime_ - timedelta(hours=1))
+    buy(recipient, datetime_)
+    # a stale entry would be out of order relative to this one
+    buy(sender, datetime_ + timedelta(milliseconds=500))
+    transfer = SecurityTransfer("moved", datetime_, security, 5, sender, recipient)
+    assert transfer.datetime_ == datetime_ + timedelta(seconds=1)
+    assert sender.get_shares_for_datetime(
+        security, datetime_ + timedelta(milliseconds=700)
+    ) == Decimal(20)
+
+    later = buy(sender, datetime_ + timedelta(seconds=1))
+    assert later.datetime_ == datetime_ + timedelta(seconds=2)
+    assert cash_account.balance_history[-1][0] == later.datetime_
+
+    # a collision in the CashAccount moves the entry in the SecurityAccount too
+    other_cash_account = CashAccount("Other", currency, currency.zero_amount)
+    amount = CashAmount(1, currency)
+    CashTransfer(
+        "cash",
+        datetime_ + timedelta(seconds=3),
+        other_cash_account,
+        cash_account,
+        amount,
+        amount,
+    )
+    buy(sender, datetime_ + timedelta(milliseconds=3500))
+    last = buy(sender, datetime_ + timedelta(seconds=3))
+    assert last.datetime_ == datetime_ + timedelta(seconds=4)
+    assert sender.get_shares_for_datetime(
+        security, datetime_ + timedelta(milliseconds=3700)
+    ) == Decimal(35)
+
+    for account in (sender, recipient):
+        timestamps = [t.timestamp for t in account.transactions]
+        assert timestamps == sorted(set(timestamps))
+    assert recipient.get_shares_for_datetime(security) == Decimal(15)
+    assert sender.get_shares_for_datetime(security) == Decimal(45)
@@ -28,6 +28,7 @@ from src.models.statistics.attribute_stats import (
     calculate_attribute_stats,
     calculate_periodic_attribute_stats,
     calculate_periodic_totals_and_averages,
+    split_attribute_stats,
 )
 from src.models.user_settings import user_settings
 
@@ -86,6 +87,14 @@ def test_calculate_attribute_stats() -> None:
     assert tag_stats[tag_1].attribute == tag_1
     assert tag_stats[tag_2].attribute == tag_2
 
+    income, expense = split_attribute_stats(tag_stats[tag_1], currency)
+    assert income.balance == CashAmount(1, currency)
+    assert income.transactions == {t1}
+    assert income.no_of_transactions == 1
+    assert expense.balance == CashAmount(-2, currency)
+    assert expense.transactions == {t3}
+    assert expense.no_of_transactions == 1
+
     payee_stats = calculate_attribute_stats([t1, t2, t3], currency, [payee_1, payee_2])
     assert payee_stats[payee_1].no_of_transactions == 2
     assert payee_stats[payee_2].no_of_transactions == 1
@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta
+
+from src.models.model_objects.currency_objects import CashAmount, Currency, ExchangeRate
+from src.models.model_objects.security_objects import (
+    Security,
+    SecurityAccount,
+    SecurityTransfer,
+)
+from src.models.statistics.cashflow_stats import calculate_cash_flow
+from src.models.user_settings import user_settings
+
+
+def test_calculate_cash_flow_security_transfer_in_foreign_currency() -> None:
+    usd = Currency("USD", 2)
+    eur = Currency("EUR", 2)
+    today = datetime.now(user_settings.settings.time_zone)
+    exchange_rate = ExchangeRate(eur, usd)
+    exchange_rate.set_rate(today.date() - timedelta(days=1), 2)
+    security = Security("Alphabet", "ABC", "Stock", eur, 1)
+    security.set_price(today.date() - timedelta(days=1), CashAmount(10, eur))
+    sender = SecurityAccount("Sender")
+    recipient = SecurityAccount("Recipient")
+    transfer = SecurityTransfer("test", today, security, 3, sender, recipient)
+
+    # the transferred value is converted from Security currency to base Currency
+    inward = calculate_cash_flow([transfer], [recipient], usd).inward_transfers
+    assert inward.balance == CashAmount(60, usd)
+    assert inward.transactions == {transfer}
+
+    outward = calculate_cash_flow([transfer], [sender], usd).outward_transfers
+    assert outward.balance == CashAmount(60, usd)
+    assert outward.transactions == {transfer}
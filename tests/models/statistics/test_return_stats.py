@@ -0,0 +1,84 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from hypothesis import given
+from hypothesis import strategies as st
+from src.models.model_objects.currency_objects import CashAmount, Currency, ExchangeRate
+from src.models.model_objects.security_objects import Security
+from src.models.statistics.return_stats import ReturnsCalculator, get_return_periods
+
+TODAY = date(2024, 3, 15)
+
+
+def _assert_returns_equal(actual: Decimal, expected: Decimal) -> None:
+    if expected.is_nan():
+        assert actual.is_nan()
+    else:
+        assert actual == expected
+
+
+@given(
+    data=st.dictionaries(
+        st.dates(min_value=date(2010, 1, 1), max_value=TODAY),
+        st.decimals(min_value=Decimal("0.01"), max_value=10_000, places=2),
+        max_size=10,
+    )
+)
+def test_matches_calculate_return(data: dict[date, Decimal]) -> None:
+    usd = Currency("USD", 2)
+    security = Security("Alphabet", "ABC", "Stock", usd, 1)
+    security.set_prices(
+        [(date_, CashAmount(price, usd)) for date_, price in data.items()]
+    )
+    periods = get_return_periods(TODAY)
+
+    calculator: ReturnsCalculator[Security] = ReturnsCalculator(
+        lambda security: security.decimal_price_history
+    )
+    returns = calculator.calculate([security], periods)[security]
+
+    for period, (start, end) in periods.items():
+        _assert_returns_equal(returns[period], security.calculate_return(start, end))
+    assert "Total p.a." in returns
+
+
+def test_exchange_rate_total_per_annum() -> None:
+    exchange_rate = ExchangeRate(Currency("EUR", 2), Currency("USD", 2))
+    exchange_rate.set_rate(TODAY - timedelta(days=730), Decimal(1))
+    exchange_rate.set_rate(TODAY, Decimal("1.21"))
+
+    calculator: ReturnsCalculator[ExchangeRate] = ReturnsCalculator(
+        lambda exchange_rate: exchange_rate.rate_history
+    )
+    returns = calculator.calculate([exchange_rate], get_return_periods(TODAY))
+
+    assert returns[exchange_rate]["Total"] == Decimal(21)
+    assert round(returns[exchange_rate]["Total p.a."], 1) == Decimal("10.0")
+    assert returns[exchange_rate]["10Y"].is_nan()
+
+
+def test_cache_invalidated_by_new_price() -> None:
+    usd = Currency("USD", 2)
+    security = Security("Alphabet", "ABC", "Stock", usd, 1)
+    security.set_price(TODAY - timedelta(days=1), CashAmount(100, usd))
+    security.set_price(TODAY, CashAmount(110, usd))
+    periods = get_return_periods(TODAY)
+    calculator: ReturnsCalculator[Security] = ReturnsCalculator(
+        lambda security: security.decimal_price_history
+    )
+
+    assert calculator.calculate([security], periods)[security]["1D"] == Decimal(10)
+    assert calculator.calculate([security], periods)[security]["1D"] == Decimal(10)
+
+    security.set_price(TODAY, CashAmount(120, usd))
+    assert calculator.calculate([security], periods)[security]["1D"] == Decimal(20)
+
+
+def test_empty_series() -> None:
+    security = Security("Alphabet", "ABC", "Stock", Currency("USD", 2), 1)
+    calculator: ReturnsCalculator[Security] = ReturnsCalculator(
+        lambda security: security.decimal_price_history
+    )
+    returns = calculator.calculate([security], get_return_periods(TODAY))[security]
+    assert all(value.is_nan() for value in returns.values())
+    assert "Total p.a." in returns
@@ -12,6 +12,10 @@ class ConcreteTransaction(Transaction):
         super().__init__()
         self.set_attributes(description=description, datetime_=datetime_)
 
+    @property
+    def accounts(self) -> frozenset[Account]:
+        return super().accounts
+
     def is_account_related(self, account: Account) -> bool:
         return super().is_account_related(account)
 
@@ -1,3 +1,4 @@
+import json
 import string
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -8,6 +9,8 @@ import pytest
 from hypothesis import assume, given
 from hypothesis import strategies as st
 from src.models.base_classes.account import Account
+from src.models.json.custom_json_decoder import CustomJSONDecoder
+from src.models.json.custom_json_encoder import CustomJSONEncoder
 from src.models.model_objects.attributes import AttributeType, Category, CategoryType
 from src.models.model_objects.cash_objects import (
     CashAccount,
@@ -1245,3 +1248,111 @@ def get_preloaded_record_keeper() -> RecordKeeper:
     record_keeper.add_category("Salary", CategoryType.INCOME)
     record_keeper.add_category("Splitting costs", CategoryType.DUAL_PURPOSE)
     return record_keeper
+
+
+def test_bulk_add() -> None:
+    def add_transactions(record_keeper: RecordKeeper) -> None:
+        for days in range(5):
+            record_keeper.add_cash_transaction(
+                f"Transaction {days}",
+                today - timedelta(days=days),
+                CashTransactionType.EXPENSE,
+                "Account",
+                "Payee",
+                (("Food", Decimal(days + 1)),),
+                (),
+            )
+
+    today = datetime.now(user_settings.settings.time_zone)
+    record_keepers = []
+    for _ in range(2):
+        record_keeper = RecordKeeper()
+        record_keeper.add_currency("CZK", 2)
+        record_keeper.add_cash_account("Account", "CZK", 100, "")
+        record_keeper.add_category("Food", CategoryType.EXPENSE)
+        record_keepers.append(record_keeper)
+    bulk_record_keeper, record_keeper = record_keepers
+
+    add_transactions(record_keeper)
+    with bulk_record_keeper.bulk_add():
+        add_transactions(bulk_record_keeper)
+        account = bulk_record_keeper.get_account("Account", CashAccount)
+        assert account.get_balance(account.currency) == CashAmount(
+            100, account.currency
+        )
+
+    expected_account = record_keeper.get_account("Account", CashAccount)
+    assert account.allow_update_balance
+    assert account.get_balance(account.currency) == CashAmount(85, account.currency)
+    assert [
+        (timestamp, balance) for timestamp, balance, _ in account._balance_history
+    ] == [
+        (timestamp, balance)
+        for timestamp, balance, _ in expected_account._balance_history
+    ]
+    assert bulk_record_keeper.descriptions == record_keeper.descriptions
+
+
+def test_snapshots_follow_version() -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    version = record_keeper.version
+    transactions = record_keeper.transactions
+    expense_categories = record_keeper.expense_categories
+    assert record_keeper.transactions is transactions
+    assert record_keeper.expense_categories is expense_categories
+    assert record_keeper.version == version
+
+    record_keeper.add_category("New Category", CategoryType.EXPENSE)
+    assert record_keeper.version > version
+    assert record_keeper.transactions == transactions
+    assert record_keeper.expense_categories == (
+        *expense_categories,
+        record_keeper.get_category("New Category"),
+    )
+
+    version = record_keeper.version
+    with pytest.raises(NotFoundError):
+        record_keeper.remove_account("Missing Account")
+    assert record_keeper.version > version
+
+    version = record_keeper.version
+    record_keeper.get_attribute("New Payee", AttributeType.PAYEE)
+    assert record_keeper.version > version
+    assert "New Payee" in [payee.name for payee in record_keeper.payees]
+
+
+def test_price_and_rate_edits_change_version() -> None:
+    record_keeper = RecordKeeper()
+    record_keeper.add_currency("CZK", 2)
+    record_keeper.add_currency("EUR", 2)
+    record_keeper.add_exchange_rate("EUR", "CZK")
+    record_keeper.add_security("Security", "SEC", "ETF", "CZK", 0)
+    serialized = json.dumps(
+        record_keeper.serialize(lambda _: None), cls=CustomJSONEncoder
+    )
+    deserialized = RecordKeeper.deserialize(
+        json.loads(serialized, cls=CustomJSONDecoder), lambda _: None
+    )
+    date_ = datetime.now(user_settings.settings.time_zone).date()
+
+    for keeper in (record_keeper, deserialized):
+        security = keeper.securities[0]
+        exchange_rate = keeper.exchange_rates[0]
+        snapshot = keeper.securities
+
+        version = keeper.version
+        security.set_price(date_, CashAmount(1, security.currency))
+        assert keeper.version > version
+        assert keeper.securities is not snapshot
+
+        version = keeper.version
+        security.delete_price(date_)
+        assert keeper.version > version
+
+        version = keeper.version
+        exchange_rate.set_rate(date_, Decimal(25))
+        assert keeper.version > version
+
+        version = keeper.version
+        exchange_rate.delete_rate(date_, update=False)
+        assert keeper.version > version
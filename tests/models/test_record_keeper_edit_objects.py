@@ -410,6 +410,42 @@ def test_edit_cash_transactions_account() -> None:
         assert transaction.account.path == edit_account
 
 
+def test_edit_cash_transactions_account_updated_once() -> None:
+    record_keeper = get_preloaded_record_keeper_with_cash_transactions()
+    old_account = record_keeper.get_account("Bank Accounts/Raiffeisen CZK", CashAccount)
+    cash_transactions = list(old_account.transactions)
+    assert len(cash_transactions) > 1
+    record_keeper.add_cash_account(
+        path="Test Account CZK",
+        currency_code="CZK",
+        initial_balance_value=Decimal(0),
+        iban=IBANS_VALID[0],
+    )
+    new_account = record_keeper.get_account("Test Account CZK", CashAccount)
+    balance = old_account.get_balance(old_account.currency)
+    updates: list[CashAccount] = []
+    for account in (old_account, new_account):
+        account.event_balance_updated.append(
+            lambda account=account: updates.append(account)
+        )
+
+    record_keeper.edit_cash_transactions(
+        [transaction.uuid for transaction in cash_transactions],
+        account_path="Test Account CZK",
+    )
+    assert sorted(updates, key=lambda account: account.path) == [
+        old_account,
+        new_account,
+    ]
+    assert old_account.transactions == ()
+    assert new_account.get_balance(new_account.currency) == (
+        balance - old_account.initial_balance
+    )
+    for account in (old_account, new_account):
+        assert account.allow_update_balance
+        assert not account.balance_outdated
+
+
 def test_edit_cash_transactions_invalid_indexes() -> None:
     record_keeper = get_preloaded_record_keeper_with_cash_transactions()
     record_keeper.add_cash_transfer(
@@ -10,6 +10,7 @@ from src.models.model_objects.cash_objects import (
     CashTransactionType,
     RefundTransaction,
 )
+from src.models.model_objects.currency_objects import ConversionFactorNotFoundError
 from src.models.record_keeper import RecordKeeper
 from src.models.user_settings import user_settings
 from tests.models.test_record_keeper import (
@@ -164,6 +165,35 @@ def test_remove_transactions_is_refunded() -> None:
         record_keeper.remove_transactions(refunded_transaction_uuids)
 
 
+def test_remove_transactions_with_refunds() -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    refunded_transactions = [
+        transaction
+        for transaction in record_keeper.cash_transactions
+        if transaction.is_refunded
+    ]
+    assert refunded_transactions != []
+    uuids = [transaction.uuid for transaction in refunded_transactions]
+    for transaction in refunded_transactions:
+        uuids.extend(refund.uuid for refund in transaction.refunds)
+    other_transactions = [
+        transaction
+        for transaction in record_keeper.transactions
+        if transaction.uuid not in uuids
+    ]
+
+    record_keeper.remove_transactions(uuids)
+    assert record_keeper.transactions == tuple(other_transactions)
+    assert record_keeper.refund_transactions == ()
+    for transaction in refunded_transactions:
+        assert transaction not in transaction.account.transactions
+
+    for account in record_keeper.cash_accounts:
+        expected_balance = account.get_balance(account.currency)
+        account.update_balance()
+        assert account.get_balance(account.currency) == expected_balance
+
+
 def test_remove_security() -> None:
     record_keeper = RecordKeeper()
     record_keeper.add_currency("CZK", 2)
@@ -225,6 +255,10 @@ def test_remove_exchange_rate() -> None:
     assert len(record_keeper.exchange_rates) == 1
     record_keeper.remove_exchange_rate("CZK/EUR")
     assert len(record_keeper.exchange_rates) == 0
+    czk = record_keeper.get_currency("CZK")
+    eur = record_keeper.get_currency("EUR")
+    with pytest.raises(ConversionFactorNotFoundError):
+        czk.get_conversion_factor(eur)
 
 
 def test_remove_exchange_rate_does_not_exist() -> None:
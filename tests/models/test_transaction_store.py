@@ -0,0 +1,164 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from src.models.base_classes.transaction import Transaction
+from src.models.model_objects.attributes import CategoryType
+from src.models.model_objects.cash_objects import (
+    CashTransaction,
+    CashTransactionType,
+    RefundTransaction,
+)
+from src.models.model_objects.security_objects import SecurityRelatedTransaction
+from src.models.record_keeper import RecordKeeper
+from src.models.transaction_store import TransactionStore
+from src.models.user_settings import user_settings
+from tests.models.test_record_keeper import (
+    get_preloaded_record_keeper_with_various_transactions,
+)
+
+
+def _sorted(transactions: list[Transaction]) -> tuple[Transaction, ...]:
+    return tuple(sorted(transactions, key=lambda x: x.timestamp))
+
+
+def test_store_order_and_postings() -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    transactions = list(reversed(record_keeper.transactions))
+    store = TransactionStore(transactions)
+
+    assert len(store) == len(transactions)
+    assert tuple(store) == _sorted(transactions)
+    for account in record_keeper.accounts:
+        assert store.get_by_account(account) == _sorted(
+            [t for t in transactions if t.is_account_related(account)]
+        )
+    for tag in record_keeper.tags:
+        assert store.get_by_tag(tag) == _sorted(
+            [t for t in transactions if tag in t.tags]
+        )
+    for payee in record_keeper.payees:
+        assert store.get_by_payee(payee) == _sorted(
+            [
+                t
+                for t in transactions
+                if isinstance(t, CashTransaction | RefundTransaction)
+                and t.payee == payee
+            ]
+        )
+    for category in record_keeper.categories:
+        assert store.get_by_category(category) == _sorted(
+            [
+                t
+                for t in transactions
+                if isinstance(t, CashTransaction | RefundTransaction)
+                and category in t.categories
+            ]
+        )
+    for security in record_keeper.securities:
+        assert store.get_by_security(security) == _sorted(
+            [
+                t
+                for t in transactions
+                if isinstance(t, SecurityRelatedTransaction) and t.security == security
+            ]
+        )
+
+
+def test_store_get_between() -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    store = TransactionStore(record_keeper.transactions)
+    transactions = tuple(store)
+    start = transactions[1].datetime_
+    end = transactions[-2].datetime_
+
+    assert store.get_between() == transactions
+    assert store.get_between(start, end) == transactions[1:-1]
+    assert store.get_between(end=transactions[0].datetime_) == transactions[:1]
+    assert store.get_between(start=transactions[-1].datetime_) == transactions[-1:]
+    assert (
+        store.get_between(start=transactions[-1].datetime_ + timedelta(seconds=1)) == ()
+    )
+
+
+def test_store_remove_and_update() -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    store = TransactionStore(record_keeper.transactions)
+    first, second, *others = tuple(store)
+    account = next(iter(record_keeper.accounts))
+
+    store.remove(first)
+    assert first not in store
+    assert first not in store.get_by_account(account)
+    assert tuple(store) == (second, *others)
+
+    store.remove_many(others)
+    assert tuple(store) == (second,)
+
+    store.add(first)
+    store.add(others[0])
+    first.set_attributes(
+        datetime_=others[0].datetime_ + timedelta(days=1), block_account_update=True
+    )
+    store.update((first,))
+    assert tuple(store) == (second, others[0], first)
+
+
+def test_store_sorted_postings_cached_until_change() -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    store = TransactionStore(record_keeper.transactions)
+    first, *_ = tuple(store)
+    account = next(iter(record_keeper.accounts))
+
+    postings = store.get_by_account(account)
+    assert store.get_by_account(account) is postings
+
+    store.remove(first)
+    assert store.get_by_account(account) == tuple(t for t in postings if t is not first)
+    store.add(first)
+    assert store.get_by_account(account) == postings
+
+
+def test_record_keeper_transactions_sorted() -> None:
+    record_keeper = get_preloaded_record_keeper_with_various_transactions()
+    transactions = record_keeper.transactions
+    assert transactions == _sorted(list(transactions))
+
+    edited = next(
+        t for t in transactions if isinstance(t, CashTransaction) and not t.is_refunded
+    )
+    record_keeper.edit_cash_transactions(
+        [edited.uuid], datetime_=transactions[-1].datetime_ + timedelta(days=1)
+    )
+    assert record_keeper.transactions == (
+        *(t for t in transactions if t is not edited),
+        edited,
+    )
+
+
+def test_record_keeper_edit_replays_accounts() -> None:
+    record_keeper = RecordKeeper()
+    record_keeper.add_currency("CZK", 2)
+    record_keeper.add_cash_account("Account", "CZK", 0, "")
+    record_keeper.add_category("Category", CategoryType.EXPENSE)
+    start = datetime(2024, 1, 1, tzinfo=user_settings.settings.time_zone)
+    for hours in range(5):
+        record_keeper.add_cash_transaction(
+            "test",
+            start + timedelta(hours=hours),
+            CashTransactionType.EXPENSE,
+            "Account",
+            "Payee",
+            [("Category", Decimal(hours + 1))],
+            [],
+        )
+    edited, other = record_keeper.transactions[0], record_keeper.transactions[3]
+    record_keeper.edit_cash_transactions([edited.uuid], datetime_=other.datetime_)
+
+    # colliding datetimes are settled, the edited transaction moves past other
+    assert edited.datetime_ == other.datetime_ + timedelta(seconds=1)
+    assert record_keeper.transactions == _sorted(list(record_keeper.transactions))
+    account = edited.account
+    history = account.balance_history
+    assert [entry[2] for entry in history[1:]] == list(record_keeper.transactions)
+    account.update_balance()
+    assert account.balance_history == history
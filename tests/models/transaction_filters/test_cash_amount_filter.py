@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import Any
 
 import pytest
@@ -24,6 +25,7 @@ from tests.models.test_assets.composites import (
     currencies,
     everything_except,
     transactions,
+    valid_decimals,
 )
 from tests.models.test_assets.transaction_list import transaction_list
 
@@ -258,3 +260,25 @@ def test_filter_discard_premade_transactions_conversion_factor_not_found(
     filter_ = CashAmountFilter(minimum, maximum, mode)
     filtered = filter_.filter_transactions(transaction_list)
     assert filtered == tuple(transaction_list)
+
+
+@given(
+    units=st.lists(st.integers(min_value=-(10**6), max_value=10**6), max_size=20),
+    minimum=valid_decimals(min_value=0, max_value=1000),
+    delta=valid_decimals(min_value=0, max_value=1000),
+    currency=currencies(min_decimals=0, max_decimals=4),
+)
+def test_filter_minor_units(
+    units: list[int], minimum: Decimal, delta: Decimal, currency: Currency
+) -> None:
+    filter_ = CashAmountFilter(
+        CashAmount(minimum, currency),
+        CashAmount(minimum + delta, currency),
+        FilterMode.KEEP,
+    )
+    for unit in units:
+        amount = CashAmount.from_minor_units(unit, currency)
+        assert amount.minor_units is not None
+        assert filter_._is_in_range(amount) == (
+            minimum <= amount.value_normalized <= minimum + delta
+        )
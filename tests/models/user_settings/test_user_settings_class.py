@@ -281,6 +281,21 @@ def test_check_for_updates_on_startup_invalid_type(check: Any) -> None:
         settings.check_for_updates_on_startup = check
 
 
+@given(journal=st.sampled_from([True, False]))
+def test_journal_saves(journal: bool) -> None:
+    settings = UserSettings()
+    assert settings.journal_saves is False
+    settings.journal_saves = journal
+    assert settings.journal_saves == journal
+
+
+@given(journal=everything_except(bool))
+def test_journal_saves_invalid_type(journal: Any) -> None:
+    settings = UserSettings()
+    with pytest.raises(TypeError, match="bool"):
+        settings.journal_saves = journal
+
+
 @given(
     columns=st.lists(
         st.sampled_from(TransactionTableColumn),
@@ -369,6 +384,7 @@ locale_data_set = {
 @pytest.mark.parametrize("test_data", locale_data_set.items())
 def test_get_number_format_for_locale(test_data: tuple[str, NumberFormat]) -> None:
     import locale
+
     locale_name = test_data[0]
 
     # Try different locale name formats (Windows vs Linux)
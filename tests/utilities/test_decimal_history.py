@@ -0,0 +1,96 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from src.utilities.decimal_history import DecimalHistory
+
+
+@given(
+    data=st.dictionaries(
+        st.dates(),
+        st.decimals(allow_nan=False, allow_infinity=False, places=8),
+        max_size=20,
+    )
+)
+def test_matches_dict(data: dict[date, Decimal]) -> None:
+    history = DecimalHistory()
+    for date_, value in data.items():
+        assert history.set(date_, value) is None
+
+    assert len(history) == len(data)
+    assert list(history) == sorted(data)
+    assert dict(history.iter_pairs()) == data
+    for date_, value in data.items():
+        assert date_ in history
+        assert history[date_] == value
+
+
+def test_set_replaces_and_returns_previous() -> None:
+    history = DecimalHistory()
+    date_ = date(2024, 1, 1)
+    history.set(date_, Decimal("1.5"))
+    assert history.set(date_, Decimal("2.25")) == Decimal("1.5")
+    assert len(history) == 1
+    assert history[date_] == Decimal("2.25")
+
+
+def test_pop() -> None:
+    history = DecimalHistory()
+    date_ = date(2024, 1, 1)
+    history.set(date_, Decimal(3))
+    history.set(date_ - timedelta(days=1), Decimal(2))
+    assert history.pop(date_) == Decimal(3)
+    assert date_ not in history
+    assert history.date_at(-1) == date_ - timedelta(days=1)
+    with pytest.raises(KeyError):
+        history.pop(date_)
+
+
+def test_rescale_and_overflow() -> None:
+    history = DecimalHistory()
+    date_ = date(2024, 1, 1)
+    history.set(date_, Decimal(10) ** 15)
+    history.set(date_ - timedelta(days=1), Decimal("0.000000001"))
+    assert history[date_] == Decimal(10) ** 15
+    assert history.value_at(0) == Decimal("0.000000001")
+
+
+def test_bisect_right() -> None:
+    history = DecimalHistory()
+    date_ = date(2024, 1, 1)
+    history.set(date_, Decimal(1))
+    assert history.bisect_right(date_ - timedelta(days=1)) == 0
+    assert history.bisect_right(date_) == 1
+
+
+def test_latest_indexes() -> None:
+    history = DecimalHistory()
+    history.set(date(1900, 1, 1), Decimal(1))
+    history.set(date(2000, 1, 1), Decimal(2))
+    dates = [date(2020, 1, 1), date(1899, 12, 31), date(1900, 1, 1), date(1999, 1, 1)]
+    assert history.latest_indexes(dates) == [1, -1, 0, 0]
+    assert history.latest_indexes([]) == []
+
+def test_non_finite() -> None:
+    history = DecimalHistory()
+    with pytest.raises(ValueError, match="finite"):
+        history.set(date(2024, 1, 1), Decimal("NaN"))
+
+
+def test_values_keep_their_exponent() -> None:
+    history = DecimalHistory()
+    day = date(2024, 1, 1)
+    values = [Decimal("25.5000"), Decimal("25.50"), Decimal("2.5E+3"), Decimal("-1.5")]
+    for offset, value in enumerate(values):
+        history.set(day + timedelta(days=offset), value)
+    history.set(day - timedelta(days=1), Decimal("0.000000001"))
+
+    assert [value.as_tuple() for _, value in history.iter_pairs()] == [
+        value.as_tuple() for value in (Decimal("0.000000001"), *values)
+    ]
+    assert history[day].as_tuple() == Decimal("25.5000").as_tuple()
+    assert (
+        history.pop(day + timedelta(days=1)).as_tuple() == Decimal("25.50").as_tuple()
+    )
@@ -0,0 +1,29 @@
+from operator import attrgetter
+
+from src.models.model_objects.attributes import Category, CategoryType
+from src.utilities.lookup_index import LookupIndex
+
+
+def test_get() -> None:
+    root = Category("Root", CategoryType.INCOME)
+    child = Category("Child", CategoryType.INCOME, root)
+    categories = [root, child]
+    index = LookupIndex(lambda: categories, attrgetter("path"))
+
+    assert index.get("Root/Child") is child
+    assert index.get("Missing") is None
+
+    other = Category("Other", CategoryType.INCOME)
+    categories.append(other)
+    index.add(other)
+    assert index.get("Other") is other
+
+    # stale hits are detected, renamed keys need invalidation
+    root.name = "Renamed"
+    assert index.get("Root/Child") is None
+    index.invalidate()
+    assert index.get("Renamed/Child") is child
+
+    # removals are detected from the changed size of the collection
+    categories.remove(child)
+    assert index.get("Renamed/Child") is None